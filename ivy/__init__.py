@@ -583,6 +583,7 @@ array_significant_figures_stack = []
 array_decimal_values_stack = []
 warning_level_stack = []
 nan_policy_stack = []
+nan_check_interval_stack = []
 dynamic_backend_stack = []
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
@@ -744,6 +745,7 @@ from .data_classes.container import conversions as cont_conversions
 from .data_classes.container import (
     ContainerBase,
     Container,
+    ContainerLoader,
     add_ivy_container_instance_methods,
 )
 from .data_classes.nested_array import NestedArray
@@ -769,6 +771,9 @@ from ivy.utils.backend import (
     backend_stack,
     choose_random_backend,
     unset_backend,
+    clear_backend_namespaces,
+    add_backend_switch_hook,
+    remove_backend_switch_hook,
 )
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
@@ -947,12 +952,14 @@ globals_vars = GlobalsDict(
         "tmp_dir_stack": general.tmp_dir_stack,
         "precise_mode_stack": general.precise_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "fused_wrapper_mode_stack": general.fused_wrapper_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
         "default_int_dtype_stack": data_type.default_int_dtype_stack,
         "default_uint_dtype_stack": data_type.default_uint_dtype_stack,
         "nan_policy_stack": nan_policy_stack,
+        "nan_check_interval_stack": nan_check_interval_stack,
         "dynamic_backend_stack": dynamic_backend_stack,
     }
 )
@@ -1132,6 +1139,40 @@ def unset_nan_policy():
         ivy.__setattr__("nan_policy", warn_level, True)
 
 
+# nan check interval #
+ivy.nan_check_interval = nan_check_interval_stack[-1] if nan_check_interval_stack else 1
+
+
+def set_nan_check_interval(interval):
+    """Set the number of calls between nan checks of each function's inputs.
+
+    With an interval of ``n``, functions wrapped with ``handle_nans`` only check
+    their inputs for nans on every ``n``-th call, which keeps the overhead of the
+    ``nan_policy`` low when it is left enabled.
+
+    Parameters
+    ----------
+    interval
+        positive integer, the number of calls between nan checks
+    """
+    if not isinstance(interval, int) or interval < 1:
+        raise ivy.utils.exceptions.IvyException(
+            "nan_check_interval must be a positive integer"
+        )
+    global nan_check_interval_stack
+    nan_check_interval_stack.append(interval)
+    ivy.__setattr__("nan_check_interval", interval, True)
+
+
+def unset_nan_check_interval():
+    """Unset the currently set nan check interval."""
+    global nan_check_interval_stack
+    if nan_check_interval_stack:
+        nan_check_interval_stack.pop(-1)
+        interval = nan_check_interval_stack[-1] if nan_check_interval_stack else 1
+        ivy.__setattr__("nan_check_interval", interval, True)
+
+
 # Dynamic Backend
 
 
@@ -1410,8 +1451,10 @@ GLOBAL_PROPS = [
     "array_decimal_values",
     "warning_level",
     "nan_policy",
+    "nan_check_interval",
     "array_mode",
     "nestable_mode",
+    "fused_wrapper_mode",
     "inplace_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
@@ -6,4 +6,4 @@ from operator import mul
 
 # local
 from .wrapping import add_ivy_array_instance_methods
-from .array import Array
+from .array import Array, _get_live_arrays
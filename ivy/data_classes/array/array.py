@@ -2,6 +2,7 @@
 # global
 import copy
 import functools
+import weakref
 import numpy as np
 from operator import mul
 from typing import Optional
@@ -52,6 +53,14 @@ from .experimental import (
     _ArrayWithUtilityExperimental,
 )
 
+# weak references to the live ivy arrays, keyed by id, which lets dynamic backend
+# conversion and the per-device queries find them without scanning the whole heap
+_live_arrays = weakref.WeakValueDictionary()
+
+
+def _get_live_arrays():
+    return list(_live_arrays.values())
+
 
 class Array(
     _ArrayWithActivations,
@@ -136,6 +145,7 @@ class Array(
         _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
         self._view_attributes(data)
+        _live_arrays[id(self)] = self
 
     def _init(self, data, dynamic_backend=None):
         if ivy.is_ivy_array(data):
@@ -467,6 +477,7 @@ class Array(
         ivy.previous_backend()
 
         self.__dict__ = ivy_array.__dict__
+        _live_arrays[id(self)] = self
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -12,5 +12,6 @@ except ModuleNotFoundError:
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
+from .loader import ContainerLoader  # noqa
 
 colorama.init(strip=False)
@@ -9,6 +9,9 @@ import copy
 import termcolor
 import numpy as np
 import json
+import os
+import tempfile
+import weakref
 
 from ivy.utils.exceptions import IvyBackendException, IvyException
 
@@ -18,6 +21,12 @@ try:
     import h5py
 except ModuleNotFoundError:
     h5py = None
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    resource_tracker = None
+    SharedMemory = None
 import pickle
 import random
 from operator import mul
@@ -47,6 +56,415 @@ def _repr(x):
         return str(x)
 
 
+# file signature and data alignment of the memory-mapped container format
+_MMAP_MAGIC = b"IVYCONT1"
+_MMAP_ALIGNMENT = 64
+
+
+def _mmap_align(n):
+    return -(-n // _MMAP_ALIGNMENT) * _MMAP_ALIGNMENT
+
+
+def _mmap_structure(skeleton):
+    # the keys of a container skeleton as json, with null in place of each leaf, so
+    # that empty sub-containers and keys containing "/" are stored as they are
+    _, keys, children = skeleton
+    return [
+        [key, None if child is None else _mmap_structure(child)]
+        for key, child in zip(keys, children)
+    ]
+
+
+def _mmap_skeleton(structure, config):
+    return (
+        config,
+        tuple(key for key, _ in structure),
+        tuple(
+            None if child is None else _mmap_skeleton(child, config)
+            for _, child in structure
+        ),
+    )
+
+
+class _SharedMemoryLeaf:
+    # placeholder for an array leaf which is pickled through shared memory
+    def __init__(self, offset, dtype, shape):
+        self.offset = offset
+        self.dtype = dtype
+        self.shape = shape
+
+
+def _cont_to_shared_memory(cont):
+    # copy the array leaves into one shared memory segment, and return the
+    # arguments from which _cont_from_shared_memory rebuilds the container
+    leaves, idx, _ = cont.cont_flatten()
+    arrays = {}
+    size = 0
+    for value, kc in zip(leaves, idx):
+        if ivy.is_array(value):
+            value = np.asarray(cont._cont_ivy.to_numpy(value), order="C")
+            arrays[kc] = (size, value)
+            size = _mmap_align(size + value.nbytes)
+    shm = SharedMemory(create=True, size=max(size, 1))
+    for offset, value in arrays.values():
+        np.ndarray(value.shape, value.dtype, buffer=shm.buf, offset=offset)[...] = value
+    # the segment stays registered with the resource tracker until a receiver
+    # takes ownership of it by unlinking it, so that the tracker frees the segments
+    # of pickles which are never unpickled
+    shm.close()
+    placeholders = cont.cont_map(
+        lambda x, kc: (
+            _SharedMemoryLeaf(arrays[kc][0], arrays[kc][1].dtype, arrays[kc][1].shape)
+            if kc in arrays
+            else x
+        )
+    )
+    return shm.name, placeholders
+
+
+def _cont_from_shared_memory(name, placeholders):
+    try:
+        shm = SharedMemory(name=name)
+    except FileNotFoundError:
+        raise ivy.utils.exceptions.IvyException(
+            "the shared memory of this container has already been received, a "
+            "container pickled through shared memory can only be unpickled once"
+        ) from None
+    # unlinking also unregisters the segment from the resource tracker, after
+    # which it is freed once no process has it mapped, which for the receiver is
+    # once all of the arrays viewing it have been garbage collected
+    shm.unlink()
+    buffer = np.ndarray((shm.size,), np.uint8, buffer=shm.buf)
+    weakref.finalize(buffer, shm.close)
+    ret = placeholders.cont_map(
+        lambda x, _: (
+            ivy.asarray(
+                buffer[x.offset : x.offset + x.dtype.itemsize * int(np.prod(x.shape))]
+                .view(x.dtype)
+                .reshape(x.shape)
+            )
+            if isinstance(x, _SharedMemoryLeaf)
+            else x
+        )
+    )
+    return ret
+
+
+# group holding the row orders of datasets shuffled with shuffle_h5_file(index_only)
+_H5_SHUFFLE_INDEX = "__ivy_shuffle_index__"
+
+
+def _is_h5_shuffle_index(h5_obj):
+    return h5_obj.name == "/" + _H5_SHUFFLE_INDEX
+
+
+def _h5_shuffle_index(dataset):
+    # the order in which the rows of the dataset are read, if it has been shuffled
+    # in index-only mode
+    index_path = _H5_SHUFFLE_INDEX + dataset.name
+    if index_path not in dataset.file:
+        return None
+    index = dataset.file[index_path][()]
+    # rows appended to the dataset after it was shuffled are read in order
+    return np.concatenate([index, np.arange(len(index), dataset.shape[0])])
+
+
+def _h5_external_shuffle(dataset, perm, max_block_bytes):
+    # reorder the rows of the dataset on disk as dataset[perm], such that row
+    # perm[i] is moved to row i, holding at most one block of rows in memory at a
+    # time
+    num_rows = dataset.shape[0]
+    row_bytes = dataset.dtype.itemsize * _reduce(mul, dataset.shape[1:], 1)
+    block_rows = max(max_block_bytes // max(row_bytes, 1), 1)
+    if num_rows <= block_rows:
+        dataset[...] = dataset[()][perm]
+        return
+    num_blocks = -(-num_rows // block_rows)
+    inv_perm = np.empty_like(perm)
+    inv_perm[perm] = np.arange(num_rows)
+    dest_blocks = inv_perm // block_rows
+    with tempfile.TemporaryDirectory(
+        dir=os.path.dirname(os.path.abspath(dataset.file.filename))
+    ) as tmp_dir, h5py.File(os.path.join(tmp_dir, "shuffle.hdf5"), "w") as tmp_file:
+        # bucket i holds the rows which are moved to block i, and is stored where
+        # block i is, so that each pass only reads and writes contiguous blocks
+        buckets = tmp_file.create_dataset("buckets", dataset.shape, dtype=dataset.dtype)
+        fill = np.arange(num_blocks) * block_rows
+        for start in range(0, num_rows, block_rows):
+            rows = dataset[start : start + block_rows]
+            blocks = dest_blocks[start : start + block_rows]
+            order = np.argsort(blocks, kind="stable")
+            counts = np.bincount(blocks, minlength=num_blocks)
+            offset = 0
+            for block in np.flatnonzero(counts):
+                count = counts[block]
+                buckets[fill[block] : fill[block] + count] = rows[
+                    order[offset : offset + count]
+                ]
+                fill[block] += count
+                offset += count
+        # the rows in each bucket are in the order of their source rows
+        for start in range(0, num_rows, block_rows):
+            sources = np.sort(perm[start : start + block_rows])
+            rows = buckets[start : start + len(sources)]
+            block = np.empty_like(rows)
+            block[inv_perm[sources] - start] = rows
+            dataset[start : start + len(sources)] = block
+
+
+# the lazy hdf5 leaves which have not been loaded yet, so that containers only look
+# for them in their items while there are any
+_lazy_h5_leaves = weakref.WeakSet()
+
+
+class _LazyH5Leaf:
+    # a slice of an h5py dataset, which is only read from disk once it is accessed
+    def __init__(self, dataset, slice_obj, ivyh):
+        self._dataset = dataset
+        self._slice_obj = slice_obj
+        self._ivyh = ivyh
+        _lazy_h5_leaves.add(self)
+
+    def _read(self):
+        index = _h5_shuffle_index(self._dataset)
+        if index is None:
+            return self._dataset[self._slice_obj]
+        # the leading index selects rows through the shuffle index, and the rest
+        # index the rows once they are read
+        key = (
+            self._slice_obj
+            if isinstance(self._slice_obj, tuple)
+            else (self._slice_obj,)
+        )
+        if not key or key[0] is Ellipsis:
+            # the rows are not indexed on their own, so read them all
+            return self._read_rows(index)[key]
+        rows = np.asarray(index[key[0]])
+        return self._read_rows(rows)[(slice(None),) * rows.ndim + key[1:]]
+
+    def _read_rows(self, rows):
+        # h5py reads rows by index in increasing order only
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        if unique_rows.size:
+            value = self._dataset[unique_rows]
+        else:
+            value = self._dataset[:0]
+        return value[inverse.reshape(-1)].reshape(rows.shape + value.shape[1:])
+
+    def load(self):
+        value = self._read()
+        return ivy.default(self._ivyh, ivy).array(value, dtype=str(value.dtype))
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._read(), dtype=dtype)
+
+    def __repr__(self):
+        return (
+            f"<lazy h5py dataset {self._dataset.name}, shape {self._dataset.shape}, "
+            f"dtype {self._dataset.dtype}>"
+        )
+
+
+# placeholder for leaves which are pruned when rebuilding a container from a skeleton
+_PRUNED = object()
+
+
+def _found_in_key_chains(this_key_chain, key_chains):
+    if key_chains is None:
+        return False
+    for key_chain in key_chains:
+        if this_key_chain.startswith(key_chain):
+            return True
+    return False
+
+
+def _cont_from_skeleton(skeleton, leaves, prune_empty=False, config=None):
+    # rebuild the nested containers described by the skeleton, consuming the leaves
+    # in order, without re-running the container constructor at every level
+    leaves = iter(leaves)
+    dict_types = tuple([dict] + ivy.container_types())
+    templates = {}
+    # whether leaves of each type need to be nested as containers, per template
+    to_nest = {}
+
+    def _build(node):
+        node_config, keys, children = node
+        node_config = node_config if config is None else config
+        template_key = tuple((k, id(v)) for k, v in node_config.items())
+        template = templates.get(template_key)
+        if template is None:
+            template = ivy.Container(None, **node_config).__dict__
+            templates[template_key] = template
+        items = []
+        for key, child in zip(keys, children):
+            if child is None:
+                value = next(leaves)
+                if value is _PRUNED:
+                    continue
+                value_type = type(value)
+                nest = to_nest.get((template_key, value_type))
+                if nest is None:
+                    nest = (
+                        issubclass(value_type, dict_types)
+                        and (
+                            not issubclass(value_type, ivy.Container)
+                            or template["_rebuild_child_containers"]
+                        )
+                    ) or issubclass(value_type, template["_types_to_iteratively_nest"])
+                    to_nest[(template_key, value_type)] = nest
+                if nest:
+                    value = ivy.Container(value, **node_config)
+            else:
+                value = _build(child)
+                if prune_empty and not value:
+                    continue
+            items.append((key, value))
+        if template["_alphabetical_keys"]:
+            items.sort(key=lambda item: item[0])
+        cont = ivy.Container.__new__(ivy.Container)
+        cont.__dict__.update(template)
+        cont._config_in = dict(template["_config_in"])
+        cont._config = dict(template["_config"])
+        dict.update(cont, items)
+        return cont
+
+    return _build(skeleton)
+
+
+def _cont_gather_leaves(containers, device=None):
+    # gather the leaves of all containers at each key-chain of the first container,
+    # moving the arrays which are not on the device yet, so that each output leaf
+    # can be built with one operation over all of the containers
+    flat = [cont.cont_flatten() for cont in containers]
+    _, idx0, skeleton0 = flat[0]
+    gathered = []
+    for kc in idx0:
+        values = []
+        for leaves, idx, _ in flat:
+            value = leaves[idx[kc]]
+            if device is not None and ivy.is_array(value) and ivy.dev(value) != device:
+                value = ivy.to_device(value, device)
+            values.append(value)
+        gathered.append(values)
+    return gathered, skeleton0
+
+
+def _tree_sum(values):
+    # sum pairwise, halving the number of partial sums at each level, which keeps
+    # the rounding error growing with log(n) rather than n
+    while len(values) > 1:
+        summed = [x + y for x, y in zip(values[::2], values[1::2])]
+        if len(values) % 2:
+            summed.append(values[-1])
+        values = summed
+    return values[0]
+
+
+def _skeleton_key_chains(skeleton, key_chain=""):
+    # the key-chains of all of the sub-containers described by the skeleton
+    _, keys, children = skeleton
+    for key, child in zip(keys, children):
+        if child is not None:
+            kc = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
+            yield kc
+            yield from _skeleton_key_chains(child, kc)
+
+
+def _cont_signatures_comparable(containers):
+    # callable leaves are built when compared, so containers which build them
+    # cannot be compared through their cached structural signatures
+    return all(
+        isinstance(cont, ivy.Container) and not cont.cont_config["build_callable"]
+        for cont in containers
+    )
+
+
+def _cont_identical_signatures(containers, check_types, check_shapes):
+    # the hashes are compared first, so that differing structures are detected
+    # without comparing the signatures element by element
+    signatures = [
+        cont._cont_structure_signature(check_types, check_shapes) for cont in containers
+    ]
+    hash0, signature0 = signatures[0]
+    return all(h == hash0 and s == signature0 for h, s in signatures[1:])
+
+
+def _cont_leaves_aligned(containers):
+    # whether the flattened leaves of the containers line up one to one, in the
+    # same order and with the same dtype and device for each array
+    def _leaf_specs(cont):
+        leaves, idx, _ = cont.cont_flatten()
+        return list(idx), [
+            (ivy.dtype(x), ivy.dev(x)) if ivy.is_array(x) else None for x in leaves
+        ]
+
+    specs0 = _leaf_specs(containers[0])
+    return all(_leaf_specs(cont) == specs0 for cont in containers[1:])
+
+
+def _cont_diff_leaf(values, equal_mat, mode, diff_keys, config):
+    # diff the leaves at the same key-chain, given the boolean matrix of which
+    # of them are equal to each other
+    if equal_mat.all():
+        if mode == "diff_only":
+            return ivy.Container(**config)
+        return values[0]
+    elif mode == "same_only":
+        return ivy.Container(**config)
+    diff_dict = {}
+    idxs_added = []
+    for idx in range(len(values)):
+        if idx not in idxs_added:
+            idxs_to_add_list = np.argwhere(equal_mat[idx]).reshape(-1).tolist()
+            if isinstance(diff_keys, str):
+                key = f"{diff_keys}_{str(idxs_to_add_list)[1:-1]}"
+            elif isinstance(diff_keys, (list, tuple)):
+                key = diff_keys[idx]
+            else:
+                raise ivy.utils.exceptions.IvyException(
+                    "diff_keys must be either a string or list of strings,"
+                    f" but found {diff_keys} of type {type(diff_keys)}"
+                )
+            diff_dict[key] = values[idx]
+            idxs_added += idxs_to_add_list
+    return ivy.Container(diff_dict, **config)
+
+
+def _cont_equality_matrices(flat):
+    # the matrices of which leaves are equal to each other at each key-chain, for
+    # the flattened leaves of identically structured containers, comparing the
+    # arrays of each dtype and device with one op per pair of containers
+    num_leaves = len(flat[0])
+    num_conts = len(flat)
+    mats = np.ones((num_leaves, num_conts, num_conts), dtype=bool)
+    groups = {}
+    for i, x in enumerate(flat[0]):
+        if ivy.is_array(x):
+            groups.setdefault((ivy.dtype(x), ivy.dev(x)), []).append(i)
+        else:
+            equal_mat = ivy.all_equal(*[lv[i] for lv in flat], equality_matrix=True)
+            mats[i] = np.asarray(ivy.to_numpy(equal_mat), dtype=bool)
+    for (_, device), group in groups.items():
+        sizes = [_reduce(mul, flat[0][i].shape, 1) for i in group]
+        segment_ids = ivy.array(
+            np.repeat(np.arange(len(group)), sizes), dtype="int64", device=device
+        )
+        buffers = [
+            ivy.concat([ivy.reshape(lv[i], (-1,)) for i in group]) for lv in flat
+        ]
+        for a in range(num_conts):
+            for b in range(a + 1, num_conts):
+                num_diffs = ivy.unsorted_segment_sum(
+                    ivy.astype(ivy.not_equal(buffers[a], buffers[b]), "int64"),
+                    segment_ids,
+                    len(group),
+                )
+                equal = ivy.to_numpy(num_diffs) == 0
+                mats[group, a, b] = equal
+                mats[group, b, a] = equal
+    return mats
+
+
 # noinspection PyMissingConstructor
 
 
@@ -58,6 +476,7 @@ class ContainerBase(dict, abc.ABC):
         queue_load_sizes=None,
         container_combine_method="list_join",
         queue_timeout=None,
+        queue_cache_size=None,
         print_limit=10,
         key_length_limit=None,
         print_indent=4,
@@ -91,6 +510,11 @@ class ContainerBase(dict, abc.ABC):
         queue_timeout
             The timeout when waiting for containers to arrive from the queues.
             Default is global.
+        queue_cache_size
+            The maximum number of containers arriving from the queues to keep loaded.
+            Once exceeded, the earliest loaded containers are evicted, and can no
+            longer be accessed. Default is ``None``, in which case all containers
+            are kept.
         print_limit
             The total array size limit when printing the container. Default is 10.
         key_length_limit
@@ -131,11 +555,13 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(self._container_combine_method, str):
                 self._container_combine_method = {
                     "list_join": self.cont_list_join,
-                    "concat": lambda conts: self.concat(conts, 0),
+                    "concat": lambda conts: self._static_concat(conts, axis=0),
                 }[self._container_combine_method]
             self._loaded_containers_from_queues = {}
+            self._evicted_queue_idxs = set()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.queue_timeout)
+            self._queue_cache_size = queue_cache_size
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
@@ -313,13 +739,12 @@ class ContainerBase(dict, abc.ABC):
             )
 
         if isinstance(container0, ivy.Container):
-            return_dict = {}
-            for key in container0.keys():
-                new_list = []
-                for container in containers:
-                    new_list.append(container[key])
-                return_dict[key] = ivy.Container.cont_list_join(new_list, config)
-            return ivy.Container(return_dict, **config)
+            leaves, skeleton = _cont_gather_leaves(containers)
+            return _cont_from_skeleton(
+                skeleton,
+                [[item for sublist in values for item in sublist] for values in leaves],
+                config=config,
+            )
         else:
             return [item for sublist in containers for item in sublist]
 
@@ -347,31 +772,30 @@ class ContainerBase(dict, abc.ABC):
             )
 
         if isinstance(container0, ivy.Container):
-            return_dict = {}
-            for key in container0.keys():
-                return_dict[key] = ivy.Container.cont_list_stack(
-                    [container[key] for container in containers], dim, config
-                )
-            return ivy.Container(return_dict, **config)
+            leaves, skeleton = _cont_gather_leaves(containers)
+            return _cont_from_skeleton(skeleton, leaves, config=config)
         else:
             return containers
 
     @staticmethod
     def _cont_concat_unify(containers, device, axis=0):
-        return ivy.concat(
-            [cont.to_device(device) for cont in containers.values()], axis=axis
+        leaves, skeleton = _cont_gather_leaves(list(containers.values()), device)
+        return _cont_from_skeleton(
+            skeleton, [ivy.concat(values, axis=axis) for values in leaves]
         )
 
     @staticmethod
     def _cont_sum_unify(containers, device, _=None, _1=None):
-        return sum(
-            (cont.to_device(device) for cont in containers.values()),
-            start=ivy.zeros([]),
-        )
+        leaves, skeleton = _cont_gather_leaves(list(containers.values()), device)
+        return _cont_from_skeleton(skeleton, [_tree_sum(values) for values in leaves])
 
     @staticmethod
     def _cont_mean_unify(containers, device, _=None, _1=None):
-        return ivy.Container._cont_sum_unify(containers, device) / len(containers)
+        leaves, skeleton = _cont_gather_leaves(list(containers.values()), device)
+        num_containers = len(containers)
+        return _cont_from_skeleton(
+            skeleton, [_tree_sum(values) / num_containers for values in leaves]
+        )
 
     @staticmethod
     def cont_unify(containers, device, mode, axis=0):
@@ -459,6 +883,7 @@ class ContainerBase(dict, abc.ABC):
         detect_value_diffs=True,
         detect_shape_diffs=True,
         config=None,
+        vectorized=False,
     ):
         """Compare keys and values in a sequence of containers, returning the
         single shared values where they are the same, and new nested sub-dicts
@@ -487,6 +912,10 @@ class ContainerBase(dict, abc.ABC):
             Default is ``True``.
         config
             The configuration for the containers. Default is the same as container0.
+        vectorized
+            Whether to compare the array values of identically structured containers
+            with one op per dtype and device for each pair of containers, rather than
+            with one op per array for each pair of containers. Default is ``False``.
         *containers
 
 
@@ -513,36 +942,40 @@ class ContainerBase(dict, abc.ABC):
                     equality_matrix=True,
                 )
                 equal_mat = ivy.logical_and(equal_mat, shape_equal_mat)
-            # noinspection PyTypeChecker
-            if ivy.min(ivy.astype(equal_mat, "int32")) == 1:
+            return _cont_diff_leaf(
+                containers,
+                np.asarray(ivy.to_numpy(equal_mat), dtype=bool),
+                mode,
+                diff_keys,
+                config,
+            )
+
+        # identically structured containers are diffed over their flattened leaves
+        if _cont_signatures_comparable(containers):
+            leaves0, _, skeleton0 = container0.cont_flatten()
+            if not detect_value_diffs and _cont_identical_signatures(
+                containers, False, detect_shape_diffs
+            ):
                 if mode == "diff_only":
                     return ivy.Container(**config)
-                return container0
-            elif mode == "same_only":
-                return ivy.Container(**config)
-            else:
-                cont_range = range(num_containers)
-                diff_dict = {}
-                cont_dict = dict(zip(cont_range, containers))
-                idxs_added = []
-                for idx in cont_range:
-                    if idx not in idxs_added:
-                        idxs_to_add = ivy.argwhere(equal_mat[idx])
-                        idxs_to_add_list = sorted(
-                            ivy.to_numpy(idxs_to_add).reshape(-1).tolist()
-                        )
-                        if isinstance(diff_keys, str):
-                            key = f"{diff_keys}_{str(idxs_to_add_list)[1:-1]}"
-                        elif isinstance(diff_keys, (list, tuple)):
-                            key = diff_keys[idx]
-                        else:
-                            raise ivy.utils.exceptions.IvyException(
-                                "diff_keys must be either a string or list of strings,"
-                                f" but found {diff_keys} of type {type(diff_keys)}"
-                            )
-                        diff_dict[key] = cont_dict[idx]
-                        idxs_added += idxs_to_add_list
-                return ivy.Container(diff_dict, **config)
+                return _cont_from_skeleton(
+                    skeleton0, leaves0, prune_empty=True, config=config
+                )
+            if (
+                vectorized
+                and _cont_identical_signatures(containers, True, True)
+                and _cont_leaves_aligned(containers)
+            ):
+                flat = [cont.cont_flatten()[0] for cont in containers]
+                new_leaves = []
+                for values, equal_mat in zip(zip(*flat), _cont_equality_matrices(flat)):
+                    ret = _cont_diff_leaf(values, equal_mat, mode, diff_keys, config)
+                    new_leaves.append(
+                        _PRUNED if isinstance(ret, dict) and not ret else ret
+                    )
+                return _cont_from_skeleton(
+                    skeleton0, new_leaves, prune_empty=True, config=config
+                )
 
         # otherwise, check that the keys are aligned between each container, and apply
         # this method recursively
@@ -572,6 +1005,7 @@ class ContainerBase(dict, abc.ABC):
                     detect_value_diffs=detect_value_diffs,
                     detect_shape_diffs=detect_shape_diffs,
                     config=config,
+                    vectorized=vectorized,
                 )
                 if not isinstance(res, dict) or res:
                     return_dict[key] = res
@@ -705,6 +1139,22 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if all(isinstance(cont, ivy.Container) for cont in containers):
+            flat = [cont.cont_flatten() for cont in containers]
+            idx0 = flat[0][1]
+            if all(idx.keys() == idx0.keys() for _, idx, _ in flat[1:]):
+                # the containers share the same leaves, so they can be mapped as
+                # flat lists of leaves
+                return ivy.Container._cont_multi_map_flat(
+                    func,
+                    flat,
+                    key_chains,
+                    to_apply,
+                    prune_unapplied,
+                    key_chain,
+                    config,
+                    map_nests,
+                )
         return_dict = {}
 
         for key in keys:
@@ -719,14 +1169,6 @@ class ContainerBase(dict, abc.ABC):
                 this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
                 is_container = [ivy.is_ivy_container(x) for x in values]
 
-                def _found_in_key_chains(this_key_chain, key_chains):
-                    if key_chains is None:
-                        return False
-                    for key_chain in key_chains:
-                        if this_key_chain.startswith(key_chain):
-                            return True
-                    return False
-
                 if not assert_identical and not all(is_container) and any(is_container):
                     found = _found_in_key_chains(this_key_chain, key_chains)
                     if key_chains is not None:
@@ -775,6 +1217,41 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_multi_map_flat(
+        func,
+        flat,
+        key_chains,
+        to_apply,
+        prune_unapplied,
+        key_chain,
+        config,
+        map_nests,
+    ):
+        idx0, skeleton0 = flat[0][1:]
+        new_leaves = []
+        for kc in idx0:
+            values = [leaves[idx[kc]] for leaves, idx, _ in flat]
+            this_key_chain = kc if key_chain == "" else f"{key_chain}/{kc}"
+            if map_nests and any(isinstance(x, (list, tuple)) for x in values):
+                ret = ivy.nested_multi_map(
+                    lambda x, _: func(x, None), values, to_ivy=False
+                )
+                if prune_unapplied and not ret:
+                    ret = _PRUNED
+            else:
+                found = _found_in_key_chains(this_key_chain, key_chains)
+                if key_chains is not None and (
+                    (found and not to_apply) or (not found and to_apply)
+                ):
+                    ret = _PRUNED if prune_unapplied else values[0]
+                else:
+                    ret = func(values, this_key_chain)
+            new_leaves.append(ret)
+        return _cont_from_skeleton(
+            skeleton0, new_leaves, prune_empty=True, config=config
+        )
+
     @staticmethod
     def cont_common_key_chains(containers):
         """Return the key-chains common across all containers.
@@ -841,6 +1318,26 @@ class ContainerBase(dict, abc.ABC):
         -------
         Boolean
         """
+        if (
+            not partial
+            and not assert_and_assign
+            and _cont_signatures_comparable(containers)
+        ):
+            # compare the cached structural signatures, and then only the arrays
+            if not _cont_identical_signatures(containers, check_types, check_shapes):
+                return False
+            if not same_arrays and not arrays_equal:
+                return True
+            for values in zip(*[cont.cont_flatten()[0] for cont in containers]):
+                value_0 = values[0]
+                if not ivy.is_array(value_0):
+                    continue
+                if same_arrays:
+                    if not all(val is value_0 for val in values):
+                        return False
+                elif not ivy.all_equal(*values):
+                    return False
+            return True
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -1097,6 +1594,9 @@ class ContainerBase(dict, abc.ABC):
         -------
             Boolean
         """
+        if _cont_signatures_comparable(containers):
+            shapes = [cont._cont_size_ordered_shapes(exclusive) for cont in containers]
+            return all(shapes_n == shapes[0] for shapes_n in shapes[1:])
         array_conts = [cont.cont_size_ordered_arrays(exclusive) for cont in containers]
         array_cont0 = array_conts[0]
         array_cont0_len = len(array_cont0)
@@ -1118,12 +1618,18 @@ class ContainerBase(dict, abc.ABC):
             return ivy.Container.cont_from_disk_as_pickled(filepath)
         elif format == "h5py":
             return ivy.Container.cont_from_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            return ivy.Container.cont_from_disk_as_mmap(filepath)
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified
         hdf5 filepath.
@@ -1140,6 +1646,11 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading each dataset from disk until its leaf is first
+            accessed, by key, attribute, key-chain or iteration, or the container is
+            mapped. The h5 file is kept open until :meth:`cont_close` is called, or
+            the container is used as a context manager. Default is ``False``.
 
         Returns
         -------
@@ -1159,19 +1670,28 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5_obj_or_filepath
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
+            if _is_h5_shuffle_index(value):
+                continue
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    lazy=lazy,
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                leaf = _LazyH5Leaf(value, slice_obj, ivyh)
+                container_dict[key] = leaf if lazy else leaf.load()
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        if not lazy and isinstance(h5_obj_or_filepath, str):
+            h5_obj.close()
+        return ivy.Container(
+            container_dict, ivyh=ivyh, alphabetical_keys=alphabetical_keys
+        )
 
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1216,6 +1736,71 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_mmap(filepath, ivyh=None, return_metadata=False):
+        """Load container object from disk, as a memory-mapped file written by
+        ``cont_to_disk_as_mmap``.
+
+        The file is memory-mapped copy-on-write, and the arrays are views of the
+        mapping wherever the backend can share host memory, so nothing is read
+        from disk until it is used, and processes loading the same file share
+        its pages.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        return_metadata
+            Whether to also return the metadata bytes saved with the container.
+            Default is ``False``.
+
+        Returns
+        -------
+            Container loaded from disk, and the metadata if ``return_metadata``.
+        """
+        ivyh = ivy.default(ivyh, ivy)
+        with open(filepath, "rb") as f:
+            magic = f.read(len(_MMAP_MAGIC))
+            if magic != _MMAP_MAGIC:
+                raise ivy.utils.exceptions.IvyException(
+                    f"{filepath} is not a memory-mapped container file."
+                )
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size).decode("utf-8"))
+        data_start = _mmap_align(len(_MMAP_MAGIC) + 8 + header_size)
+        data = np.memmap(filepath, dtype=np.uint8, mode="c")
+        # backends which can wrap the mapped memory without copying it
+        share_memory = ivyh.current_backend_str() in ("jax", "torch")
+        leaves = []
+        for leaf in header["leaves"]:
+            if "value" in leaf:
+                value = leaf["value"]
+            else:
+                start = data_start + leaf["offset"]
+                value = np.asarray(
+                    data[start : start + leaf["nbytes"]]
+                    .view(leaf["dtype"])
+                    .reshape(leaf["shape"])
+                )
+                if share_memory:
+                    try:
+                        value = ivyh.from_dlpack(value)
+                    except (BufferError, RuntimeError, TypeError):
+                        value = ivyh.asarray(value)
+                else:
+                    value = ivyh.asarray(value)
+            leaves.append(value)
+        config = ivy.Container(ivyh=None if ivyh is ivy else ivyh)._config
+        ret = _cont_from_skeleton(_mmap_skeleton(header["structure"], config), leaves)
+        if return_metadata:
+            metadata = header["metadata"]
+            start = data_start + metadata["offset"]
+            return ret, data[start : start + metadata["nbytes"]].tobytes()
+        return ret
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """Get file size of h5 file contents.
@@ -1244,6 +1829,8 @@ class ContainerBase(dict, abc.ABC):
         size = 0
         batch_size = 0
         for key, value in h5_obj.items():
+            if _is_h5_shuffle_index(value):
+                continue
             if isinstance(value, h5py.Group):
                 size_to_add, batch_size = ivy.Container.h5_file_size(value)
                 size += size_to_add
@@ -1258,16 +1845,29 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath, seed_value=0, index_only=False, max_block_bytes=2**28
+    ):
         """Shuffle entries in all datasets of h5 file, such that they are still
         aligned along axis 0.
 
+        The same permutation is applied to every dataset with the same number of
+        entries. The datasets are reordered on disk block by block, so only
+        ``max_block_bytes`` of each dataset is held in memory at a time.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        index_only
+            Whether to only store the permutation in the file, leaving the data
+            in place. The permutation is then applied whenever the datasets are
+            loaded with ``cont_from_disk_as_hdf5``. (Default value = False)
+        max_block_bytes
+            Maximum number of bytes of a dataset to hold in memory at a time when
+            reordering it on disk. (Default value = 2**28)
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -1283,17 +1883,48 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
+        datasets = []
+
+        def _find_datasets(group):
+            for value in group.values():
+                if _is_h5_shuffle_index(value):
+                    continue
+                if isinstance(value, h5py.Group):
+                    _find_datasets(value)
+                elif isinstance(value, h5py.Dataset):
+                    if value.shape:
+                        datasets.append(value)
+                else:
+                    raise ivy.utils.exceptions.IvyException(
+                        "Item found inside h5_obj which was neither a Group nor a "
+                        "Dataset."
+                    )
+
+        _find_datasets(h5_obj)
+        perms = {}
+        for dataset in datasets:
+            num_rows = dataset.shape[0]
+            if num_rows not in perms:
+                perm = list(range(num_rows))
+                random.Random(seed_value).shuffle(perm)
+                perms[num_rows] = np.array(perm, dtype=np.int64)
+            perm = perms[num_rows]
+            index_path = _H5_SHUFFLE_INDEX + dataset.name
+            index = _h5_shuffle_index(dataset)
+            if index is not None:
+                # shuffle the order in which the rows are currently read
+                perm = index[perm]
+                del dataset.file[index_path]
+            if index_only:
+                dataset.file.create_dataset(index_path, data=perm)
             else:
-                raise ivy.utils.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
-                )
+                _h5_external_shuffle(dataset, perm, max_block_bytes)
+        # remove the index group once none of the datasets are read through it
+        index_group = h5_obj.file.get(_H5_SHUFFLE_INDEX)
+        if index_group is not None and not index_group.visititems(
+            lambda _, obj: isinstance(obj, h5py.Dataset) or None
+        ):
+            del h5_obj.file[_H5_SHUFFLE_INDEX]
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1601,6 +2232,7 @@ class ContainerBase(dict, abc.ABC):
         return duplciates
 
     def cont_update_config(self, **config):
+        self._cont_invalidate_flat()
         new_config = {}
         for k, v in config.items():
             att_name = f"_{k}"
@@ -1975,11 +2607,20 @@ class ContainerBase(dict, abc.ABC):
             self.cont_to_disk_as_pickled(filepath)
         elif format == "h5py":
             self.cont_to_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            self.cont_to_disk_as_mmap(filepath)
         else:
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
     ):
         """Save container object to disk, as an h5py file, at the specified
         filepath.
@@ -1997,6 +2638,15 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape for newly created datasets, or ``True`` for h5py to choose
+            one. Default is ``None``, in which case h5py chooses the chunk shape.
+        compression
+            Compression filter for newly created datasets, such as ``"gzip"`` or
+            ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            Options for the compression filter, such as the gzip level.
+            Default is ``None``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2016,7 +2666,13 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
                 value_as_np = self._cont_ivy.to_numpy(value)
@@ -2031,14 +2687,76 @@ class ContainerBase(dict, abc.ABC):
                     dataset_shape = [max_bs] + list(value_shape[1:])
                     maxshape = [None for _ in dataset_shape]
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
                 space_left = max_bs - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
+                if amount_to_write > 0:
+                    h5_obj[key][starting_index : starting_index + amount_to_write] = (
+                        value_as_np[:amount_to_write]
                     )
+        if isinstance(h5_obj_or_filepath, str):
+            h5_obj.close()
+
+    def cont_share_memory(self, share=True):
+        """Set whether the container is pickled through shared memory, for
+        sending it to other processes, such as through multiprocessing queues.
+
+        When set, pickling the container copies all of its array leaves into one
+        shared memory segment, and only the name of the segment and the dtype,
+        shape and offset of each leaf are pickled. The unpickled arrays are views
+        of the segment wherever the backend can share host memory.
+
+        Each pickle has a single consumer, which takes ownership of the segment:
+        the segment is unlinked when the container is unpickled, and freed once
+        the arrays which view it have been garbage collected. On posix systems,
+        unpickling the same pickle again, in this or any other process, raises an
+        error, so the pickle must not be sent to several receivers. Segments of
+        pickles which are never unpickled are freed by the resource tracker once
+        the processes sharing it have exited, which includes the processes started
+        after calling this method. Unpickled containers are pickled as usual,
+        unless this method is called on them.
+
+        Parameters
+        ----------
+        share
+            Whether to pickle the container through shared memory.
+            Default is ``True``.
+
+        Returns
+        -------
+        ret
+            The container itself.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3, 4]))
+        >>> y = pickle.loads(pickle.dumps(x.cont_share_memory()))
+        >>> print(y)
+        {
+            a: ivy.array([1., 2.]),
+            b: ivy.array([3, 4])
+        }
+        """
+        ivy.utils.assertions.check_exists(
+            SharedMemory,
+            message=(
+                "multiprocessing.shared_memory is required in order to pickle "
+                "containers through shared memory."
+            ),
+        )
+        if share and os.name == "posix":
+            # processes started from now on share the resource tracker of this
+            # process, which sees both the creation and the unlinking of segments
+            resource_tracker.ensure_running()
+        self._cont_shared_memory = share
+        return self
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified
@@ -2082,6 +2800,65 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_disk_as_mmap(self, filepath, metadata=None):
+        """Save container object to disk as a single flat binary file, which can
+        be memory-mapped by ``cont_from_disk_as_mmap``.
+
+        The file starts with a header of the nested keys of the container, and the
+        dtype, shape and offset of each array, followed by the raw array data,
+        aligned for zero-copy loading.
+        Leaves which aren't arrays are stored in the header, and must be json-able.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        metadata
+            Optional bytes to store alongside the container. Default is ``None``.
+        """
+        leaves, idx, skeleton = self.cont_flatten()
+        header_leaves = []
+        arrays = []
+        offset = 0
+        for value, kc in zip(leaves, idx):
+            if ivy.is_array(value):
+                value = np.asarray(self._cont_ivy.to_numpy(value), order="C")
+                header_leaves.append(
+                    {
+                        "dtype": str(value.dtype),
+                        "shape": list(value.shape),
+                        "offset": offset,
+                        "nbytes": value.nbytes,
+                    }
+                )
+                arrays.append((offset, value))
+                offset = _mmap_align(offset + value.nbytes)
+            elif _is_jsonable(value):
+                header_leaves.append({"value": value})
+            else:
+                raise ivy.utils.exceptions.IvyException(
+                    f"leaf {kc} of type {type(value)} is neither an array nor "
+                    "json-able, and cannot be saved as a memory-mapped container."
+                )
+        metadata = b"" if metadata is None else bytes(metadata)
+        header = json.dumps(
+            {
+                "structure": _mmap_structure(skeleton),
+                "leaves": header_leaves,
+                "metadata": {"offset": offset, "nbytes": len(metadata)},
+            }
+        ).encode("utf-8")
+        data_start = _mmap_align(len(_MMAP_MAGIC) + 8 + len(header))
+        with open(filepath, "wb") as f:
+            f.write(_MMAP_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for array_offset, value in arrays:
+                f.seek(data_start + array_offset)
+                value.tofile(f)
+            f.seek(data_start + offset)
+            f.write(metadata)
+
     def cont_to_nested_list(self):
         return_list = []
         for key, value in self.items():
@@ -2209,6 +2986,258 @@ class ContainerBase(dict, abc.ABC):
             else:
                 yield kc
 
+    def cont_iter_leaves(self, key_chains=None, to_apply=True, key_chain=""):
+        """Iterate over the key-chains and values of the leaves of the container,
+        one leaf at a time, without flattening the container.
+
+        Lazily loaded hdf5 leaves are read from disk as they are reached, and are not
+        kept in the container, so containers which do not fit in memory can be
+        streamed through in constant memory.
+
+        Parameters
+        ----------
+        key_chains
+            The key-chains, or key-chain prefixes, of the leaves to iterate over or
+            skip. Default is ``None``, in which case all leaves are iterated over.
+        to_apply
+            If True, only the leaves at key_chains are iterated over, otherwise the
+            leaves at key_chains are skipped. Default is ``True``.
+        key_chain
+            Chain of keys for this dict entry (Default value = '')
+
+        Returns
+        -------
+            Iterator for the key-chains and values of the leaves.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1]), b={"c": ivy.array([2]), "d": 3})
+        >>> for kc, v in x.cont_iter_leaves(key_chains=["b"]):
+        ...     print(kc, v)
+        b/c ivy.array([2])
+        b/d 3
+        """
+        for key, value in dict.items(self):
+            kc = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
+            if isinstance(value, ivy.Container):
+                yield from value.cont_iter_leaves(key_chains, to_apply, kc)
+                continue
+            if (
+                key_chains is not None
+                and _found_in_key_chains(kc, key_chains) != to_apply
+            ):
+                continue
+            if type(value) is _LazyH5Leaf:
+                value = value.load()
+            yield kc, value
+
+    def cont_flatten(self):
+        """Return the flattened representation of the container.
+
+        The representation is cached, and is reused until any of the containers
+        within it are modified.
+
+        Returns
+        -------
+        ret
+            tuple of the leaves of the container, a dict mapping the key-chain of
+            each leaf to its index in the leaves, and the skeleton from which the
+            nested structure of the container can be rebuilt. These are shared with
+            the cache, and should not be modified.
+        """
+        version = self.__dict__.get("_cont_version", 0)
+        flat = self.__dict__.get("_cont_flat")
+        if flat is not None and flat[0] == version:
+            return flat[1:]
+        leaves = []
+        key_chains = []
+        skeleton = self._cont_build_skeleton("", leaves, key_chains, self)
+        idx = {kc: i for i, kc in enumerate(key_chains)}
+        self._cont_flat = (version, leaves, idx, skeleton)
+        return leaves, idx, skeleton
+
+    @staticmethod
+    def cont_unflatten(skeleton, leaves):
+        """Rebuild a container from the skeleton returned by :meth:`cont_flatten`
+        and a new leaf for each of the flattened leaves.
+
+        Parameters
+        ----------
+        skeleton
+            The skeleton of the container, as returned by :meth:`cont_flatten`.
+        leaves
+            The new leaves, in the order of the flattened leaves.
+
+        Returns
+        -------
+        ret
+            A container with the same nested structure and config as the
+            flattened container, holding the new leaves.
+        """
+        return _cont_from_skeleton(skeleton, leaves)
+
+    def _cont_build_skeleton(self, key_chain, leaves, key_chains, root):
+        # modifying this container from now on bumps the version of the root, which
+        # invalidates the flattened view cached on the root
+        roots = self.__dict__.get("_cont_flat_roots")
+        if roots is None:
+            roots = self._cont_flat_roots = weakref.WeakValueDictionary()
+        roots[id(root)] = root
+        keys = []
+        children = []
+        for key, value in self.items():
+            kc = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
+            keys.append(key)
+            if issubclass(type(value), ivy.Container):
+                children.append(
+                    value._cont_build_skeleton(kc, leaves, key_chains, root)
+                )
+            else:
+                value = self._cont_load_lazy_leaf(key, value)
+                children.append(None)
+                leaves.append(value)
+                key_chains.append(kc)
+        return self._config, tuple(keys), tuple(children)
+
+    def _cont_load_lazy_leaf(self, key, value):
+        # lazily loaded hdf5 leaves are read from disk when they are first accessed
+        if type(value) is _LazyH5Leaf:
+            value = value.load()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _cont_load_lazy_leaves(self):
+        if _lazy_h5_leaves:
+            for key, value in dict.items(self):
+                self._cont_load_lazy_leaf(key, value)
+
+    def items(self):
+        self._cont_load_lazy_leaves()
+        return dict.items(self)
+
+    def values(self):
+        self._cont_load_lazy_leaves()
+        return dict.values(self)
+
+    def cont_close(self):
+        """Close the hdf5 files which the lazily loaded leaves of the container
+        are read from.
+
+        The leaves which have not been loaded yet can no longer be read afterwards.
+        The container can also be used as a context manager, which closes the
+        files on exit.
+        """
+        files = {}
+        for value in self._cont_iter_raw_leaves():
+            if type(value) is _LazyH5Leaf and value._dataset.id.valid:
+                files[value._dataset.file.id] = value._dataset.file
+        for file in files.values():
+            file.close()
+
+    def _cont_iter_raw_leaves(self):
+        # the leaves as they are stored, without loading lazy hdf5 leaves
+        for value in dict.values(self):
+            if isinstance(value, ivy.Container):
+                yield from value._cont_iter_raw_leaves()
+            else:
+                yield value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cont_close()
+
+    def _cont_invalidate_flat(self):
+        roots = self.__dict__.get("_cont_flat_roots")
+        if roots:
+            for root in list(roots.values()):
+                root._cont_version = root.__dict__.get("_cont_version", 0) + 1
+            # the views of the roots are rebuilt, and registered again, on their
+            # next flattening
+            roots.clear()
+
+    def _cont_cached_signature(self, key, fn):
+        # structural signatures are cached alongside the flattened view, and are
+        # invalidated along with it
+        leaves, _, skeleton = self.cont_flatten()
+        version = self.__dict__.get("_cont_version", 0)
+        cache = self.__dict__.get("_cont_signatures")
+        if cache is None or cache[0] != version:
+            cache = (version, {})
+            self._cont_signatures = cache
+        signature = cache[1].get(key)
+        if signature is None:
+            signature = cache[1][key] = fn(leaves, skeleton)
+        return signature
+
+    def _cont_structure_signature(self, check_types=True, check_shapes=True):
+        def _build(leaves, skeleton):
+            # sub-containers and leaves are tagged apart, so that an empty
+            # sub-container never matches a leaf at the same key-chain
+            signature = [(kc, ivy.Container) for kc in _skeleton_key_chains(skeleton)]
+            signature += [
+                (kc, type(value) if check_types else None)
+                for kc, value in zip(self.cont_flatten()[1], leaves)
+            ]
+            signature = frozenset(signature)
+            return hash(signature), signature
+
+        structure = self._cont_cached_signature(("structure", check_types), _build)
+        if not check_shapes:
+            return structure
+        # the shapes are read live, since the data of an array leaf can be replaced
+        # without modifying the container
+        leaves, idx, _ = self.cont_flatten()
+        shapes = frozenset(
+            (kc, tuple(value.shape))
+            for kc, value in zip(idx, leaves)
+            if ivy.is_array(value)
+        )
+        return hash((structure[0], shapes)), (structure[1], shapes)
+
+    def _cont_size_ordered_shapes(self, exclusive=False):
+        # read live, for the same reason as the shapes of the structure signature
+        shapes = [
+            tuple(value.shape)
+            for value in self.cont_flatten()[0]
+            if ivy.is_array(value, exclusive=exclusive)
+        ]
+        return sorted(shapes, key=lambda shape: _reduce(mul, shape, 1))
+
+    def cont_structure_hash(self, check_types=True, check_shapes=True):
+        """Return a hash of the structure of the container.
+
+        The hash covers the key-chains of the container, including those of empty
+        sub-containers, along with the type of each leaf if check_types is set, and
+        the shape of each array leaf if check_shapes is set. The key-chains and types
+        are cached, and are reused until any of the containers within it are
+        modified, which makes it cheap to check containers for compatibility. The
+        shapes are read from the leaves on every call.
+
+        Parameters
+        ----------
+        check_types
+            Whether the hash covers the types of the leaves.
+            Default is ``True``.
+        check_shapes
+            Whether the hash covers the shapes of the array leaves.
+            Default is ``True``.
+
+        Returns
+        -------
+        ret
+            The hash of the structure of the container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3])})
+        >>> y = ivy.Container(a=ivy.array([4., 5.]), b={"c": ivy.array([6])})
+        >>> x.cont_structure_hash() == y.cont_structure_hash()
+        True
+        """
+        return self._cont_structure_signature(check_types, check_shapes)[0]
+
     def cont_to_flat_list(self):
         """Summary.
 
@@ -2217,7 +3246,7 @@ class ContainerBase(dict, abc.ABC):
         ret
             Container as flat list.
         """
-        return list([item for key, item in self.cont_to_iterator()])
+        return list(self.cont_flatten()[0])
 
     def cont_from_flat_list(self, flat_list):
         """Return new container object with the same hierarchy, but with values
@@ -2539,6 +3568,12 @@ class ContainerBase(dict, abc.ABC):
         ret
             sub-container or value at specified key chain
         """
+        flat = self.__dict__.get("_cont_flat")
+        if flat is not None and flat[0] == self.__dict__.get("_cont_version", 0):
+            # look leaves up directly in the key-chain index of the flattened view
+            idx = flat[2].get(key_chain.replace(".", "/"))
+            if idx is not None:
+                return flat[1][idx]
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2597,6 +3632,8 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
+        if not include_empty:
+            return list(self.cont_flatten()[1])
         return [kc for kc, v in self.cont_to_iterator(include_empty=include_empty)]
 
     def cont_key_chains_containing(self, sub_str, include_empty=False):
@@ -3146,6 +4183,7 @@ class ContainerBase(dict, abc.ABC):
         map_sequences=False,
         inplace=False,
         key_chain="",
+        stream=False,
     ):
         """Apply function to all array values of container.
 
@@ -3169,16 +4207,35 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        stream
+            Whether to map the leaves one at a time as they are consumed, returning
+            an iterator over the key-chains and mapped values of the leaves rather
+            than a new container. Lazily loaded hdf5 leaves are read from disk as
+            they are reached and are not kept in memory, so that mapping over
+            containers which do not fit in memory runs in constant memory.
+            Default is ``False``.
 
         Returns
         -------
-            New container following the function mapped to each sub-array.
+            New container following the function mapped to each sub-array, or an
+            iterator over the key-chains and mapped values of the leaves if stream
+            is set.
         """
-        return_dict = self if inplace else {}
+        if stream:
+            ivy.utils.assertions.check_false(
+                inplace, message="containers cannot be mapped inplace when streaming"
+            )
+            return self._cont_map_stream(
+                func, key_chains, to_apply, prune_unapplied, map_sequences, key_chain
+            )
+        if not inplace:
+            return self._cont_map_flat(
+                func, key_chains, to_apply, prune_unapplied, map_sequences, key_chain
+            )
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
             if isinstance(value, ivy.Container):
-                ret = value.cont_map(
+                value.cont_map(
                     func,
                     key_chains,
                     to_apply,
@@ -3187,30 +4244,65 @@ class ContainerBase(dict, abc.ABC):
                     inplace,
                     this_key_chain,
                 )
-                if prune_unapplied and not ret:
-                    continue
-                if not inplace:
-                    return_dict[key] = ret
             elif isinstance(value, (list, tuple)) and map_sequences:
                 ret = ivy.nested_map(
                     lambda x: func(x, None), value, True, shallow=False
                 )
                 if prune_unapplied and not ret:
                     continue
-                return_dict[key] = ret
+                self[key] = ret
             else:
                 if key_chains is not None:
                     if (this_key_chain in key_chains and not to_apply) or (
                         this_key_chain not in key_chains and to_apply
                     ):
-                        if prune_unapplied:
-                            continue
-                        return_dict[key] = value
                         continue
-                return_dict[key] = func(value, this_key_chain)
-        if inplace:
-            return self
-        return ivy.Container(return_dict, **self._config)
+                self[key] = func(value, this_key_chain)
+        return self
+
+    def _cont_map_flat(
+        self, func, key_chains, to_apply, prune_unapplied, map_sequences, key_chain
+    ):
+        leaves, idx, skeleton = self.cont_flatten()
+        new_leaves = []
+        for value, kc in zip(leaves, idx):
+            this_key_chain = kc if key_chain == "" else f"{str(key_chain)}/{str(kc)}"
+            if map_sequences and isinstance(value, (list, tuple)):
+                ret = ivy.nested_map(
+                    lambda x: func(x, None), value, True, shallow=False
+                )
+                if prune_unapplied and not ret:
+                    ret = _PRUNED
+            elif key_chains is not None and (
+                (this_key_chain in key_chains and not to_apply)
+                or (this_key_chain not in key_chains and to_apply)
+            ):
+                ret = _PRUNED if prune_unapplied else value
+            else:
+                ret = func(value, this_key_chain)
+            new_leaves.append(ret)
+        return _cont_from_skeleton(skeleton, new_leaves, prune_empty=prune_unapplied)
+
+    def _cont_map_stream(
+        self, func, key_chains, to_apply, prune_unapplied, map_sequences, key_chain
+    ):
+        for this_key_chain, value in self.cont_iter_leaves(key_chain=key_chain):
+            if map_sequences and isinstance(value, (list, tuple)):
+                ret = ivy.nested_map(
+                    lambda x: func(x, None), value, True, shallow=False
+                )
+                if prune_unapplied and not ret:
+                    continue
+            elif key_chains is not None and (
+                (this_key_chain in key_chains and not to_apply)
+                or (this_key_chain not in key_chains and to_apply)
+            ):
+                if prune_unapplied:
+                    continue
+                ret = value
+            else:
+                ret = func(value, this_key_chain)
+            yield this_key_chain, ret
 
     def cont_map_sub_conts(
         self,
@@ -3762,7 +4854,8 @@ class ContainerBase(dict, abc.ABC):
             return ("\n" + indent_str).join(chunks)
 
         new_dict = {}
-        for k, v in self.items():
+        # lazy hdf5 leaves are printed without reading them from disk
+        for k, v in dict.items(self):
             if isinstance(v, ivy.Container):
                 # noinspection PyArgumentList
                 rep = v.__repr__(as_repr=False)
@@ -3929,7 +5022,7 @@ class ContainerBase(dict, abc.ABC):
     # noinspection PyProtectedMember
     def __getattr__(self, item, *args, **kwargs):
         try:
-            ret = dict.__getitem__(self, item)
+            ret = self._cont_load_lazy_leaf(item, dict.__getitem__(self, item))
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = ivy.Container()
@@ -3973,7 +5066,12 @@ class ContainerBase(dict, abc.ABC):
             np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries
         }
         conts = []
-        for i in queue_idxs:
+        for i in sorted(queue_idxs):
+            if i in self._evicted_queue_idxs:
+                raise ivy.utils.exceptions.IvyException(
+                    f"The container from queue {i} has already been evicted, "
+                    "consider increasing queue_cache_size."
+                )
             if i not in self._loaded_containers_from_queues:
                 cont = ivy.Container(
                     self._queues[i].get(timeout=self._queue_timeout), **self._config
@@ -3982,9 +5080,15 @@ class ContainerBase(dict, abc.ABC):
             else:
                 cont = self._loaded_containers_from_queues[i]
             conts.append(cont)
+        if ivy.exists(self._queue_cache_size):
+            loaded = self._loaded_containers_from_queues
+            while len(loaded) > max(self._queue_cache_size, len(queue_idxs)):
+                evicted_idx = next(iter(loaded))
+                del loaded[evicted_idx]
+                self._evicted_queue_idxs.add(evicted_idx)
         combined_cont = self._container_combine_method(conts)
-        idx = list(queue_idxs)[0]
-        offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
+        idx = min(queue_idxs)
+        offset = 0 if idx == 0 else int(self._queue_load_sizes_cum[idx - 1])
         if isinstance(query, int):
             shifted_query = query - offset
         elif isinstance(query, slice):
@@ -4015,7 +5119,7 @@ class ContainerBase(dict, abc.ABC):
                 ret = self.cont_at_key_chain(query)
                 return ret
             ret = dict.__getitem__(self, query)
-            return ret
+            return self._cont_load_lazy_leaf(query, ret)
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
             return ret
@@ -4073,8 +5177,33 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            self._cont_invalidate_flat()
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_invalidate_flat()
+        return dict.__delitem__(self, key)
+
+    def clear(self):
+        self._cont_invalidate_flat()
+        return dict.clear(self)
+
+    def pop(self, *args):
+        self._cont_invalidate_flat()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_flat()
+        return dict.popitem(self)
+
+    def setdefault(self, *args):
+        self._cont_invalidate_flat()
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_flat()
+        return dict.update(self, *args, **kwargs)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4083,8 +5212,18 @@ class ContainerBase(dict, abc.ABC):
         else:
             return dict.__contains__(self, key)
 
+    def __reduce_ex__(self, protocol):
+        if self.__dict__.get("_cont_shared_memory"):
+            return _cont_from_shared_memory, (*_cont_to_shared_memory(self),)
+        return super().__reduce_ex__(protocol)
+
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_flat", None)
+        state_dict.pop("_cont_flat_roots", None)
+        state_dict.pop("_cont_version", None)
+        state_dict.pop("_cont_signatures", None)
+        state_dict.pop("_cont_shared_memory", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
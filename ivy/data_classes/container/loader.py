@@ -0,0 +1,265 @@
+"""Prefetching, multi-process loader of containers."""
+
+# global
+import os
+import queue
+import threading
+import traceback
+
+# local
+import ivy
+from ivy.data_classes.container.base import SharedMemory, resource_tracker
+
+
+class _WorkerError:
+    # an exception raised in a worker, which is re-raised by the loader
+    def __init__(self, worker_id, message):
+        self.worker_id = worker_id
+        self.message = message
+
+
+def _worker(fn, worker_id, num_workers, num_batches, out_queue, shared_memory, backend):
+    if backend:
+        ivy.set_backend(backend)
+    try:
+        for idx in range(worker_id, num_batches, num_workers):
+            cont = ivy.Container(fn(idx))
+            if shared_memory:
+                out_queue.put(cont.cont_share_memory())
+            else:
+                out_queue.put(cont.to_native())
+    except Exception:
+        out_queue.put(_WorkerError(worker_id, traceback.format_exc()))
+
+
+class _LoaderQueue:
+    # queue-like view of one batch of a loader, for use as a container queue
+    def __init__(self, loader, idx):
+        self._loader = loader
+        self._idx = idx
+
+    def get(self, timeout=None):
+        return self._loader._get(self._idx, timeout)
+
+
+class ContainerLoader:
+    def __init__(
+        self,
+        fn,
+        num_batches,
+        /,
+        *,
+        num_workers=1,
+        prefetch=2,
+        device=None,
+        shared_memory=True,
+        context=None,
+        timeout=None,
+    ):
+        """Load the containers returned by ``fn`` in worker processes, ahead of
+        when they are used.
+
+        Batch ``i`` is produced by worker ``i % num_workers``, and the batches
+        are returned in order. Each worker runs at most ``prefetch`` batches
+        ahead, and a background thread receives up to ``prefetch`` of the
+        batches into the current process, optionally moving them to ``device``,
+        so that the training loop doesn't wait on the workers at each step.
+
+        Parameters
+        ----------
+        fn
+            Function which takes the index of a batch, and returns the batch as a
+            container or dict. Must be picklable when ``context`` is spawn or
+            forkserver.
+        num_batches
+            The number of batches to load.
+        num_workers
+            The number of worker processes. Default is ``1``.
+        prefetch
+            The number of batches to prepare ahead of time, by each worker and by
+            the current process. Default is ``2``.
+        device
+            The device to move the batches to ahead of time. Default is ``None``,
+            in which case the batches are kept on the default device.
+        shared_memory
+            Whether to send the array leaves from the workers through shared
+            memory, rather than pickling them. Default is ``True``.
+        context
+            The multiprocessing context, either fork, forkserver or spawn.
+            Default is ``None``, for the default context.
+        timeout
+            The timeout when waiting for a batch. Default is global.
+
+        Examples
+        --------
+        >>> def load_batch(idx):
+        ...     return {"x": np.full((2, 3), idx, dtype=np.float32)}
+        >>> with ivy.ContainerLoader(load_batch, 4, num_workers=2) as loader:
+        ...     for batch in loader:
+        ...         print(batch.x.shape)
+        (2, 3)
+        (2, 3)
+        (2, 3)
+        (2, 3)
+        """
+        ivy.utils.assertions.check_greater(num_workers, 0, as_array=False)
+        ivy.utils.assertions.check_greater(prefetch, 0, as_array=False)
+        self._num_batches = num_batches
+        self._num_workers = num_workers
+        self._device = device
+        self._shared_memory = shared_memory and SharedMemory is not None
+        self._timeout = ivy.default(timeout, ivy.queue_timeout)
+        self._next_idx = 0
+        self._pending = {}
+        if self._shared_memory and os.name == "posix":
+            # the workers share the resource tracker of this process, which frees
+            # the shared memory of batches which are never received
+            resource_tracker.ensure_running()
+        multiprocessing = ivy.multiprocessing(context)
+        backend = ivy.current_backend_str()
+        self._queues = []
+        self._workers = []
+        for worker_id in range(num_workers):
+            out_queue = multiprocessing.Queue(maxsize=prefetch)
+            worker = multiprocessing.Process(
+                target=_worker,
+                args=(
+                    fn,
+                    worker_id,
+                    num_workers,
+                    num_batches,
+                    out_queue,
+                    self._shared_memory,
+                    backend,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._queues.append(out_queue)
+            self._workers.append(worker)
+        self._prefetched = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._prefetch, daemon=True)
+        self._thread.start()
+
+    def _receive(self, idx):
+        worker_id = idx % self._num_workers
+        while not self._stop.is_set():
+            try:
+                item = self._queues[worker_id].get(timeout=0.1)
+            except queue.Empty:
+                worker = self._workers[worker_id]
+                if not worker.is_alive() and worker.exitcode != 0:
+                    raise ivy.utils.exceptions.IvyException(
+                        f"loader worker {worker_id} exited unexpectedly, with exit "
+                        f"code {worker.exitcode}."
+                    )
+                continue
+            if isinstance(item, _WorkerError):
+                raise ivy.utils.exceptions.IvyException(
+                    f"loader worker {item.worker_id} raised an exception:\n"
+                    f"{item.message}"
+                )
+            if self._shared_memory:
+                return item
+            return ivy.Container(item).to_ivy()
+        return None
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._prefetched.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _prefetch(self):
+        try:
+            for idx in range(self._num_batches):
+                cont = self._receive(idx)
+                if cont is None:
+                    return
+                if ivy.exists(self._device):
+                    cont = cont.to_device(self._device)
+                self._put(cont)
+        except Exception as e:
+            self._put(e)
+
+    def _next(self, timeout):
+        ret = self._prefetched.get(timeout=timeout)
+        if isinstance(ret, Exception):
+            raise ret
+        return ret
+
+    def _get(self, idx, timeout=None):
+        # batches arrive in order, those received before they are requested are
+        # kept until they are
+        timeout = ivy.default(timeout, self._timeout)
+        while idx not in self._pending and self._next_idx <= idx:
+            self._pending[self._next_idx] = self._next(timeout)
+            self._next_idx += 1
+        if idx not in self._pending:
+            raise ivy.utils.exceptions.IvyException(
+                f"batch {idx} of the loader has already been consumed."
+            )
+        return self._pending.pop(idx)
+
+    def container(self, batch_size, /, *, queue_cache_size=2, **kwargs):
+        """Return a container over all of the batches, which loads them as they
+        are sliced.
+
+        Parameters
+        ----------
+        batch_size
+            The size of the leading dimension of each batch.
+        queue_cache_size
+            The number of loaded batches which the container keeps. Default is
+            ``2``.
+        kwargs
+            Further keyword arguments for the container. The batches are
+            concatenated along their leading dimension, unless another
+            ``container_combine_method`` is given.
+
+        Returns
+        -------
+        ret
+            Container which loads the batches from this loader.
+        """
+        kwargs.setdefault("container_combine_method", "concat")
+        return ivy.Container(
+            queues=[_LoaderQueue(self, i) for i in range(self._num_batches)],
+            queue_load_sizes=[batch_size] * self._num_batches,
+            queue_timeout=self._timeout,
+            queue_cache_size=queue_cache_size,
+            **kwargs,
+        )
+
+    def close(self):
+        """Stop the workers, and release the batches which haven't been read."""
+        self._stop.set()
+        self._thread.join()
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        # receiving the batches which haven't been read releases their shared memory
+        for out_queue in self._queues:
+            while True:
+                try:
+                    out_queue.get(timeout=0.1)
+                except queue.Empty:
+                    break
+            out_queue.close()
+
+    def __len__(self):
+        return self._num_batches
+
+    def __iter__(self):
+        while self._next_idx < self._num_batches:
+            yield self._get(self._next_idx)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -373,48 +373,71 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _is_array_like_annotation(parameter, annotation):
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
+def _get_array_like_params(fn):
+    """Return the (index, name) pairs of the parameters of `fn` which are
+    annotated as arrays and thus need array-like inputs converted, or None if
+    the signature of `fn` can't be inspected.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    return tuple(
+        (i, parameter)
+        for i, (parameter, param) in enumerate(type_hints.items())
+        if _is_array_like_annotation(parameter, param.annotation)
+    )
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    # the signature is inspected once at wrap time rather than on every call
+    array_like_params = _get_array_like_params(fn)
+
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
+        if not array_like_params:
+            return fn(*args, **kwargs)
         args = list(args)
         num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
-
         device = _get_preferred_device(args, kwargs)
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
-                if i < num_args:
-                    # Fix for ellipsis, slices for numpy's __getitem__
-                    # No need to try and convert them into arrays
-                    # since asarray throws unpredictable bugs
-                    if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
-                        continue
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg, device=device)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
-                        kwargs[parameter] = ivy.array(kwarg, device=device)
+        for i, parameter in array_like_params:
+            if i < num_args:
+                arg = args[i]
+                # Fix for ellipsis, slices for numpy's __getitem__
+                # No need to try and convert them into arrays
+                # since asarray throws unpredictable bugs
+                if arg is None or _check_in_nested_sequence(
+                    arg, value=Ellipsis, _type=slice
+                ):
+                    continue
+                if not ivy.is_array(arg):
+                    args[i] = ivy.array(arg, device=device)
+            elif parameter in kwargs:
+                kwarg = kwargs[parameter]
+                if kwarg is None or _check_in_nested_sequence(
+                    kwarg, value=Ellipsis, _type=slice
+                ):
+                    continue
+                if not ivy.is_array(kwarg):
+                    kwargs[parameter] = ivy.array(kwarg, device=device)
 
         return fn(*args, **kwargs)
 
     _handle_array_like_without_promotion.handle_array_like_without_promotion = True
+    _handle_array_like_without_promotion.array_like_params = array_like_params
     return _handle_array_like_without_promotion
 
 
@@ -910,8 +933,26 @@ def _update_torch_references(x, visited_view=None):
 # ------------------#
 
 
+def _contains_container(args):
+    # only walk the nests when a list, tuple or dict is actually present
+    for arg in args:
+        if isinstance(arg, ivy.Container):
+            return True
+        if isinstance(arg, (list, tuple, dict)) and ivy.nested_any(
+            arg, ivy.is_ivy_container, check_nests=True
+        ):
+            return True
+    return False
+
+
 def handle_nestable(fn: Callable) -> Callable:
     fn_name = fn.__name__
+    # get the container's version of the function once, rather than on every call
+    cont_fn = getattr(ivy.Container, f"_static_{fn_name}", None)
+    if cont_fn is None:
+
+        def cont_fn(*args, **kwargs):
+            return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
 
     @functools.wraps(fn)
     def _handle_nestable(*args, **kwargs):
@@ -932,18 +973,10 @@ def handle_nestable(fn: Callable) -> Callable:
             The return of the function, with the nestable property handled correctly.
         """
         # if any of the arguments or keyword arguments passed to the function contains
-        # a container, get the container's version of the function and call it using
-        # the passed arguments.
-        if hasattr(ivy.Container, f"_static_{fn_name}"):
-            cont_fn = getattr(ivy.Container, f"_static_{fn_name}")
-        else:
-
-            def cont_fn(*args, **kwargs):
-                return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
-
+        # a container, call the container's version of the function using the passed
+        # arguments.
         if ivy.nestable_mode and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            _contains_container(args) or _contains_container(kwargs.values())
         ):
             return cont_fn(*args, **kwargs)
 
@@ -1045,6 +1078,146 @@ def temp_asarray_wrapper(fn: Callable) -> Callable:
     return _temp_asarray_wrapper
 
 
+# Fused Wrapping #
+# ---------------#
+
+# decorators whose work is fully covered by the fused fast path whenever the
+# arguments are flat, the remaining ones always go through the decorator stack
+FUSABLE_DECORATORS = (
+    "handle_device",
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_backend_invalid",
+    "temp_asarray_wrapper",
+    "handle_exceptions",
+    "handle_nans",
+)
+
+# returned by `_flat_arg_to_native` when an argument needs the decorator stack
+_SLOW_PATH = object()
+
+
+def _flat_arg_to_native(x):
+    """Return the native form of a flat argument `x`, or `_SLOW_PATH` if it
+    is anything other than an array, a dtype, a device, a string or a
+    scalar.
+    """
+    if isinstance(x, ivy.Array):
+        if _is_backend_invalid(x):
+            return _SLOW_PATH
+        return x.data
+    if isinstance(x, ivy.NativeArray):
+        return x
+    if x is None or isinstance(x, (str, ivy.NativeDtype, ivy.NativeDevice)):
+        return x
+    if isinstance(x, (bool, int, float, complex)):
+        return x
+    return _SLOW_PATH
+
+
+def _fuse_wrappers(fn: Callable, wrapped_fn: Callable) -> Callable:
+    """Fuse the decorator stack of `wrapped_fn` into a single wrapper around
+    the backend implementation `fn`.
+
+    The arguments are scanned once, and the call is only routed through the
+    full decorator stack of `wrapped_fn` when a cheap type check finds
+    containers, nested sequences, array-likes, an `out` argument, array
+    function overrides or arrays on multiple devices.
+
+    Parameters
+    ----------
+    fn
+        the unwrapped backend implementation.
+    wrapped_fn
+        `fn` wrapped with all of its decorators, used as the slow path.
+
+    Returns
+    -------
+    ret
+        the fused wrapper, carrying the same decorator attributes as `wrapped_fn`.
+    """
+    # non-array inputs to these parameters are converted by
+    # handle_array_like_without_promotion, so they need the slow path
+    array_like_params = getattr(wrapped_fn, "array_like_params", None) or ()
+    array_like_idxs = {i for i, _ in array_like_params}
+    array_like_names = {parameter for _, parameter in array_like_params}
+    handles_out = hasattr(wrapped_fn, "handle_out_argument")
+    handles_device = hasattr(wrapped_fn, "handle_device")
+    to_ivy = hasattr(wrapped_fn, "outputs_to_ivy_arrays")
+
+    @functools.wraps(fn)
+    def _fast_call(dst_dev, *args, **kwargs):
+        if handles_device:
+            with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                ret = ivy.handle_soft_device_variable(*args, fn=fn, **kwargs)
+        else:
+            ret = fn(*args, **kwargs)
+        if not to_ivy:
+            return ret
+        if isinstance(ret, ivy.NativeArray):
+            return ivy.Array(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+
+    if hasattr(wrapped_fn, "handle_exceptions"):
+        _fast_call = ivy.handle_exceptions(_fast_call)
+
+    @functools.wraps(wrapped_fn)
+    def _fused_wrapper(*args, **kwargs):
+        if (
+            ivy.nan_policy != "nothing"
+            or ivy.soft_device_mode
+            or not ivy.array_mode
+            or kwargs.get("out") is not None
+        ):
+            return wrapped_fn(*args, **kwargs)
+        native_args = []
+        native_arrays = []
+        for i, arg in enumerate(args):
+            native = _flat_arg_to_native(arg)
+            if native is _SLOW_PATH or (
+                i in array_like_idxs
+                and native is not None
+                and not isinstance(native, ivy.NativeArray)
+            ):
+                return wrapped_fn(*args, **kwargs)
+            if isinstance(native, ivy.NativeArray):
+                native_arrays.append(native)
+            native_args.append(native)
+        native_kwargs = {}
+        for key, arg in kwargs.items():
+            native = _flat_arg_to_native(arg)
+            if native is _SLOW_PATH or (
+                key in array_like_names
+                and native is not None
+                and not isinstance(native, ivy.NativeArray)
+            ):
+                return wrapped_fn(*args, **kwargs)
+            if isinstance(native, ivy.NativeArray):
+                native_arrays.append(native)
+            native_kwargs[key] = native
+        if handles_out:
+            native_kwargs["out"] = None
+        dst_dev = None
+        if handles_device:
+            devices = {ivy.dev(x) for x in native_arrays}
+            if len(devices) > 1:
+                # let handle_device raise the error
+                return wrapped_fn(*args, **kwargs)
+            if kwargs.get("device") is not None:
+                dst_dev = ivy.as_native_dev(kwargs["device"])
+            elif devices:
+                dst_dev = next(iter(devices))
+        return _fast_call(dst_dev, *native_args, **native_kwargs)
+
+    _fused_wrapper.fused_wrapper = True
+    return _fused_wrapper
+
+
 # Functions #
 
 
@@ -1116,6 +1289,8 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
+        backend_fn = to_wrap
+        applied_wrappers = []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 if partial_mixed and attr == "handle_partial_mixed_function":
@@ -1123,9 +1298,20 @@ def _wrap_function(
                     to_wrap = handle_partial_mixed_function(to_wrap)
                 if attr not in skip_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
+                    applied_wrappers.append(attr)
             if attr in add_wrappers:
                 to_wrap = getattr(ivy, attr)(to_wrap)
 
+        # the fast path passes native arrays to the backend implementation, so
+        # only functions which take native arrays are fused
+        if (
+            ivy.fused_wrapper_mode
+            and not mixed_fn
+            and "inputs_to_native_arrays" in applied_wrappers
+            and all(attr in FUSABLE_DECORATORS for attr in applied_wrappers)
+        ):
+            to_wrap = _fuse_wrappers(backend_fn, to_wrap)
+
         # we should remove the all the decorators
         # after handle_mixed_fuction in FN_DECORATORS
         # from the compos function because these will
@@ -1372,10 +1558,18 @@ def _dtype_device_wrapper_creator(attrib, t):
 def _leaf_has_nans(x):
     if isinstance(x, ivy.Container):
         return x.has_nans()
-    elif ivy.is_array(x):
-        return ivy.isnan(x).any()
-    elif np.isnan(x):
-        return True
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if ivy.is_native_array(x):
+        # only floating point and complex arrays can hold nans
+        dtype = str(x.dtype)
+        if "float" not in dtype and "complex" not in dtype:
+            return False
+        # call the backend functions directly, bypassing the wrapped ivy.isnan
+        backend = ivy.current_backend(x)
+        return bool(backend.any(backend.isnan(x)))
+    if isinstance(x, (float, complex)):
+        return x != x
     return False
 
 
@@ -1384,6 +1578,8 @@ def _nest_has_nans(x):
 
 
 def handle_nans(fn: Callable) -> Callable:
+    num_calls = [0]
+
     @functools.wraps(fn)
     def _handle_nans(*args, **kwargs):
         """Check for the existence of nans in all arrays in the `args` and
@@ -1396,6 +1592,9 @@ def handle_nans(fn: Callable) -> Callable:
         warns: warns a user in case nans are present
         nothing: does nothing
 
+        The inputs are only checked on every n-th call, where n is the enabled
+        `nan_check_interval`.
+
         Parameters
         ----------
         args
@@ -1413,6 +1612,11 @@ def handle_nans(fn: Callable) -> Callable:
         if nan_policy == "nothing":
             return fn(*args, **kwargs)
 
+        # skip the check if it isn't due yet for this function
+        num_calls[0] += 1
+        if (num_calls[0] - 1) % ivy.nan_check_interval:
+            return fn(*args, **kwargs)
+
         # check all args and kwargs for presence of nans
         result = _nest_has_nans(args) or _nest_has_nans(kwargs)
 
@@ -1593,12 +1797,10 @@ def handle_backend_invalid(fn: Callable) -> Callable:
         array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
 
         def func(x):
-            target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
-            if (
-                target_backend is not None
-                and ivy.backend != ""
-                and ivy.current_backend_str() != target_backend.backend
-            ):
+            if _is_backend_invalid(x):
+                target_backend = ivy.utils.backend.handler._determine_backend_from_args(
+                    x
+                )
                 raise ivy.utils.exceptions.IvyInvalidBackendException(
                     "Operation not allowed. Array was instantiated with backend"
                     f" {target_backend.backend}. But current backend is"
@@ -1616,6 +1818,17 @@ def handle_backend_invalid(fn: Callable) -> Callable:
     return _handle_backend_invalid
 
 
+def _is_backend_invalid(x):
+    # whether the ivy.Array `x` was instantiated with a backend other than the
+    # currently set one
+    target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
+    return (
+        target_backend is not None
+        and ivy.backend != ""
+        and ivy.current_backend_str() != target_backend.backend
+    )
+
+
 attribute_dict = {
     "unsupported_dtypes",
     "supported_dtypes",
@@ -1,4 +1,6 @@
 import logging
+import jax.numpy as jnp
+from jax.experimental import sparse as jsparse
 import ivy
 from ivy.functional.ivy.experimental.sparse_array import (
     _is_valid_format,
@@ -25,7 +27,7 @@ def native_sparse_array(
     row_indices=None,
     values=None,
     dense_shape=None,
-    format="coo"
+    format="coo",
 ):
     ivy.utils.assertions.check_exists(
         data,
@@ -92,3 +94,26 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def _to_bcoo(x):
+    coo = x.to_coo()
+    return jsparse.BCOO(
+        (ivy.to_native(coo.values), jnp.transpose(ivy.to_native(coo.coo_indices))),
+        shape=tuple(x.dense_shape),
+    )
+
+
+def sparse_matmul(x1, x2, /):
+    x2 = ivy.to_native(x2)
+    dtype = ivy.promote_types(x1.values.dtype, x2.dtype)
+    return _to_bcoo(x1).astype(dtype) @ x2.astype(dtype)
+
+
+def sparse_sum(x, /, *, axis=None, keepdims=False):
+    if axis is None:
+        ret = jnp.sum(ivy.to_native(x.values))
+        return jnp.reshape(ret, (1,) * len(x.dense_shape)) if keepdims else ret
+    axis = axis % len(x.dense_shape)
+    ret = jsparse.bcoo_reduce_sum(_to_bcoo(x), axes=(axis,)).todense()
+    return jnp.expand_dims(ret, axis) if keepdims else ret
@@ -3,6 +3,7 @@ signature."""
 
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -456,3 +457,75 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    Wi_x = jnp.matmul(x, kernel)
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            Wi_x = Wi_x + b
+
+    def _step(carry, Wi_xt):
+        ht, ct = carry
+        it, ft, gt, ot = jnp.split(Wi_xt + jnp.matmul(ht, recurrent_kernel), 4, -1)
+        ct = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht = jax.nn.sigmoid(ot) * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    (_, ct), hts = jlax.scan(_step, (init_h, init_c), jnp.moveaxis(Wi_x, -2, 0))
+    return jnp.moveaxis(hts, 0, -2), ct
+
+
+def scaled_dot_product_attention_v_0p4p31_and_above(
+    query: JaxArray,
+    key: JaxArray,
+    value: JaxArray,
+    /,
+    *,
+    scale: Optional[float] = None,
+    mask: Optional[JaxArray] = None,
+    dropout_p: Optional[float] = 0.0,
+    is_causal: Optional[bool] = False,
+    training: Optional[bool] = False,
+    out: Optional[JaxArray] = None,
+) -> JaxArray:
+    # jax expects [batch, length, heads, features], so fold the batch dims
+    # together and attend with a single head
+    batch_shape = query.shape[:-2]
+    num_queries, num_keys = query.shape[-2], key.shape[-2]
+    query, key, value = (
+        jnp.reshape(x, (-1, x.shape[-2], 1, x.shape[-1])) for x in (query, key, value)
+    )
+    if mask is not None:
+        mask = jnp.broadcast_to(
+            mask.astype(bool), (*batch_shape, num_queries, num_keys)
+        ).reshape((-1, 1, num_queries, num_keys))
+    ret = jax.nn.dot_product_attention(
+        query,
+        key,
+        value,
+        mask=mask,
+        scale=scale if scale else None,
+        is_causal=is_causal,
+    )
+    return jnp.reshape(ret, (*batch_shape, num_queries, ret.shape[-1]))
+
+
+scaled_dot_product_attention_v_0p4p31_and_above.partial_mixed_handler = (
+    lambda query, key, value, *, mask=None, dropout_p=0.0, is_causal=False, training=False, **kwargs: not (  # noqa: E501
+        training and dropout_p
+    )
+    and not (is_causal and mask is not None)
+    and query.shape[:-2] == key.shape[:-2] == value.shape[:-2]
+    and query.shape[-1] == key.shape[-1] == value.shape[-1]
+)
@@ -1,5 +1,6 @@
 # global
 import logging
+import numpy as np
 
 # local
 import ivy
@@ -98,3 +99,31 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def sparse_matmul(x1, x2, /):
+    coo = x1.to_coo()
+    indices = ivy.to_native(coo.coo_indices)
+    x2 = ivy.to_native(x2)
+    values = ivy.to_native(coo.values).reshape((-1,) + (1,) * (x2.ndim - 1))
+    products = values * x2[indices[1]]
+    ret = np.zeros((x1.dense_shape[0],) + x2.shape[1:], dtype=products.dtype)
+    np.add.at(ret, indices[0], products)
+    return ret
+
+
+def sparse_sum(x, /, *, axis=None, keepdims=False):
+    ndim = len(x.dense_shape)
+    if axis is None:
+        ret = np.asarray(np.sum(ivy.to_native(x.values)))
+        return np.reshape(ret, (1,) * ndim) if keepdims else ret
+    axis = axis % ndim
+    coo = x.to_coo()
+    values = ivy.to_native(coo.values)
+    ret = np.zeros(
+        tuple(d for i, d in enumerate(x.dense_shape) if i != axis), dtype=values.dtype
+    )
+    np.add.at(
+        ret, tuple(np.delete(ivy.to_native(coo.coo_indices), axis, axis=0)), values
+    )
+    return np.expand_dims(ret, axis) if keepdims else ret
@@ -102,6 +102,56 @@ def _dilate_pad_conv_tranpose(
     return x, filters
 
 
+# upper bound on the bytes of the window matrix built for each chunk of the batch
+_CONV_CHUNK_BYTES = 2**27
+
+
+def _conv_gemm(x, filters, strides, dims, feature_group_count=1):
+    # convolve the padded, channel-last x with the channel-last filters, as one
+    # batched matmul of the windows of x with the filters of each group, over
+    # chunks of the batch which bound the size of the window matrix
+    filter_shape = list(filters.shape[:dims])
+    input_dim, output_dim = filters.shape[-2:]
+    groups = feature_group_count
+    out_shape = [
+        (x.shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    # B x OH x OW x KH x KW x G x I
+    windows = np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], *out_shape, *filter_shape, x.shape[-1]],
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *x.strides[1:],
+        ),
+        writeable=False,
+    ).reshape([x.shape[0], *out_shape, *filter_shape, groups, input_dim])
+    window_size = int(np.prod(filter_shape)) * input_dim
+    # G x (KH x KW x I) x O/G
+    filters = np.transpose(
+        filters.reshape(window_size, groups, output_dim // groups), (1, 0, 2)
+    )
+    # the group axis leads, followed by the output positions and then the window
+    windows = np.moveaxis(windows, -2, 0)
+    num_positions = int(np.prod(out_shape))
+    res = np.empty(
+        [x.shape[0], num_positions, groups, output_dim // groups],
+        dtype=np.result_type(x, filters),
+    )
+    sample_bytes = max(num_positions * window_size * groups * x.itemsize, 1)
+    chunk_size = max(_CONV_CHUNK_BYTES // sample_bytes, 1)
+    for start in range(0, x.shape[0], chunk_size):
+        cols = windows[:, start : start + chunk_size].reshape(groups, -1, window_size)
+        # G x (B x OH x OW) x O/G
+        out = np.matmul(cols, filters)
+        res[start : start + chunk_size] = np.moveaxis(
+            out.reshape(groups, -1, num_positions, output_dim // groups), 0, 2
+        )
+    # B x OH x OW x O
+    return res.reshape([x.shape[0], *out_shape, output_dim])
+
+
 def _ff_xd_before_conv(x, filters, dims, filter_format, x_dilations):
     if filter_format == "channel_first":
         filters = np.transpose(filters, (*range(2, dims + 2), 1, 0))
@@ -135,32 +185,8 @@ def conv1d(
     x, filters = _ff_xd_before_conv(x, filters, 1, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
     # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv_gemm(x, filters, strides, 1)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -217,35 +243,8 @@ def conv2d(
     x, filters = _ff_xd_before_conv(x, filters, 2, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv_gemm(x, filters, strides, 2)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -294,47 +293,18 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # KH x KW x 1 x C, with each channel in its own group
+    filters = np.expand_dims(filters, 2)
+    x_dtype = x.dtype
+    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
+    res = _conv_gemm(x, filters, strides, 2, feature_group_count=x.shape[-1])
+    res = res.astype(x_dtype, copy=False)
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -358,38 +328,8 @@ def conv3d(
     x, filters = _ff_xd_before_conv(x, filters, 3, filter_format, x_dilations)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
     # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv_gemm(x, filters, strides, 3)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -456,46 +396,8 @@ def conv_general_dilated(
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
 
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    # B x OH x OW x O
+    res = _conv_gemm(x, filters, strides, dims, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
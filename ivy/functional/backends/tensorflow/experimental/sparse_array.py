@@ -54,13 +54,8 @@ def native_sparse_array(
             values,
             dense_shape,
         )
-        all_coordinates = []
-        for i in range(values.shape[0]):
-            coordinate = ivy.gather(coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
         return tf.SparseTensor(
-            indices=all_coordinates, values=values, dense_shape=dense_shape
+            indices=tf.transpose(coo_indices), values=values, dense_shape=dense_shape
         )
     elif format == "csr":
         _verify_csr_components(
@@ -102,3 +97,29 @@ def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
         return {"coo_indices": x.indices}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
+
+
+def _to_sparse_tensor(x, dtype=None):
+    coo = x.to_coo()
+    values = ivy.to_native(coo.values)
+    return tf.SparseTensor(
+        indices=tf.transpose(ivy.to_native(coo.coo_indices)),
+        values=values if dtype is None else tf.cast(values, dtype),
+        dense_shape=list(x.dense_shape),
+    )
+
+
+def sparse_matmul(x1, x2, /):
+    x2 = ivy.to_native(x2)
+    dtype = ivy.promote_types(x1.values.dtype, x2.dtype)
+    x2 = tf.cast(x2, dtype)
+    if len(x2.shape) == 1:
+        ret = tf.sparse.sparse_dense_matmul(
+            _to_sparse_tensor(x1, dtype), tf.expand_dims(x2, -1)
+        )
+        return tf.squeeze(ret, -1)
+    return tf.sparse.sparse_dense_matmul(_to_sparse_tensor(x1, dtype), x2)
+
+
+def sparse_sum(x, /, *, axis=None, keepdims=False):
+    return tf.sparse.reduce_sum(_to_sparse_tensor(x), axis=axis, keepdims=keepdims)
@@ -494,6 +494,37 @@ def conv_general_transpose(
     return res
 
 
+def lstm_update(
+    x: Union[tf.Tensor, tf.Variable],
+    init_h: Union[tf.Tensor, tf.Variable],
+    init_c: Union[tf.Tensor, tf.Variable],
+    kernel: Union[tf.Tensor, tf.Variable],
+    recurrent_kernel: Union[tf.Tensor, tf.Variable],
+    /,
+    *,
+    bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+    recurrent_bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+) -> Tuple[Union[tf.Tensor, tf.Variable], Union[tf.Tensor, tf.Variable]]:
+    Wi_x = tf.matmul(tf.cast(x, kernel.dtype), kernel)
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            Wi_x = Wi_x + b
+
+    def _step(carry, Wi_xt):
+        ht, ct = carry
+        it, ft, gt, ot = tf.split(Wi_xt + tf.matmul(ht, recurrent_kernel), 4, -1)
+        ct = tf.sigmoid(ft) * ct + tf.sigmoid(it) * tf.tanh(gt)
+        ht = tf.sigmoid(ot) * tf.tanh(ct)
+        return ht, ct
+
+    hts, cts = tf.scan(
+        _step,
+        tf.experimental.numpy.moveaxis(Wi_x, -2, 0),
+        initializer=(init_h, init_c),
+    )
+    return tf.experimental.numpy.moveaxis(hts, 0, -2), cts[-1]
+
+
 def nms(
     boxes,
     scores=None,
@@ -115,3 +115,25 @@ def native_sparse_array_to_indices_values_and_shape(x):
             x.size(),
         )
     raise ivy.utils.exceptions.IvyException("not a sparse COO/CSR/CSC/BSC/BSR Tensor")
+
+
+def sparse_matmul(x1, x2, /):
+    # torch.sparse.mm supports the COO and CSR layouts
+    native = x1.data if x1.format in ["coo", "csr"] else x1.to_coo().data
+    x2 = ivy.to_native(x2)
+    dtype = torch.promote_types(native.dtype, x2.dtype)
+    native, x2 = native.to(dtype), x2.to(dtype)
+    if x2.dim() == 1:
+        return torch.sparse.mm(native, x2.unsqueeze(-1)).squeeze(-1)
+    return torch.sparse.mm(native, x2)
+
+
+def sparse_sum(x, /, *, axis=None, keepdims=False):
+    native = x.to_coo().data
+    if axis is None:
+        ret = torch.sparse.sum(native)
+        return ret.reshape((1,) * native.dim()) if keepdims else ret
+    axis = axis % native.dim()
+    ret = torch.sparse.sum(native, dim=axis)
+    ret = ret.to_dense() if ret.is_sparse else ret
+    return ret.unsqueeze(axis) if keepdims else ret
@@ -652,16 +652,75 @@ def conv_general_transpose(
     return res
 
 
-def scaled_dot_product_attention_v_2p0p0_and_above(
-    q,
-    k,
-    v,
-    scale: float,
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
     /,
     *,
-    mask=None,
-    out=None,
-):
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = x.shape[:-2]
+    output_channels = init_h.shape[-1]
+    weights = [kernel.t().contiguous(), recurrent_kernel.t().contiguous()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        weights += [
+            b if b is not None else torch.zeros_like(weights[0][:, 0])
+            for b in (bias, recurrent_bias)
+        ]
+    # the functional form of torch.nn.LSTM, taking the flat weights of each layer
+    hts, _, ct = torch.lstm(
+        x.reshape(-1, *x.shape[-2:]).to(kernel.dtype),
+        tuple(s.reshape(1, -1, output_channels) for s in (init_h, init_c)),
+        weights,
+        has_biases,
+        1,  # num_layers
+        0.0,  # dropout
+        False,  # train
+        False,  # bidirectional
+        True,  # batch_first
+    )
+    return (
+        hts.reshape(*batch_shape, *hts.shape[-2:]),
+        ct.reshape(*batch_shape, output_channels),
+    )
+
+
+def scaled_dot_product_attention_v_2p1p0_and_above(
+    query: torch.Tensor,
+    key: torch.Tensor,
+    value: torch.Tensor,
+    /,
+    *,
+    scale: Optional[float] = None,
+    mask: Optional[torch.Tensor] = None,
+    dropout_p: Optional[float] = 0.0,
+    is_causal: Optional[bool] = False,
+    training: Optional[bool] = False,
+    out: Optional[torch.Tensor] = None,
+) -> torch.Tensor:
     if isinstance(mask, torch.Tensor):
-        mask = torch.where(mask == 0, -torch.inf, 0)
-    return torch.nn.functional.scaled_dot_product_attention(q, k, v, attn_mask=mask)
+        mask = torch.zeros_like(mask, dtype=query.dtype).masked_fill_(
+            mask.logical_not(), torch.finfo(query.dtype).min
+        )
+    return torch.nn.functional.scaled_dot_product_attention(
+        query,
+        key,
+        value,
+        attn_mask=mask,
+        is_causal=is_causal,
+        scale=scale if scale else None,
+    )
+
+
+# torch drops out the attention probabilities rather than the similarities, and
+# the ivy function validates masks passed together with is_causal
+scaled_dot_product_attention_v_2p1p0_and_above.partial_mixed_handler = (
+    lambda *args, mask=None, dropout_p=0.0, is_causal=False, training=False, **kwargs: (
+        not (training and dropout_p) and not (is_causal and mask is not None)
+    )
+)
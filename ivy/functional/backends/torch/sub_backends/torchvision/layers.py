@@ -1,5 +1,9 @@
 import torch
-from torchvision.ops import roi_align as torch_roi_align, nms as torch_nms
+from torchvision.ops import (
+    roi_align as torch_roi_align,
+    nms as torch_nms,
+    batched_nms as torch_batched_nms,
+)
 from ivy.func_wrapper import to_native_arrays_and_back
 
 
@@ -46,3 +50,19 @@ def nms(
         ret = torch.tensor(nonzero[ret], dtype=torch.int64).flatten()
 
     return ret.flatten()[:max_output_size]
+
+
+def batched_nms(
+    boxes,
+    scores,
+    idxs,
+    iou_threshold=0.5,
+    max_output_size=None,
+    score_threshold=float("-inf"),
+):
+    keep_idx = scores > score_threshold
+    nonzero = torch.nonzero(keep_idx).flatten()
+    ret = torch_batched_nms(
+        boxes[keep_idx], scores[keep_idx], idxs[keep_idx], iou_threshold
+    )
+    return nonzero[ret].to(torch.int64)[:max_output_size]
@@ -1,19 +1,38 @@
 import torch
 import xformers.ops as xops
+import ivy
 from ivy.func_wrapper import to_native_arrays_and_back
 
 
 @to_native_arrays_and_back
 def scaled_dot_product_attention(
-    q,
-    k,
-    v,
-    scale: float,
+    query,
+    key,
+    value,
     /,
     *,
+    scale=None,
     mask=None,
+    dropout_p=0.0,
+    is_causal=False,
+    training=False,
     out=None,
 ):
+    ivy.utils.assertions.check_false(
+        is_causal and mask is not None,
+        "is_causal and attn_mask cannot be set at the same time",
+    )
     if isinstance(mask, torch.Tensor):
-        mask = torch.where(mask == 0, -torch.inf, 0)
-    return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
+        mask = torch.zeros_like(mask, dtype=query.dtype).masked_fill_(
+            mask.logical_not(), torch.finfo(query.dtype).min
+        )
+    elif is_causal:
+        mask = xops.LowerTriangularMask()
+    return xops.memory_efficient_attention(
+        query,
+        key,
+        value,
+        attn_bias=mask,
+        p=dropout_p if training else 0.0,
+        scale=scale if scale else None,
+    )
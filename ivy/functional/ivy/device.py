@@ -3,9 +3,10 @@
 
 # global
 import os
-import gc
 import abc
 import math
+import collections
+import concurrent.futures
 import psutil
 import warnings
 import types
@@ -196,14 +197,13 @@ def get_all_ivy_arrays_on_dev(
     {139740789224448:ivy.array([1,0,2])},
     """
     device = ivy.as_ivy_dev(device)
-    all_arrays = []
-    for obj in gc.get_objects():
-        if (
-            obj is ivy.data_classes.array.array.Array
-            and ivy.is_ivy_array(obj)
-            and ivy.dev(obj) == device
-        ):
-            all_arrays.append(obj)
+    all_arrays = [
+        arr
+        for arr in ivy.data_classes.array._get_live_arrays()
+        if arr.__dict__
+        and arr.backend == ivy.current_backend_str()
+        and ivy.dev(arr) == device
+    ]
 
     return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
 
@@ -1011,6 +1011,33 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _call_chunks(func, inputs_split, num_workers):
+    # yield the return of each chunk in order, with at most `num_workers` chunks
+    # being computed at once, so that only a bounded number of returns are alive
+    if not num_workers:
+        for inps in zip(*inputs_split):
+            yield func(*inps)
+        return
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        futures = collections.deque()
+        for inps in zip(*inputs_split):
+            if len(futures) == num_workers:
+                yield futures.popleft().result()
+            futures.append(executor.submit(func, *inps))
+        while futures:
+            yield futures.popleft().result()
+
+
+def _lazy_split_func_call(func, inputs, inputs_split, post_fn, num_workers):
+    if inputs_split is None:
+        yield func(*inputs)
+        return
+    for ret in _call_chunks(func, inputs_split, num_workers):
+        yield (
+            tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else post_fn(ret)
+        )
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1024,6 +1051,9 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: int = 0,
+    preallocate: bool = False,
+    lazy: bool = False,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Call a function by splitting its inputs along a given axis, and calling
     the function in chunks, rather than feeding the entire input array at once.
@@ -1053,11 +1083,28 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    num_workers
+        The number of threads to call the function on, with at most this many chunks
+        being computed at once. This only speeds up backends which release the GIL,
+        such as numpy and torch on the cpu. Default is ``0``, which calls the function
+        on each chunk sequentially in the calling thread.
+    preallocate
+        Whether to write the array returns of each chunk into an output array
+        allocated after the first chunk in ``concat`` mode, rather than keeping all
+        of the chunk returns alive until the end. The function must then return
+        chunks of the same size as its inputs along the output axes. Backends which
+        don't support in-place array updates concatenate the returns instead.
+        Default is ``False``.
+    lazy
+        Whether to return a generator which yields the return of each chunk as it is
+        computed, rather than unifying the returns. ``mode`` is then ignored.
+        Default is ``False``.
 
     Returns
     -------
     ret
-        The return from the function, following input splitting and re-concattenation.
+        The return from the function, following input splitting and re-concattenation,
+        or a generator over the return of each chunk if ``lazy`` is set.
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
@@ -1079,8 +1126,11 @@ def split_func_call(
         ),
         with_callable=True,
     )
+    post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
     dim_size = inputs[0].shape[input_axes[0]]
     if chunk_size >= dim_size:
+        if lazy:
+            return _lazy_split_func_call(func, inputs, None, post_fn, num_workers)
         return func(*inputs)
     num_chunks = dim_size / chunk_size
     num_chunks_floored = math.floor(num_chunks)
@@ -1103,21 +1153,22 @@ def split_func_call(
         )
         for i, inp in enumerate(inputs)
     ]
+    if lazy:
+        return _lazy_split_func_call(func, inputs, inputs_split, post_fn, num_workers)
+    chunk_rets = _call_chunks(func, inputs_split, num_workers)
     is_mean = mode == "mean"
     is_sum = mode == "sum"
-    post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
     if is_mean or is_sum:
         sums = None
-        for inps in zip(*inputs_split):
+        for ret in chunk_rets:
             if not sums:
-                sums = func(*inps)
+                sums = ret
                 sums = (
                     [post_fn(s) for s in sums]
                     if isinstance(sums, tuple)
                     else [post_fn(sums)]
                 )
             else:
-                ret = func(*inps)
                 if isinstance(ret, tuple):
                     for i, r in enumerate(ret):
                         sums[i] = sums[i] + post_fn(r)
@@ -1125,19 +1176,61 @@ def split_func_call(
                     sums[0] = sums[0] + post_fn(ret)
         sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
         return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
+    # writing into the outputs would copy them for every chunk on backends without
+    # in-place updates
+    preallocate = preallocate and ivy.inplace_arrays_supported()
+    rets = None
+    start = 0
+    for chunk_ret, size in zip(chunk_rets, chunk_sizes):
+        chunk_ret = (
+            tuple(post_fn(r) for r in chunk_ret)
+            if isinstance(chunk_ret, tuple)
+            else (post_fn(chunk_ret),)
+        )
+        if rets is None:
+            num_outputs = len(chunk_ret)
+            if output_axes is None:
+                output_axes = [input_axes[0]] * num_outputs
+            elif isinstance(output_axes, int):
+                output_axes = [output_axes] * num_outputs
+            # the array returns are written into preallocated outputs, and any
+            # other returns are collected and concatenated at the end
+            rets = [
+                (
+                    ivy.empty(
+                        tuple(
+                            dim_size if ax == output_axes[i] % len(r.shape) else d
+                            for ax, d in enumerate(r.shape)
+                        ),
+                        dtype=r.dtype,
+                        device=ivy.dev(r),
+                    )
+                    if preallocate and ivy.is_array(r)
+                    else []
+                )
+                for i, r in enumerate(chunk_ret)
+            ]
+        for i, r in enumerate(chunk_ret):
+            if isinstance(rets[i], list):
+                rets[i].append(r)
+                continue
+            axis = output_axes[i] % len(r.shape)
+            ivy.utils.assertions.check_equal(
+                r.shape[axis],
+                size,
+                message=(
+                    "preallocate requires the returns to have the same size as the"
+                    " input chunks along the output axes"
+                ),
+                as_array=False,
+            )
+            ivy.to_native(rets[i])[
+                (slice(None),) * axis + (slice(start, start + size),)
+            ] = ivy.to_native(r)
+        start += size
     ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
+        ivy.concat(r, axis=output_axes[i]) if isinstance(r, list) else r
+        for i, r in enumerate(rets)
     ]
     return ret[0] if len(ret) == 1 else ret
 
@@ -2712,8 +2712,6 @@ column_stack.mixed_backend_wrappers = {
 }
 
 
-<<<<<<< HEAD
-=======
 @inputs_to_ivy_arrays
 @handle_exceptions
 @handle_device
@@ -2763,4 +2761,3 @@ trim_zeros.mixed_backend_wrappers = {
     ),
     "to_skip": ("inputs_to_ivy_arrays",),
 }
->>>>>>> 9c52b468ba4c3c095b002afd7fb77b11a4dcd29c
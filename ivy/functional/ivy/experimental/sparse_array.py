@@ -1,6 +1,10 @@
+# global
+import math
+from typing import Optional, Union
+
 # local
 import ivy
-from ivy.func_wrapper import inputs_to_native_arrays
+from ivy.func_wrapper import inputs_to_native_arrays, outputs_to_ivy_arrays
 from ivy.utils.exceptions import handle_exceptions
 
 
@@ -723,98 +727,166 @@ class SparseArray(ivy.Array):
     # ---------------- #
 
     def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
+        return ivy.permute_dims(self._coo_indices, axes=(1, 0))
 
     def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
+        rows = _expand_compressed_indices(self._crow_indices)
+        return ivy.stack([rows, self._col_indices], axis=-1)
 
     def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
+        cols = _expand_compressed_indices(self._ccol_indices)
+        return ivy.stack([self._row_indices, cols], axis=-1)
 
     def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
+        block_rows = _expand_compressed_indices(self._crow_indices)
+        return _block_coordinates(
+            block_rows, self._col_indices, self._values.shape[-2:]
+        )
 
     def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
+        block_cols = _expand_compressed_indices(self._ccol_indices)
+        return _block_coordinates(
+            self._row_indices, block_cols, self._values.shape[-2:]
+        )
 
-    def to_dense_array(self, *, native=False):
+    def _to_dense_coordinates(self):
         if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
+            return self._coo_to_dense_coordinates()
         elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
+            return self._csr_to_dense_coordinates()
         elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
+            return self._csc_to_dense_coordinates()
         elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
-        else:
-            all_coordinates = self._bsr_to_dense_coordinates()
+            return self._bsc_to_dense_coordinates()
+        return self._bsr_to_dense_coordinates()
 
+    def to_dense_array(self, *, native=False):
         # make dense array
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
+            self._to_dense_coordinates(),
             ivy.flatten(self._values),
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        """Convert the sparse array to the COO format, with the elements of any
+        blocks stored individually.
+        """
+        if self._format == "coo":
+            return self
+        return SparseArray(
+            coo_indices=ivy.permute_dims(self._to_dense_coordinates(), axes=(1, 0)),
+            values=ivy.flatten(self._values),
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+
+    def to_csr(self):
+        """Convert the sparse array to the CSR format, with the elements of any
+        blocks stored individually.
+        """
+        if self._format == "csr":
+            return self
+        rows, cols, values = _sort_coordinates(
+            self._to_dense_coordinates(), ivy.flatten(self._values), self._dense_shape
+        )
+        return SparseArray(
+            crow_indices=_compress_indices(rows, self._dense_shape[0]),
+            col_indices=cols,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csr",
+        )
+
+    def to_csc(self):
+        """Convert the sparse array to the CSC format, with the elements of any
+        blocks stored individually.
+        """
+        if self._format == "csc":
+            return self
+        coordinates = ivy.flip(self._to_dense_coordinates(), axis=-1)
+        cols, rows, values = _sort_coordinates(
+            coordinates, ivy.flatten(self._values), self._dense_shape[::-1]
+        )
+        return SparseArray(
+            ccol_indices=_compress_indices(cols, self._dense_shape[1]),
+            row_indices=rows,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csc",
+        )
+
+    def _with_values(self, values):
+        # a sparse array with the same indices as self and the given values
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format="coo",
+            )
+        elif self._format in ["csr", "bsr"]:
+            return SparseArray(
+                crow_indices=self._crow_indices,
+                col_indices=self._col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        return SparseArray(
+            ccol_indices=self._ccol_indices,
+            row_indices=self._row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
+
+    def map_values(self, fn):
+        """Apply an elementwise function to the stored values only. This matches
+        applying ``fn`` to the dense array as long as ``fn`` maps zero to zero,
+        as is the case for ivy.abs, ivy.negative or ivy.relu for example.
+        """
+        return self._with_values(fn(self._values))
+
+
+def _expand_compressed_indices(compressed_indices):
+    # the row (or column) of each element, from the offsets at which each row (or
+    # column) starts in crow_indices (or ccol_indices)
+    counts = compressed_indices[1:] - compressed_indices[:-1]
+    return ivy.repeat(ivy.arange(counts.shape[0], dtype="int64"), counts)
+
+
+def _compress_indices(indices, size):
+    # the offsets at which each of the `size` rows (or columns) starts in the
+    # sorted indices
+    return ivy.searchsorted(indices, ivy.arange(size + 1, dtype=indices.dtype))
+
+
+def _block_coordinates(block_rows, block_cols, block_shape):
+    # the dense coordinates of each element of each block, in the order in which
+    # the flattened values of the blocks are stored
+    nrows, ncols = block_shape
+    rows = ivy.reshape(block_rows * nrows, (-1, 1, 1)) + ivy.reshape(
+        ivy.arange(nrows, dtype="int64"), (1, nrows, 1)
+    )
+    cols = ivy.reshape(block_cols * ncols, (-1, 1, 1)) + ivy.reshape(
+        ivy.arange(ncols, dtype="int64"), (1, 1, ncols)
+    )
+    rows, cols = ivy.broadcast_arrays(rows, cols)
+    return ivy.stack([ivy.flatten(rows), ivy.flatten(cols)], axis=-1)
+
+
+def _sort_coordinates(coordinates, values, dense_shape):
+    # sort the 2D coordinates and their values lexicographically
+    rows, cols = coordinates[:, 0], coordinates[:, 1]
+    order = ivy.argsort(rows * dense_shape[1] + cols, stable=True)
+    return (
+        ivy.gather(rows, order),
+        ivy.gather(cols, order),
+        ivy.gather(values, order),
+    )
+
 
 class NativeSparseArray:
     pass
@@ -860,3 +932,184 @@ def native_sparse_array(
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+def _segment_sum(data, segment_ids, num_segments):
+    # sum the rows of data with the same (multi-dimensional) segment id
+    segment_ids = ivy.reshape(segment_ids, (segment_ids.shape[0], -1))
+    return ivy.scatter_nd(
+        segment_ids,
+        data,
+        shape=tuple(num_segments) + tuple(data.shape[1:]),
+        reduction="sum",
+    )
+
+
+@handle_exceptions
+@outputs_to_ivy_arrays
+def sparse_matmul(
+    x1: SparseArray,
+    x2: Union[ivy.Array, ivy.NativeArray],
+    /,
+) -> ivy.Array:
+    """Compute the matrix product of a 2D sparse array and a dense array,
+    without converting the sparse array to a dense one.
+
+    Parameters
+    ----------
+    x1
+        sparse array of shape (M, K).
+    x2
+        dense array of shape (K,) or (K, N).
+
+    Returns
+    -------
+    ret
+        dense array of shape (M,) or (M, N).
+
+    Examples
+    --------
+    >>> x1 = ivy.sparse_array.SparseArray(
+    ...     coo_indices=[[0, 1], [1, 0]], values=[2.0, 3.0], dense_shape=[2, 2],
+    ...     format="coo")
+    >>> x2 = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    >>> ivy.sparse_matmul(x1, x2)
+    ivy.array([[6., 8.],
+               [3., 6.]])
+    """
+    coo = x1.to_coo()
+    x2 = ivy.to_ivy(x2)
+    values = ivy.reshape(coo.values, (-1,) + (1,) * (len(x2.shape) - 1))
+    products = values * ivy.gather(x2, coo.coo_indices[1], axis=0)
+    return _segment_sum(products, coo.coo_indices[0], (x1.dense_shape[0],))
+
+
+@handle_exceptions
+@outputs_to_ivy_arrays
+def sparse_sum(
+    x: SparseArray,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+) -> ivy.Array:
+    """Sum the elements of a sparse array, either all of them or along an axis,
+    without converting it to a dense array.
+
+    Parameters
+    ----------
+    x
+        input sparse array.
+    axis
+        axis along which to sum. By default, all elements are summed.
+    keepdims
+        whether to keep the reduced axis as a dimension of size one.
+        Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the dense sums.
+
+    Examples
+    --------
+    >>> x = ivy.sparse_array.SparseArray(
+    ...     coo_indices=[[0, 1, 1], [1, 0, 2]], values=[2.0, 3.0, 4.0],
+    ...     dense_shape=[2, 3], format="coo")
+    >>> ivy.sparse_sum(x, axis=0)
+    ivy.array([3., 2., 4.])
+    """
+    ndim = len(x.dense_shape)
+    if axis is None:
+        ret = ivy.sum(x.values)
+        return ivy.reshape(ret, (1,) * ndim) if keepdims else ret
+    axis = axis % ndim
+    coo = x.to_coo()
+    remaining = [i for i in range(ndim) if i != axis]
+    ret = _segment_sum(
+        coo.values,
+        ivy.permute_dims(ivy.gather(coo.coo_indices, remaining, axis=0), (1, 0)),
+        [x.dense_shape[i] for i in remaining],
+    )
+    return ivy.expand_dims(ret, axis=axis) if keepdims else ret
+
+
+@handle_exceptions
+def sparse_mean(
+    x: SparseArray,
+    /,
+    *,
+    axis: Optional[int] = None,
+    keepdims: bool = False,
+) -> ivy.Array:
+    """Compute the mean of the elements of a sparse array, either all of them or
+    along an axis, counting the elements which aren't stored as zeros.
+
+    Parameters
+    ----------
+    x
+        input sparse array.
+    axis
+        axis along which to compute the mean. By default, the mean of all elements
+        is computed.
+    keepdims
+        whether to keep the reduced axis as a dimension of size one.
+        Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the dense means.
+
+    Examples
+    --------
+    >>> x = ivy.sparse_array.SparseArray(
+    ...     coo_indices=[[0, 1, 1], [1, 0, 2]], values=[2.0, 3.0, 4.0],
+    ...     dense_shape=[2, 3], format="coo")
+    >>> ivy.sparse_mean(x, axis=1)
+    ivy.array([0.66666669, 2.33333325])
+    """
+    count = math.prod(x.dense_shape) if axis is None else x.dense_shape[axis]
+    return ivy.divide(ivy.sparse_sum(x, axis=axis, keepdims=keepdims), int(count))
+
+
+@handle_exceptions
+def sparse_multiply(
+    x1: SparseArray,
+    x2: Union[float, ivy.Array, ivy.NativeArray],
+    /,
+) -> SparseArray:
+    """Multiply a sparse array elementwise with a scalar or with a dense array
+    which broadcasts to its shape, only computing the products of the stored
+    elements so the result stays sparse.
+
+    Parameters
+    ----------
+    x1
+        input sparse array.
+    x2
+        scalar or dense array broadcastable to the shape of ``x1``.
+
+    Returns
+    -------
+    ret
+        sparse array with the same indices as ``x1``.
+
+    Examples
+    --------
+    >>> x1 = ivy.sparse_array.SparseArray(
+    ...     coo_indices=[[0, 1], [1, 0]], values=[2.0, 3.0], dense_shape=[2, 2],
+    ...     format="coo")
+    >>> ivy.sparse_multiply(x1, ivy.array([10.0, 100.0])).values
+    ivy.array([200.,  30.])
+    """
+    if not ivy.is_array(x2):
+        return x1._with_values(x1.values * x2)
+    x2 = ivy.to_ivy(x2)
+    ndim = len(x1.dense_shape)
+    x2 = ivy.reshape(x2, (1,) * (ndim - len(x2.shape)) + tuple(x2.shape))
+    # only gather along the dimensions of x2 which aren't broadcast
+    not_broadcast = ivy.array([int(d != 1) for d in x2.shape], dtype="int64")
+    coordinates = x1._to_dense_coordinates() * not_broadcast
+    products = ivy.flatten(x1.values) * ivy.gather_nd(x2, coordinates)
+    return x1._with_values(ivy.reshape(products, x1.values.shape))
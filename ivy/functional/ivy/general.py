@@ -3,8 +3,11 @@
 
 # global
 import gc
+import hashlib
 import inspect
 import math
+import threading
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import (
@@ -54,6 +57,7 @@ queue_timeout_stack = []
 array_mode_stack = []
 shape_array_mode_stack = []
 nestable_mode_stack = []
+fused_wrapper_mode_stack = []
 exception_trace_mode_stack = []
 inplace_mode_stack = []
 trace_mode_dict = {
@@ -463,6 +467,24 @@ def unset_array_mode() -> None:
         ivy.__setattr__("array_mode", mode, True)
 
 
+class NestableMode:
+    """Nestable Mode Context Manager."""
+
+    # noinspection PyShadowingNames
+    def __init__(self, nestable_mode: bool):
+        self._nestable_mode = nestable_mode
+
+    def __enter__(self):
+        set_nestable_mode(self._nestable_mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_nestable_mode()
+        if self and (exc_type is not None):
+            raise exc_val
+        return self
+
+
 ivy.nestable_mode = nestable_mode_stack[-1] if nestable_mode_stack else True
 
 
@@ -513,6 +535,65 @@ def unset_nestable_mode() -> None:
         ivy.__setattr__("nestable_mode", mode, True)
 
 
+ivy.fused_wrapper_mode = (
+    fused_wrapper_mode_stack[-1] if fused_wrapper_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_fused_wrapper_mode(mode: bool) -> None:
+    """Set the mode of whether backend functions are wrapped with a single
+    fused wrapper rather than a stack of decorators.
+
+    The fused wrapper scans the arguments once and only falls back to the full
+    decorator stack when containers, nested sequences, array-likes, an `out`
+    argument, array function overrides or multiple devices are encountered. The
+    mode is read whenever functions are wrapped, so it takes effect on the next
+    call to :func:`ivy.set_backend`.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to generate fused wrappers for backend functions
+
+    Examples
+    --------
+    >>> ivy.set_fused_wrapper_mode(True)
+    >>> ivy.fused_wrapper_mode
+    True
+
+    >>> ivy.set_fused_wrapper_mode(False)
+    >>> ivy.fused_wrapper_mode
+    False
+    """
+    global fused_wrapper_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    fused_wrapper_mode_stack.append(mode)
+    ivy.__setattr__("fused_wrapper_mode", mode, True)
+
+
+@handle_exceptions
+def unset_fused_wrapper_mode() -> None:
+    """Reset the mode of whether backend functions are wrapped with a single
+    fused wrapper to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_fused_wrapper_mode(True)
+    >>> ivy.fused_wrapper_mode
+    True
+
+    >>> ivy.unset_fused_wrapper_mode()
+    >>> ivy.fused_wrapper_mode
+    False
+    """
+    global fused_wrapper_mode_stack
+    if fused_wrapper_mode_stack:
+        fused_wrapper_mode_stack.pop(-1)
+        mode = fused_wrapper_mode_stack[-1] if fused_wrapper_mode_stack else False
+        ivy.__setattr__("fused_wrapper_mode", mode, True)
+
+
 ivy.exception_trace_mode = (
     exception_trace_mode_stack[-1] if exception_trace_mode_stack else "full"
 )
@@ -1721,17 +1802,75 @@ def match_kwargs(
     return split_kwargs
 
 
+class _FnCache:
+    # the least recently used outputs of a function, along with hit/miss counts
+    def __init__(self, max_size):
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+
+def _cache_key(x, hash_arrays, arrays):
+    # a hashable key which is equal for structurally equal arguments, arrays are
+    # keyed by their native array, or by their shape, dtype and a digest of their
+    # contents if hash_arrays is set
+    if ivy.is_array(x):
+        if hash_arrays:
+            x_np = np.ascontiguousarray(ivy.to_numpy(x))
+            digest = hashlib.blake2b(x_np.tobytes(), digest_size=16).digest()
+            return ("array", x_np.shape, str(x_np.dtype), digest)
+        x = x.data if isinstance(x, ivy.Array) else x
+        # the arrays are kept alive with the cached output, so that their ids
+        # are not reused by other arrays while the output is cached
+        arrays.append(x)
+        return ("array", id(x))
+    if isinstance(x, dict):
+        return (
+            type(x),
+            tuple(
+                (k, _cache_key(v, hash_arrays, arrays)) for k, v in sorted(x.items())
+            ),
+        )
+    if isinstance(x, (list, tuple)):
+        return (type(x), tuple(_cache_key(v, hash_arrays, arrays) for v in x))
+    try:
+        hash(x)
+    except TypeError:
+        return ("str", str(x))
+    return (type(x), x)
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Callable,
+    /,
+    *,
+    max_size: Optional[int] = 1024,
+    hash_arrays: bool = False,
+) -> Callable:
     """Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. Arguments are matched structurally, with arrays
+    matched by identity, and the least recently used outputs are evicted once
+    ``max_size`` outputs are cached. Wrappers of the same function with the same
+    ``max_size`` share their cache. The wrapped function has ``cache_info`` and
+    ``cache_clear`` methods, to query the cache statistics and to clear the cached
+    outputs.
 
     Parameters
     ----------
     func
         The function to wrap, whose output should be cached for later.
+    max_size
+        The maximum number of outputs to cache for ``func``. ``None`` means the
+        cache is unbounded. Default is ``1024``.
+    hash_arrays
+        Whether to match arrays by their shape, dtype and contents instead of by
+        identity, which reads every array argument to the host on each call, but
+        also detects in-place updates of the arrays. Default is ``False``.
 
     Returns
     -------
@@ -1753,24 +1892,57 @@ def cache_fn(func: Callable) -> Callable:
     >>> cached_line_eq = ivy.cache_fn(line_eq)
     >>> print(cached_line_eq(3, itc=5, slp=2))
     11
+
+    With cache statistics:
+
+    >>> cached_line_eq = ivy.cache_fn(line_eq, max_size=1)
+    >>> _ = cached_line_eq(3, itc=5, slp=2)
+    >>> _ = cached_line_eq(3, itc=5, slp=2)
+    >>> print(cached_line_eq.cache_info())
+    {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 1}
     """
     global FN_CACHE
-    if func not in FN_CACHE:
-        FN_CACHE[func] = {}
+    if (func, max_size) not in FN_CACHE:
+        FN_CACHE[(func, max_size)] = _FnCache(max_size)
+    cache = FN_CACHE[(func, max_size)]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            ([f"{str(i)}, " for i in args] + [" kw, "])
-            + [f"{str(i)}, " for i in sorted(kwargs.items())]
+        arrays = []
+        key = (
+            _cache_key(args, hash_arrays, arrays),
+            _cache_key(kwargs, hash_arrays, arrays),
         )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        with cache.lock:
+            if key in cache.entries:
+                cache.hits += 1
+                cache.entries.move_to_end(key)
+                return cache.entries[key][0]
+            cache.misses += 1
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        with cache.lock:
+            cache.entries[key] = (ret, arrays)
+            if cache.max_size is not None:
+                while len(cache.entries) > cache.max_size:
+                    cache.entries.popitem(last=False)
         return ret
 
+    def cache_info():
+        return {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "size": len(cache.entries),
+            "max_size": cache.max_size,
+        }
+
+    def cache_clear():
+        with cache.lock:
+            cache.entries.clear()
+            cache.hits = 0
+            cache.misses = 0
+
+    cached_fn.cache_info = cache_info
+    cached_fn.cache_clear = cache_clear
     return cached_fn
 
 
@@ -23,6 +23,8 @@ from ivy.utils.exceptions import handle_exceptions
 # Extra #
 # ------#
 
+_SDPA_KEY_CHUNK_SIZE = 1024
+
 
 def _get_embed_dim(
     in_proj_weights, q_proj_weights, k_proj_weights, v_proj_weights, query
@@ -37,6 +39,21 @@ def _get_embed_dim(
     return pre_embed_dim, embed_dim
 
 
+def _sdpa_block_bias(mask, is_causal, num_queries, start, stop, dtype):
+    """Additive mask bias for the keys in ``[start, stop)``, or None if unmasked."""
+    if ivy.exists(mask):
+        if mask.shape[-1] != 1:
+            mask = mask[..., start:stop]
+        masked = ivy.logical_not(mask)
+    elif is_causal:
+        masked = ivy.arange(start, stop) > ivy.expand_dims(
+            ivy.arange(num_queries), axis=-1
+        )
+    else:
+        return None
+    return ivy.astype(masked, dtype) * ivy.finfo(dtype).min
+
+
 def _in_projection(
     q,
     k,
@@ -432,7 +449,11 @@ dropout.mixed_backend_wrappers = {
 
 
 @handle_exceptions
+@handle_nestable
+@handle_out_argument
+@handle_partial_mixed_function
 @handle_array_like_without_promotion
+@inputs_to_ivy_arrays
 @handle_array_function
 def scaled_dot_product_attention(
     query: Union[ivy.Array, ivy.NativeArray],
@@ -689,29 +710,50 @@ def scaled_dot_product_attention(
     )
     embed_dim = query.shape[-1]
     scale = scale if scale else 1 / (embed_dim**0.5)
-    sim = ivy.einsum("... q f, ... k f -> ... q k", query, key) * scale
-    sim = ivy.dropout(sim, dropout_p, training=training)
-    if ivy.exists(mask):
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
+    num_queries = query.shape[-2]
+    num_keys = key.shape[-2]
+    if is_causal and mask is None:
+        # key blocks lying entirely above the diagonal are fully masked
+        num_keys = min(num_keys, num_queries)
+    # online softmax over key blocks, so the full similarity matrix is never built
+    for start in range(0, num_keys, _SDPA_KEY_CHUNK_SIZE):
+        stop = min(start + _SDPA_KEY_CHUNK_SIZE, num_keys)
+        sim = ivy.einsum("... q f, ... k f -> ... q k", query, key[..., start:stop, :])
+        sim = ivy.dropout(sim * scale, dropout_p, training=training)
+        bias = _sdpa_block_bias(mask, is_causal, num_queries, start, stop, sim.dtype)
+        if ivy.exists(bias):
+            sim = sim + bias
+        block_max = ivy.max(sim, axis=-1, keepdims=True)
+        if start == 0:
+            row_max = block_max
+            attn = ivy.exp(sim - row_max)
+            denom = ivy.sum(attn, axis=-1, keepdims=True)
+            result = ivy.einsum("... qk, ...kf -> ...qf", attn, value[..., :stop, :])
+            continue
+        new_max = ivy.maximum(row_max, block_max)
+        correction = ivy.exp(row_max - new_max)
+        attn = ivy.exp(sim - new_max)
+        denom = denom * correction + ivy.sum(attn, axis=-1, keepdims=True)
+        result = result * correction + ivy.einsum(
+            "... qk, ...kf -> ...qf", attn, value[..., start:stop, :]
         )
-    elif is_causal:
-        L = query.shape[-2]  # Source sequence length
-        S = key.shape[-2]  # Target sequence length
-        mask = ivy.tril(ivy.ones((L, S)), k=0)
-        mask = ivy.astype(mask, ivy.bool)
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
-    attn = ivy.softmax(sim, axis=-1)
-    result = ivy.einsum("... qk, ...kf -> ...qf", attn, value)
+        row_max = new_max
+    result = result / denom
     return ivy.inplace_update(out, result) if ivy.exists(out) else result
 
 
+scaled_dot_product_attention.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "handle_out_argument",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device_shifting",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays", "handle_partial_mixed_function"),
+}
+
+
 @handle_exceptions
 @handle_nestable
 @handle_out_argument
@@ -2241,6 +2283,21 @@ def lstm_update(
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
+    output_channels = init_h.shape[-1]
+    if timesteps == 0:
+        # nothing to unroll, so the initial cell state is also the last one
+        hts = ivy.zeros(
+            batch_shape + [0, output_channels], dtype=init_h.dtype, device=ivy.dev(x)
+        )
+        return hts, init_c
+
+    # doubling the cell gate pre-activations lets one sigmoid cover all four
+    # gates, since tanh(x) = 2 * sigmoid(2x) - 1
+    gate_scale = ivy.concat([
+        ivy.ones((2 * output_channels,), dtype=kernel.dtype, device=ivy.dev(x)),
+        ivy.full((output_channels,), 2, dtype=kernel.dtype, device=ivy.dev(x)),
+        ivy.ones((output_channels,), dtype=kernel.dtype, device=ivy.dev(x)),
+    ])
 
     # input kernel
     Wi = kernel
@@ -2248,45 +2305,52 @@ def lstm_update(
         ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
         batch_shape + [timesteps, -1],
     )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    Wi_x = Wi_x * gate_scale
 
     # recurrent kernel
-    Wh = recurrent_kernel
+    Wh = recurrent_kernel * gate_scale
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias * gate_scale
 
     # lstm states
     ht = init_h
     ct = init_c
 
-    # lstm outputs
-    hts_list = []
+    # lstm outputs, written in place when the backend allows it
+    inplace = ivy.inplace_arrays_supported()
+    hts = []
 
     # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    for t in range(timesteps):
+        gates = ivy.sigmoid(Wi_x[..., t, :] + ivy.matmul(ht, Wh))
+        it, ft, gt, ot = ivy.split(gates, num_or_size_splits=4, axis=-1)
+        ct = ft * ct + it * (2 * gt - 1)
         ht = ot * ivy.tanh(ct)
-
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
-
-    return ivy.concat(hts_list, axis=-2), ct
+        if not inplace:
+            hts.append(ht)
+            continue
+        if t == 0:
+            hts = ivy.empty(
+                batch_shape + [timesteps, output_channels],
+                dtype=ht.dtype,
+                device=ivy.dev(ht),
+            )
+        hts[..., t, :] = ht
+
+    if not inplace:
+        hts = ivy.stack(hts, axis=-2)
+    return hts, ct
+
+
+lstm_update.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
 
 
 # Helpers #
@@ -2634,6 +2698,22 @@ def roi_align(
     return output
 
 
+_NMS_TILE_SIZE = 512
+
+
+def _nms_suppression(boxes1, boxes2, areas1, areas2, iou_threshold):
+    """Whether each box in boxes1 suppresses each box in boxes2, as a
+    [len(boxes1), len(boxes2)] boolean matrix.
+    """
+    lt = ivy.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    rb = ivy.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    wh = ivy.maximum(rb - lt, 0.0)
+    inter = wh[..., 0] * wh[..., 1]
+    iou = inter / (areas1[:, None] + areas2[None, :] - inter)
+    # nan overlaps of degenerate boxes suppress, as in the sequential pass
+    return ivy.logical_not(iou <= iou_threshold)
+
+
 # TODO add paddle backend implementation back,
 #  once paddle.argsort uses a stable algorithm
 #  https://github.com/PaddlePaddle/Paddle/issues/57508
@@ -2649,6 +2729,27 @@ def nms(
     max_output_size=None,
     score_threshold=float("-inf"),
 ):
+    """Perform greedy non-maximum suppression on a set of boxes.
+
+    Parameters
+    ----------
+    boxes
+        The boxes to suppress, in ``(x1, y1, x2, y2)`` format *[num_boxes, 4]*.
+    scores
+        The score of each box *[num_boxes]*. All boxes score equally if None.
+    iou_threshold
+        Boxes overlapping a higher scoring kept box by more than this intersection
+        over union are suppressed.
+    max_output_size
+        The maximum number of boxes to keep. Unlimited if None.
+    score_threshold
+        Boxes scoring no more than this are discarded before suppression.
+
+    Returns
+    -------
+    ret
+        The indices of the kept boxes, in decreasing order of score.
+    """
     change_id = False
     if score_threshold is not float("-inf") and scores is not None:
         keep_idx = scores > score_threshold
@@ -2665,45 +2766,55 @@ def nms(
         else:
             ret = ivy.array([], dtype=ivy.int64)
     else:
-        x1 = boxes[:, 0]
-        y1 = boxes[:, 1]
-        x2 = boxes[:, 2]
-        y2 = boxes[:, 3]
-
-        areas = (x2 - x1) * (y2 - y1)
-        order = ivy.argsort(
-            (-1 * scores), stable=True
-        )  # get boxes with more ious first
-        keep = []
-
-        while order.size > 0:
-            i = order[0]  # pick maxmum iou box
-            keep.append(i)
-            xx1 = ivy.maximum(x1[i], x1[order[1:]])
-            yy1 = ivy.maximum(y1[i], y1[order[1:]])
-            xx2 = ivy.minimum(x2[i], x2[order[1:]])
-            yy2 = ivy.minimum(y2[i], y2[order[1:]])
-
-            w = ivy.maximum(0.0, xx2 - xx1)  # maximum width
-            h = ivy.maximum(0.0, yy2 - yy1)  # maximum height
-            inter = w * h
-            ovr = inter / (areas[i] + areas[order[1:]] - inter)
-            inds = ivy.nonzero(ovr <= iou_threshold)[0]
-
-            order = order[inds + 1]
-
-        ret = ivy.array(keep)
-
-    if len(ret) > 1 and scores is not None:
-        ret = sorted(
-            ret.flatten().tolist(), reverse=True, key=lambda x: (scores[x], -x)
-        )
-        ret = ivy.array(ret, dtype=ivy.int64).flatten()
+        # boxes with more ious first, ties broken by index
+        order = ivy.argsort(-1 * scores, stable=True)
+        boxes = boxes[order]
+        areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        num_boxes = len(boxes)
+        max_keep = ivy.default(max_output_size, num_boxes)
+        kept_boxes, kept_areas, keep = boxes[:0], areas[:0], []
+
+        # greedy suppression, one tile of score-ordered boxes at a time
+        for start in range(0, num_boxes, _NMS_TILE_SIZE):
+            stop = min(start + _NMS_TILE_SIZE, num_boxes)
+            tile, tile_areas = boxes[start:stop], areas[start:stop]
+            # boxes suppressed by those kept in earlier tiles
+            candidates = ivy.logical_not(
+                ivy.any(
+                    _nms_suppression(
+                        kept_boxes, tile, kept_areas, tile_areas, iou_threshold
+                    ),
+                    axis=0,
+                )
+            )
+            # within the tile, each box is suppressed by the kept boxes before
+            # it; iterating to the fixed point reproduces the sequential pass
+            suppression = ivy.triu(
+                _nms_suppression(tile, tile, tile_areas, tile_areas, iou_threshold),
+                k=1,
+            )
+            tile_keep = candidates
+            while True:
+                suppressed = ivy.any(
+                    ivy.logical_and(suppression, ivy.expand_dims(tile_keep, axis=-1)),
+                    axis=0,
+                )
+                new_keep = ivy.logical_and(candidates, ivy.logical_not(suppressed))
+                if ivy.array_equal(new_keep, tile_keep):
+                    break
+                tile_keep = new_keep
+            kept_boxes = ivy.concat([kept_boxes, tile[tile_keep]], axis=0)
+            kept_areas = ivy.concat([kept_areas, tile_areas[tile_keep]], axis=0)
+            keep.append(ivy.nonzero(tile_keep)[0] + start)
+            if len(kept_boxes) >= max_keep:
+                break
+
+        ret = order[ivy.concat(keep, axis=0)]
 
     if change_id and len(ret) > 0:
-        ret = ivy.array(nonzero[ret], dtype=ivy.int64).flatten()
+        ret = nonzero[ret]
 
-    return ret.flatten()[:max_output_size]
+    return ivy.astype(ret, ivy.int64).flatten()[:max_output_size]
 
 
 nms.mixed_backend_wrappers = {
@@ -2715,3 +2826,67 @@ nms.mixed_backend_wrappers = {
     ),
     "to_skip": ("inputs_to_ivy_arrays",),
 }
+
+
+@handle_exceptions
+@handle_nestable
+@handle_array_like_without_promotion
+@inputs_to_ivy_arrays
+@handle_array_function
+def batched_nms(
+    boxes,
+    scores,
+    idxs,
+    iou_threshold=0.5,
+    max_output_size=None,
+    score_threshold=float("-inf"),
+):
+    """Perform non-maximum suppression independently for each group of boxes,
+    such as the boxes of each image or class in a batch.
+
+    Parameters
+    ----------
+    boxes
+        The boxes to suppress, in ``(x1, y1, x2, y2)`` format *[num_boxes, 4]*.
+    scores
+        The score of each box *[num_boxes]*.
+    idxs
+        The integer group of each box *[num_boxes]*. Boxes of different groups
+        never suppress each other.
+    iou_threshold
+        Boxes overlapping a higher scoring kept box of the same group by more than
+        this intersection over union are suppressed.
+    max_output_size
+        The maximum number of boxes to keep over all groups. Unlimited if None.
+    score_threshold
+        Boxes scoring no more than this are discarded before suppression.
+
+    Returns
+    -------
+    ret
+        The indices of the kept boxes, in decreasing order of score.
+    """
+    if len(boxes) == 0:
+        return ivy.array([], dtype=ivy.int64)
+    # shift each group into its own disjoint region, so a single suppression
+    # pass never lets boxes of different groups overlap
+    offsets = ivy.astype(idxs, boxes.dtype) * (ivy.max(boxes) - ivy.min(boxes) + 1)
+    boxes = boxes - ivy.min(boxes) + ivy.expand_dims(offsets, axis=-1)
+    return ivy.nms(
+        boxes,
+        scores,
+        iou_threshold=iou_threshold,
+        max_output_size=max_output_size,
+        score_threshold=score_threshold,
+    )
+
+
+batched_nms.mixed_backend_wrappers = {
+    "to_add": (
+        "handle_backend_invalid",
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_device",
+    ),
+    "to_skip": ("inputs_to_ivy_arrays",),
+}
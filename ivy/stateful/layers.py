@@ -199,6 +199,129 @@ class Dropout(Module):
 # ----------#
 
 
+class KVCache:
+    def __init__(
+        self,
+        num_slots,
+        max_length,
+        num_heads,
+        head_dim,
+        /,
+        *,
+        device=None,
+        dtype=None,
+    ):
+        """Preallocated key/value cache for incremental attention decoding.
+
+        The projected keys and values of every slot are kept in a ring buffer of
+        ``max_length`` positions, so memory is allocated once per session rather
+        than once per generated token. Once a slot wraps around, its tokens attend
+        to the most recent ``max_length`` positions only, and are appended one at a
+        time. Slots are independent sequences, and can be handed to new sequences
+        with :meth:`reset`.
+
+        Parameters
+        ----------
+        num_slots
+            Number of sequences (batch slots) the cache holds.
+        max_length
+            Number of positions stored per slot.
+        num_heads
+            Number of attention heads.
+        head_dim
+            Size of each attention head.
+        device
+            device on which to allocate the cache 'cuda:0', 'cuda:1', 'cpu' etc.
+        dtype
+            the data type of the cached keys and values.
+        """
+        self.num_slots = num_slots
+        self.max_length = max_length
+        shape = (num_slots, num_heads, max_length, head_dim)
+        self.keys = ivy.zeros(shape, device=device, dtype=dtype)
+        self.values = ivy.zeros(shape, device=device, dtype=dtype)
+        self.lengths = ivy.zeros((num_slots,), device=device, dtype="int64")
+        self._heads = ivy.arange(num_heads, device=device)
+
+    def _slot_indices(self, slots):
+        if slots is None:
+            return ivy.arange(self.num_slots, device=ivy.dev(self.lengths))
+        return ivy.array(slots, device=ivy.dev(self.lengths), dtype="int64")
+
+    def reset(self, slots=None):
+        """Empty the given slots (all by default) so they can hold new
+        sequences. The buffers themselves are left untouched.
+
+        Parameters
+        ----------
+        slots
+            Indices of the slots to reset. Default is all slots.
+        """
+        self.lengths[self._slot_indices(slots)] = 0
+
+    def update(self, keys, values, /, *, slots=None):
+        """Append new keys and values to the given slots.
+
+        Parameters
+        ----------
+        keys
+            projected keys of the new tokens *[num_slots,num_heads,num_new,head_dim]*.
+        values
+            projected values of the new tokens
+            *[num_slots,num_heads,num_new,head_dim]*.
+        slots
+            Indices of the slots the new tokens belong to. Default is all slots.
+            Several new tokens must fit in the remaining positions of each slot.
+
+        Returns
+        -------
+        ret
+            The cached keys and values of the given slots, and the boolean mask
+            *[num_slots,1,num_new,num_keys]* of the positions each new token may
+            attend to.
+        """
+        num_new = keys.shape[-2]
+        slot_idx = self._slot_indices(slots)
+        lengths = self.lengths if slots is None else self.lengths[slot_idx]
+        # the later tokens of a chunk would overwrite keys the earlier ones need
+        ivy.utils.assertions.check_false(
+            num_new > 1 and bool(ivy.any(lengths + num_new > self.max_length)),
+            "a chunk of several tokens cannot wrap around the cache, append it one "
+            "token at a time instead",
+        )
+        positions = ivy.expand_dims(lengths, axis=-1) + ivy.arange(
+            num_new, device=ivy.dev(lengths)
+        )
+        query = (
+            slot_idx[:, None, None],
+            self._heads[None, :, None],
+            (positions % self.max_length)[:, None, :],
+        )
+        self.keys[query] = keys
+        self.values[query] = values
+        lengths = lengths + num_new
+        self.lengths[slot_idx] = lengths
+
+        # only the filled prefix of the buffers needs attending to
+        num_keys = min(int(ivy.max(lengths)), self.max_length)
+        keys, values = (
+            x[..., :num_keys, :] if slots is None else x[slot_idx, :, :num_keys]
+            for x in (self.keys, self.values)
+        )
+        # absolute position of the token held at each cache position
+        cached = ivy.arange(num_keys, device=ivy.dev(lengths))
+        cached = cached + self.max_length * ivy.floor_divide(
+            lengths[:, None, None] - 1 - cached, self.max_length
+        )
+        positions = positions[..., None]
+        mask = (
+            (cached >= 0)
+            & (cached <= positions)
+            & (cached > positions - self.max_length)
+        )
+        return keys, values, ivy.expand_dims(mask, axis=1)
+
+
 class MultiHeadAttention(Module):
     def __init__(
         self,
@@ -441,6 +564,101 @@ class MultiHeadAttention(Module):
             training=self.training,
         )
 
+    def init_cache(self, num_slots, max_length, /, *, device=None, dtype=None):
+        """Allocate a key/value cache for decoding with this layer.
+
+        Parameters
+        ----------
+        num_slots
+            Number of sequences decoded side by side.
+        max_length
+            Number of positions stored per sequence.
+        device
+            device on which to allocate the cache. Default is the layer's device.
+        dtype
+            the data type of the cache. Default is the layer's dtype.
+
+        Returns
+        -------
+        ret
+            An empty :class:`KVCache` to pass to :meth:`decode`.
+        """
+        return KVCache(
+            num_slots,
+            max_length,
+            self._num_heads,
+            self._head_dim,
+            device=ivy.default(device, self.device),
+            dtype=ivy.default(dtype, self.v.out_proj_weights.dtype),
+        )
+
+    def decode(self, query, cache, /, *, key=None, value=None, slots=None):
+        """Attend from new tokens to themselves and the tokens cached so far.
+
+        Only the new tokens are projected; their keys and values are appended to
+        ``cache``, and each new token attends causally to its own sequence.
+
+        Parameters
+        ----------
+        query
+            query embeddings of the new tokens *[num_slots,num_new,query_dim]*.
+        cache
+            The :class:`KVCache` of the sequences being decoded, see
+            :meth:`init_cache`.
+        key
+            key embeddings of the new tokens *[num_slots,num_new,key_dim]*.
+            Default is ``query``.
+        value
+            value embeddings of the new tokens *[num_slots,num_new,value_dim]*.
+            Default is ``key``.
+        slots
+            Indices of the cache slots the rows of ``query`` belong to. Default is
+            all slots, in order.
+
+        Returns
+        -------
+        ret
+            The output following application of multi-head attention.
+            *[num_slots,num_new,out_feat_dim]*
+        """
+        key = ivy.default(key, query)
+        value = ivy.default(value, key)
+        if self._qkv_same_embed_dim:
+            weights = ivy.split(self.v.in_proj_weights, num_or_size_splits=3)
+        else:
+            weights = [self.v[f"{x}_proj_weights"] for x in "qkv"]
+        if self._use_proj_bias:
+            biases = ivy.split(self.v.in_proj_bias, num_or_size_splits=3)
+        else:
+            biases = [None] * 3
+        q, k, v = (
+            ivy.swapaxes(
+                ivy.linear(x, w, bias=b).reshape(
+                    (*x.shape[:-1], self._num_heads, self._head_dim)
+                ),
+                -2,
+                -3,
+            )
+            for x, w, b in zip((query, key, value), weights, biases)
+        )
+        k, v, mask = cache.update(k, v, slots=slots)
+        ret = ivy.scaled_dot_product_attention(
+            q,
+            k,
+            v,
+            scale=self._scale,
+            mask=mask,
+            dropout_p=self._dropout_rate,
+            training=self.training,
+        )
+        ret = ivy.swapaxes(ret, -2, -3)
+        ret = ret.reshape((*ret.shape[:-2], self._inner_dim))
+        return ivy.linear(
+            ret,
+            self.v.out_proj_weights,
+            bias=self.v.out_proj_bias if self._use_proj_bias else None,
+        )
+
 
 # Convolutions #
 # -------------#
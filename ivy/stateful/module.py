@@ -3,6 +3,7 @@
 # global
 from collections import OrderedDict
 import functools
+import io
 import os
 import abc
 import copy
@@ -13,7 +14,7 @@ from typing import Optional, Tuple, Dict
 import ivy
 from ivy.data_classes.container import Container
 from ivy.func_wrapper import _get_first_array
-from ivy.functional.ivy.gradients import _is_variable
+from ivy.functional.ivy.gradients import _is_variable, _variable
 from ivy.stateful.helpers import ModuleHelpers
 from ivy.stateful.converters import ModuleConverters
 
@@ -994,37 +995,77 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
 
         self._lazy_traced = False
 
-    def save(self, filename):
+    def save(self, filename, format="pickle"):
         """Save the module object to disk using pickle.
 
         Parameters
         ----------
         filename : str
             The name of the file to save the module object to.
+        format : str
+            ``"pickle"`` to pickle the whole module, or ``"mmap"`` to save the
+            variables as a memory-mapped container, with the rest of the module
+            pickled alongside them. Default is ``"pickle"``.
         """
+        ivy.utils.assertions.check_elem_in_list(format, ["pickle", "mmap"])
         if ivy.current_backend_str() == "paddle":
             self._convert_tensors_to_numpy()
-        with open(filename, "wb") as f:
-            dill.dump(self, f)
+        if format == "mmap":
+            # the variables are pickled as references to their key-chains
+            key_chains = {}
+            self.v.cont_map(
+                lambda x, kc: key_chains.setdefault(id(x), (kc, _is_variable(x)))
+            )
+            buffer = io.BytesIO()
+            pickler = dill.Pickler(buffer)
+            pickler.persistent_id = lambda obj: key_chains.get(id(obj))
+            pickler.dump(self)
+            self.v.cont_to_disk_as_mmap(filename, metadata=buffer.getvalue())
+        else:
+            with open(filename, "wb") as f:
+                dill.dump(self, f)
         if ivy.current_backend_str() == "paddle":
             self._convert_numpy_to_tensors()
 
     @staticmethod
-    def load(filename):
+    def load(filename, format="pickle"):
         """Load a module object from disk using pickle.
 
         Parameters
         ----------
         filename : str
             The name of the file to load the module object from.
+        format : str
+            The format the module was saved in, either ``"pickle"`` or ``"mmap"``.
+            Default is ``"pickle"``.
 
         Returns
         -------
         Module
             The loaded module object.
         """
-        with open(filename, "rb") as f:
-            loaded = dill.load(f)
+        ivy.utils.assertions.check_elem_in_list(format, ["pickle", "mmap"])
+        if format == "mmap":
+            v, metadata = ivy.Container.cont_from_disk_as_mmap(
+                filename, return_metadata=True
+            )
+            leaves, idx, _ = v.cont_flatten()
+            variables = {}
+
+            def _persistent_load(pid):
+                kc, is_variable = pid
+                if not is_variable:
+                    return leaves[idx[kc]]
+                if kc not in variables:
+                    variables[kc] = _variable(leaves[idx[kc]])
+                return variables[kc]
+
+            unpickler = dill.Unpickler(io.BytesIO(metadata))
+            unpickler.persistent_load = _persistent_load
+            loaded = unpickler.load()
+        else:
+            with open(filename, "rb") as f:
+                loaded = dill.load(f)
         if ivy.current_backend_str() == "paddle":
             loaded._convert_numpy_to_tensors()
         return loaded
@@ -3,17 +3,97 @@
 
 # global
 import abc
+import math
+import operator
 from typing import Union, Optional, Callable
 
+import numpy as np
+
 # local
 import ivy
 
 
+class _MultiTensorPacker:
+    # packs the leaves of containers which are structured like the variables into
+    # a container of one flat buffer per dtype and device, so that each optimizer
+    # step is a few ops per buffer rather than a few ops per variable
+    def __init__(self, v: ivy.Container):
+        leaves, idx, self.skeleton = v.cont_flatten()
+        self._structure = v._cont_structure_signature()
+        self.key_chains = list(idx)
+        groups = {}
+        for i, x in enumerate(leaves):
+            groups.setdefault((ivy.dtype(x), ivy.dev(x)), []).append(i)
+        self._groups = list(groups.values())
+        self._dtypes = [dtype for dtype, _ in groups]
+        self._devices = [dev for _, dev in groups]
+        self._shapes = [tuple(x.shape) for x in leaves]
+        self._sizes = [[math.prod(self._shapes[i]) for i in g] for g in self._groups]
+        self._segment_ids = [None] * len(self._groups)
+
+    def matches(self, v: ivy.Container):
+        # the key-chains and leaf types of the structure are cached on the container,
+        # only the shapes are read from the leaves
+        return v._cont_structure_signature() == self._structure
+
+    def pack(self, cont: ivy.Container):
+        leaves, idx, _ = cont.cont_flatten()
+        leaves = [leaves[idx[kc]] for kc in self.key_chains]
+        return ivy.Container({
+            f"group_{g}": ivy.concat([ivy.reshape(leaves[i], (-1,)) for i in group])
+            for g, group in enumerate(self._groups)
+        })
+
+    def packs_dtypes(self, packed: ivy.Container):
+        # whether each buffer kept the dtype of its leaves, rather than promoting
+        # leaves whose dtype changed without changing the structure
+        return all(
+            ivy.dtype(packed[f"group_{g}"]) == dtype
+            for g, dtype in enumerate(self._dtypes)
+        )
+
+    def unpack(self, packed: ivy.Container):
+        return ivy.Container.cont_unflatten(self.skeleton, self.unpack_leaves(packed))
+
+    def unpack_leaves(self, packed: ivy.Container):
+        # the leaves are views into the buffers, where the backend supports views
+        leaves = [None] * len(self._shapes)
+        for g, (group, sizes) in enumerate(zip(self._groups, self._sizes)):
+            buffer = packed[f"group_{g}"]
+            if len(group) > 1:
+                parts = ivy.split(buffer, num_or_size_splits=sizes)
+            else:
+                parts = [buffer]
+            for i, part in zip(group, parts):
+                leaves[i] = ivy.reshape(part, self._shapes[i])
+        return leaves
+
+    def leaf_norms(self, packed: ivy.Container):
+        # the norm of each variable, repeated over the elements of the variable
+        ret = {}
+        for g, sizes in enumerate(self._sizes):
+            if self._segment_ids[g] is None:
+                self._segment_ids[g] = ivy.array(
+                    np.repeat(np.arange(len(sizes)), sizes),
+                    dtype="int64",
+                    device=self._devices[g],
+                )
+            segment_ids = self._segment_ids[g]
+            norms = ivy.unsorted_segment_sum(
+                packed[f"group_{g}"] ** 2, segment_ids, len(sizes)
+            )
+            ret[f"group_{g}"] = ivy.gather(norms**0.5, segment_ids)
+        return ivy.Container(ret)
+
+
 # Base #
 # -----#
 
 
 class Optimizer(abc.ABC):
+    # names of the attributes holding state which is packed in multi-tensor mode
+    _packed_state = ()
+
     def __init__(
         self,
         lr: Union[float, Callable],
@@ -23,6 +103,7 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        multi_tensor: bool = False,
     ):
         """Construct a general Optimizer. This is an abstract class, and must
         be derived.
@@ -50,6 +131,11 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +148,14 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._multi_tensor = multi_tensor
+        self._packer = None
+        self._state_packed = False
+        # the packed variables of the last multi-tensor step, along with the leaves
+        # and the data of the leaves of the variables returned from it
+        self._packed_v = None
+        self._v_leaves = None
+        self._v_data = None
 
     # Private #
     # --------#
@@ -107,9 +201,78 @@ class Optimizer(abc.ABC):
             Default is ``False``
         """
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
+            return v.cont_set_at_keys(self._step_fn(v.cont_at_key_chains(grads), grads))
+        if self._multi_tensor:
+            packer, packed_v = self._get_packer(v)
+            packed_v = self._step(packed_v, packer.pack(grads))
+            leaves = packer.unpack_leaves(packed_v)
+            self._packed_v = packed_v
+            self._v_leaves = leaves
+            self._v_data = [x.data for x in leaves]
+            return ivy.Container.cont_unflatten(packer.skeleton, leaves)
         return self._step(v, grads)
 
+    def _get_packer(self, v: ivy.Container):
+        """Return the packer of containers structured like the variables, along
+        with the variables packed by it, and pack the optimizer state with it.
+
+        The buffers of the last step are reused if the variables are the ones
+        returned from it, and the packer is only rebuilt if the structure of the
+        variables has changed since the last step.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+
+        Returns
+        -------
+        ret
+            The packer of containers structured like the variables, and the packed
+            variables.
+        """
+        packed_v = self._last_packed(v)
+        if packed_v is None:
+            self._packed_v = self._v_leaves = self._v_data = None
+            if self._packer is not None and self._packer.matches(v):
+                packed_v = self._packer.pack(v)
+                if not self._packer.packs_dtypes(packed_v):
+                    packed_v = None
+        if packed_v is None:
+            for name in self._packed_state:
+                setattr(self, name, self._unpacked(getattr(self, name)))
+            self._packer = _MultiTensorPacker(v)
+            self._state_packed = False
+            packed_v = self._packer.pack(v)
+        if not self._state_packed:
+            for name in self._packed_state:
+                state = getattr(self, name)
+                if state is not None:
+                    setattr(self, name, self._packer.pack(state))
+            self._state_packed = True
+        return self._packer, packed_v
+
+    def _last_packed(self, v: ivy.Container):
+        # the packed variables of the last step, if the leaves of the variables are
+        # still the views into them which were returned from the last step
+        if self._v_leaves is None:
+            return None
+        leaves, idx, _ = v.cont_flatten()
+        if (
+            len(leaves) == len(self._v_leaves)
+            and all(map(operator.is_, leaves, self._v_leaves))
+            and all(x.data is data for x, data in zip(leaves, self._v_data))
+            and list(idx) == self._packer.key_chains
+        ):
+            return self._packed_v
+        return None
+
+    def _unpacked(self, state):
+        # the optimizer state is kept packed between multi-tensor steps
+        if self._state_packed and state is not None:
+            return self._packer.unpack(state)
+        return state
+
     # Public #
     # -------#
 
@@ -166,6 +329,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        multi_tensor: bool = False,
     ):
         """Construct a Stochastic-Gradient-Descent (SGD) optimizer.
 
@@ -183,9 +347,19 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            multi_tensor=multi_tensor,
         )
 
     # Custom Step
@@ -236,6 +410,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        multi_tensor: bool = False,
     ):
         """Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
 
@@ -255,10 +430,20 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            multi_tensor=multi_tensor,
         )
 
     # Custom Step
@@ -279,10 +464,20 @@ class LARS(Optimizer):
         ret
             The new updated variables container, following LARS step.
         """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        if self._multi_tensor:
+            # the layer-wise rates use the norm of each variable within the buffers
+            w_norm = self._packer.leaf_norms(v)
+            lr = ivy.stable_divide(w_norm * lr, self._packer.leaf_norms(grads))
+            if self._decay_lambda > 0:
+                lr /= w_norm * self._decay_lambda
+            return ivy.gradient_descent_update(
+                v, grads, lr, stop_gradients=self._stop_gradients
+            )
         return ivy.lars_update(
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
+            lr,
             decay_lambda=self._decay_lambda,
             stop_gradients=self._stop_gradients,
         )
@@ -303,6 +498,8 @@ class LARS(Optimizer):
 
 
 class Adam(Optimizer):
+    _packed_state = ("_mw", "_vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -313,6 +510,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        multi_tensor: bool = False,
     ):
         """Construct an ADAM optimizer.
 
@@ -340,6 +538,11 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -350,7 +553,14 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            multi_tensor=multi_tensor,
         )
 
     # Custom Step
@@ -400,10 +610,13 @@ class Adam(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        self._state_packed = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unpacked(self._mw), "vw": self._unpacked(self._vw)}
+        )
 
 
 class AdamW(Adam):
@@ -418,6 +631,7 @@ class AdamW(Adam):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        multi_tensor: bool = False,
     ):
         """Construct an ADAMW optimizer.
 
@@ -447,6 +661,11 @@ class AdamW(Adam):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         self._weight_decay = weight_decay
         super().__init__(
@@ -458,6 +677,7 @@ class AdamW(Adam):
             stop_gradients,
             trace_on_next_step,
             device,
+            multi_tensor,
         )
 
     def _step(self, v: ivy.Container, grads: ivy.Container):
@@ -484,6 +704,8 @@ class AdamW(Adam):
 
 
 class LAMB(Optimizer):
+    _packed_state = ("_mw", "_vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -496,6 +718,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        multi_tensor: bool = False,
     ):
         """Construct an LAMB optimizer.
 
@@ -528,9 +751,21 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        multi_tensor
+            Whether to pack the variables, gradients and optimizer state into one
+            flat buffer per dtype and device, and update all of the variables with a
+            few ops on these buffers, rather than with a few ops per variable.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            multi_tensor=multi_tensor,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -564,10 +799,32 @@ class LAMB(Optimizer):
             self._vw = grads**2
             self._first_pass = False
 
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        if self._multi_tensor:
+            # the trust ratios use the norm of each variable within the buffers
+            eff_grads, self._mw, self._vw = ivy.adam_step(
+                grads,
+                self._mw,
+                self._vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+            r1 = self._packer.leaf_norms(v)
+            if self._decay_lambda > 0:
+                r2 = self._packer.leaf_norms(eff_grads + self._decay_lambda * v)
+            else:
+                r2 = self._packer.leaf_norms(eff_grads)
+            r = ivy.minimum(ivy.stable_divide(r1, r2), ivy.array(self._max_trust_ratio))
+            return ivy.optimizer_update(
+                v, eff_grads, r * lr, stop_gradients=self._stop_gradients
+            )
+
         new_v, self._mw, self._vw = ivy.lamb_update(
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
+            lr,
             self._mw,
             self._vw,
             self._count,
@@ -590,7 +847,10 @@ class LAMB(Optimizer):
         """
         self._mw = state.mw
         self._vw = state.vw
+        self._state_packed = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unpacked(self._mw), "vw": self._unpacked(self._vw)}
+        )
@@ -6,7 +6,8 @@ import ivy
 import importlib
 import functools
 import numpy as np
-import gc
+import sys
+import time
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -23,6 +24,15 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+# fully wrapped namespaces of previously set backends, keyed by backend, backend
+# version and wrapping mode, mapping each updated module to its updated entries
+_backend_namespaces = {}
+_backend_switch_hooks = []
+# marks an entry which was deleted from the namespace of a module
+_DELETED = object()
+# backends whose from_dlpack accepts any object implementing __dlpack__, numpy is
+# excluded as the arrays it imports are read-only
+_dlpack_backends = ("jax", "torch")
 
 
 class ContextManager:
@@ -197,22 +207,33 @@ def current_backend(*args, **kwargs):
 
 
 def _set_module_backend(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    namespace=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    # record the updated entries of `target` so the namespace can be reused
+    updated = namespace.setdefault(target, {}) if namespace is not None else {}
     for k, v in original_dict.items():
+        if _is_global_prop(k, v):
+            continue
         compositional = k not in backend.__dict__
         if compositional:
             if k in invalid_dtypes and k in target.__dict__:
                 del target.__dict__[k]
+                updated[k] = _DELETED
                 continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
             key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
         )
+        updated[k] = target.__dict__[k]
         if (
             isinstance(v, types.ModuleType)
             and "ivy.functional." in v.__name__
@@ -224,9 +245,92 @@ def _set_module_backend(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                namespace=namespace,
             )
 
 
+def _backend_namespace_key(backend):
+    return (
+        backend.current_backend_str(),
+        backend.backend_version["version"],
+        ivy.fused_wrapper_mode,
+    )
+
+
+def _set_backend_namespace(backend):
+    """Update the ivy namespace with the wrapped functions of `backend`,
+    reusing the namespace built when `backend` was last set if there is one.
+
+    Returns
+    -------
+    ret
+        whether a previously built namespace was reused.
+    """
+    key = _backend_namespace_key(backend)
+    if key in _backend_namespaces:
+        for module, updated in _backend_namespaces[key].items():
+            for k, v in updated.items():
+                if v is _DELETED:
+                    module.__dict__.pop(k, None)
+                else:
+                    module.__dict__[k] = v
+        return True
+    namespace = {}
+    _set_module_backend(ivy_original_dict, ivy, backend, namespace=namespace)
+    _backend_namespaces[key] = namespace
+    return False
+
+
+def clear_backend_namespaces():
+    """Clear the wrapped namespaces cached for previously set backends, so the
+    next :func:`set_backend` call for each backend wraps its functions
+    again.
+    """
+    _backend_namespaces.clear()
+
+
+def add_backend_switch_hook(hook):
+    """Register a hook to be called after every backend switch.
+
+    The hook is called as ``hook(backend, latency, cached)``, with the name of
+    the backend which is now set (an empty string if no backend is set), the
+    time taken by the switch in seconds, and whether a previously built
+    namespace was reused.
+
+    Parameters
+    ----------
+    hook
+        the callable to register.
+    """
+    _backend_switch_hooks.append(hook)
+
+
+def remove_backend_switch_hook(hook):
+    """Remove a hook previously registered with
+    :func:`add_backend_switch_hook`.
+
+    Parameters
+    ----------
+    hook
+        the callable to remove.
+    """
+    if hook in _backend_switch_hooks:
+        _backend_switch_hooks.remove(hook)
+
+
+def _report_backend_switch(start_time, cached):
+    latency = time.perf_counter() - start_time
+    backend_str = backend_stack[-1].current_backend_str() if backend_stack else ""
+    for hook in list(_backend_switch_hooks):
+        hook(backend_str, latency, cached)
+
+
+def _is_global_prop(key, value):
+    # global properties are owned by their setters and unsetters, switching the
+    # backend must not roll them back to the values they had when it was set
+    return key in ivy.GLOBAL_PROPS and not callable(value)
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -234,7 +338,9 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
-def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
+def convert_from_source_backend_to_numpy(
+    variable_ids, numpy_objs, devices, target_backend=None
+):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
 
@@ -264,22 +370,9 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
                 return False
             return _is_variable(obj)
 
-    # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list, lambda x: isinstance(x, ivy.Array)
-    )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
+    # get all live ivy array instances, the arrays held by containers are tracked
+    # themselves, so the containers don't need to be searched
+    array_list = ivy.data_classes.array._get_live_arrays()
 
     # filter uninitialized arrays and arrays with other backends, and ensure the order
     array_list = [
@@ -303,6 +396,10 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
                 native_var = _variable_data(obj)
                 np_data = ivy.to_numpy(native_var)
 
+            elif target_backend in _dlpack_backends and hasattr(obj.data, "__dlpack__"):
+                # the target backend can import the native array directly
+                continue
+
             else:
                 np_data = obj.to_numpy()
 
@@ -314,6 +411,15 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     return variable_ids, numpy_objs, devices
 
 
+def _from_dlpack(obj, device):
+    try:
+        return current_backend().from_dlpack(obj.data)
+    except Exception:
+        # fall back to copying through numpy with the source backend
+        np_arr = ivy.with_backend(obj.backend).to_numpy(obj.data)
+        return current_backend().asarray(np_arr, device=device)
+
+
 def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _variable
@@ -332,6 +438,11 @@ def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
             )
             new_data = _variable(native_arr)
 
+        elif isinstance(obj, ivy.Array) and not isinstance(np_arr, np.ndarray):
+            # left as a native array of the source backend
+            obj.data = _from_dlpack(obj, device)
+            continue
+
         else:
             new_data = ivy.nested_map(
                 lambda x: current_backend().asarray(x, device=device),
@@ -374,6 +485,7 @@ def set_backend(backend: str, dynamic: bool = False):
         isinstance(backend, str) and backend not in _backend_dict,
         f"backend must be one from {list(_backend_dict.keys())}",
     )
+    start_time = time.perf_counter()
 
     variable_ids = set()  # create an empty set to store variable object ids
     numpy_objs = []  # create an empty list to store numpy objects
@@ -382,7 +494,12 @@ def set_backend(backend: str, dynamic: bool = False):
 
     if dynamic:
         variable_ids, numpy_objs, devices = convert_from_source_backend_to_numpy(
-            variable_ids, numpy_objs, devices
+            variable_ids,
+            numpy_objs,
+            devices,
+            target_backend=(
+                backend if isinstance(backend, str) else backend.current_backend_str()
+            ),
         )
 
     # update the global dict with the new backend
@@ -393,19 +510,24 @@ def set_backend(backend: str, dynamic: bool = False):
 
         _clear_current_sub_backends()
         if isinstance(backend, str):
-            temp_stack = []
-            while backend_stack:
-                temp_stack.append(previous_backend())
-            backend = importlib.import_module(_backend_dict[backend])
-            for fw in reversed(temp_stack):
-                backend_stack.append(fw)
+            if _backend_dict[backend] in sys.modules:
+                backend = sys.modules[_backend_dict[backend]]
+            else:
+                # the backend module needs to be imported with ivy's own
+                # implementations in the namespace
+                temp_stack = []
+                while backend_stack:
+                    temp_stack.append(previous_backend())
+                backend = importlib.import_module(_backend_dict[backend])
+                for fw in reversed(temp_stack):
+                    backend_stack.append(fw)
         if backend.current_backend_str() == "numpy":
             ivy.set_default_device("cpu")
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
         set_backend_to_specific_version(backend)
-        _set_module_backend(ivy_original_dict, ivy, backend)
+        cached = _set_backend_namespace(backend)
         # following snippet is required to update the ivy.functional namespace with
         # backend-specific functions
         for key, _ in ivy.__dict__.items():
@@ -419,6 +541,7 @@ def set_backend(backend: str, dynamic: bool = False):
         if verbosity.level > 0:
             verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
+    _report_backend_switch(start_time, cached)
     return ivy
 
 
@@ -503,6 +626,8 @@ def previous_backend():
     <class'tensorflow.python.framework.ops.EagerTensor'>
     """  # noqa
     backend = None
+    cached = False
+    start_time = time.perf_counter()
     # if the backend stack is empty, nothing is done then we just return `None`
     if backend_stack:
         backend = backend_stack.pop(-1)  # remove last backend from the stack
@@ -519,21 +644,34 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+        if backend_stack and _backend_namespace_key(backend_stack[-1]) in (
+            _backend_namespaces
+        ):
+            # swap in the namespace built when the backend was set
+            cached = _set_backend_namespace(backend_stack[-1])
+            for k, v in ivy.__dict__.items():
+                if k in ivy.functional.__dict__ and not k.startswith("__"):
+                    ivy.functional.__dict__[k] = v
+        else:
+            new_backend_dict = (
+                backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
+            )
+            # wrap backend functions if there still is a backend, and add
+            # functions to ivy namespace
+            for k, v in new_backend_dict.items():
+                if _is_global_prop(k, v):
+                    continue
+                if backend_stack and k in ivy_original_dict:
+                    v = _wrap_function(k, v, ivy_original_dict[k])
+                if k in ivy_original_dict:
+                    ivy.__dict__[k] = v
+                if k in ivy.functional.__dict__ and not k.startswith("__"):
+                    ivy.functional.__dict__[k] = v
     if verbosity.level > 0:
         verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
+    if backend is not None:
+        _report_backend_switch(start_time, cached)
     return backend
 
 
@@ -1,6 +1,7 @@
 """Collection of tests for unified device functions."""
 
 # global
+import gc
 import io
 import multiprocessing
 import os
@@ -330,6 +331,31 @@ def test_get_all_ivy_arrays_on_dev(
             assert id(a) in arr_ids_on_dev
 
 
+# the live arrays are tracked by weak references, and drop out once collected
+@handle_test(fn_tree="functional.ivy.get_all_ivy_arrays_on_dev")
+def test_get_all_ivy_arrays_on_dev_collected(backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        device = ivy_backend.default_device()
+        x = ivy_backend.array([1.0, 2.0], device=device)
+        y = ivy_backend.array([3.0], device=device)
+        live_arrays = ivy_backend.data_classes.array._get_live_arrays()
+        assert any(a is x for a in live_arrays)
+        assert any(a is y for a in live_arrays)
+        arrays_on_dev = ivy_backend.get_all_ivy_arrays_on_dev(device)
+        assert arrays_on_dev[str(id(x))] is x
+        assert arrays_on_dev[str(id(y))] is y
+
+        y_id = id(y)
+        del live_arrays, arrays_on_dev, y
+        gc.collect()
+        live_arrays = ivy_backend.data_classes.array._get_live_arrays()
+        assert any(a is x for a in live_arrays)
+        assert all(id(a) != y_id for a in live_arrays)
+        arrays_on_dev = ivy_backend.get_all_ivy_arrays_on_dev(device)
+        assert str(id(x)) in arrays_on_dev
+        assert str(y_id) not in arrays_on_dev
+
+
 @handle_test(fn_tree="gpu_is_available")
 def test_gpu_is_available(backend_fw):
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
@@ -526,6 +552,8 @@ def test_profiler(*, backend_fw):
     dtype=helpers.get_dtypes("numeric", full=False),
     chunk_size=helpers.ints(min_value=1, max_value=3),
     axis=_axis(),
+    num_workers=helpers.ints(min_value=0, max_value=2),
+    preallocate=st.booleans(),
 )
 def test_split_func_call(
     *,
@@ -533,6 +561,8 @@ def test_split_func_call(
     dtype,
     chunk_size,
     axis,
+    num_workers,
+    preallocate,
     test_flags,
     backend_fw,
 ):
@@ -553,12 +583,38 @@ def test_split_func_call(
 
         # predictions
         a, b, c = ivy_backend.split_func_call(
-            func, [x1, x2], "concat", chunk_size=chunk_size, input_axes=axis
+            func,
+            [x1, x2],
+            "concat",
+            chunk_size=chunk_size,
+            input_axes=axis,
+            num_workers=num_workers,
+            preallocate=preallocate,
         )
 
         # true
         a_true, b_true, c_true = func(x1, x2)
 
+        # lazy chunks
+        chunks = list(
+            ivy_backend.split_func_call(
+                func,
+                [x1, x2],
+                "concat",
+                chunk_size=chunk_size,
+                input_axes=axis,
+                lazy=True,
+            )
+        )
+        assert len(chunks) == -(-shape[axis] // chunk_size)
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(
+                ivy_backend.concat([ch[0] for ch in chunks], axis=axis)
+            ),
+            ivy_backend.to_numpy(a_true),
+            backend=backend_fw,
+        )
+
         # value test
         helpers.assert_all_close(
             ivy_backend.to_numpy(a), ivy_backend.to_numpy(a_true), backend=backend_fw
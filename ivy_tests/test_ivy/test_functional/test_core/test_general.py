@@ -524,6 +524,43 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_lru():
+    def func(x, scale=1):
+        return x * scale
+
+    # arrays are matched by identity by default
+    cached_fn = ivy.cache_fn(func, max_size=3)
+    x = ivy.array([1.0, 2.0])
+    ret0 = cached_fn(x)
+    assert cached_fn(x) is ret0
+    assert cached_fn(ivy.array([1.0, 2.0])) is not ret0
+    # wrappers with another max_size don't share the cache
+    assert ivy.cache_fn(func, max_size=3).cache_info()["hits"] == 1
+    assert ivy.cache_fn(func, max_size=2).cache_info()["hits"] == 0
+    assert cached_fn.cache_info()["max_size"] == 3
+
+    cached_fn = ivy.cache_fn(func, max_size=2, hash_arrays=True)
+    ret0 = cached_fn(x, scale=2)
+    # arrays with equal contents share an entry
+    assert cached_fn(ivy.array([1.0, 2.0]), scale=2) is ret0
+    # arrays with equal str representations but different contents do not
+    big = ivy.zeros(2000)
+    big_changed = ivy.concat([ivy.zeros(1000), ivy.ones(1), ivy.zeros(999)])
+    assert str(big) == str(big_changed)
+    assert cached_fn(big) is not cached_fn(big_changed)
+    assert cached_fn.cache_info() == {
+        "hits": 1,
+        "misses": 3,
+        "size": 2,
+        "max_size": 2,
+    }
+    # the least recently used entry was evicted
+    assert cached_fn(x, scale=2) is not ret0
+    cached_fn.cache_clear()
+    assert cached_fn.cache_info()["size"] == 0
+    assert ivy.cache_fn(func).cache_info()["max_size"] == 1024
+
+
 # clip_matrix_norm
 @handle_test(
     fn_tree="functional.ivy.clip_matrix_norm",
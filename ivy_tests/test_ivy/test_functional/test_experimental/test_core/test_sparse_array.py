@@ -1,11 +1,11 @@
 # global
-from hypothesis import strategies as st
+from hypothesis import given, strategies as st
 
 # local
 import ivy
 import numpy as np
 import ivy_tests.test_ivy.helpers as helpers
-from ivy_tests.test_ivy.helpers import handle_method
+from ivy_tests.test_ivy.helpers import handle_method, BackendHandler
 
 
 # --- Helpers --- #
@@ -96,6 +96,17 @@ def _sparse_bsr_indices_values_shape(draw):
     return crow_indices, col_indices, value_dtype, values, shape
 
 
+@st.composite
+def _sparse_coo_and_dense_operand(draw):
+    coo_indices, value_dtype, values, shape = draw(_sparse_coo_indices_values_shape())
+    dense_operand = draw(
+        helpers.array_values(
+            dtype="float32", shape=(shape[1], 3), min_value=-1, max_value=1
+        )
+    )
+    return coo_indices, value_dtype, values, shape, dense_operand
+
+
 @st.composite
 def _sparse_coo_indices_values_shape(draw):
     num_elem = draw(helpers.ints(min_value=2, max_value=8))
@@ -218,6 +229,45 @@ def test_array_add_sparse(
     assert isinstance(res, array_class)
 
 
+# bsr, bsc - block order
+def test_sparse_block_order(backend_fw):
+    # the values of each block are laid out row-major
+    values = np.arange(1, 9).reshape((2, 2, 2))
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        bsr = ivy_backend.sparse_array.SparseArray(
+            crow_indices=ivy_backend.array([0, 1, 2], dtype="int64"),
+            col_indices=ivy_backend.array([1, 0], dtype="int64"),
+            values=ivy_backend.array(values),
+            dense_shape=[4, 4],
+            format="bsr",
+        )
+        bsc = ivy_backend.sparse_array.SparseArray(
+            ccol_indices=ivy_backend.array([0, 1, 2], dtype="int64"),
+            row_indices=ivy_backend.array([1, 0], dtype="int64"),
+            values=ivy_backend.array(values),
+            dense_shape=[4, 4],
+            format="bsc",
+        )
+        expected_bsr = np.array(
+            [[0, 0, 1, 2], [0, 0, 3, 4], [5, 6, 0, 0], [7, 8, 0, 0]]
+        )
+        expected_bsc = np.array(
+            [[0, 0, 5, 6], [0, 0, 7, 8], [1, 2, 0, 0], [3, 4, 0, 0]]
+        )
+        for sparse_inst, expected in ((bsr, expected_bsr), (bsc, expected_bsc)):
+            assert np.array_equal(
+                ivy_backend.to_numpy(sparse_inst.to_dense_array()), expected
+            )
+            for converted in (
+                sparse_inst.to_coo(),
+                sparse_inst.to_csr(),
+                sparse_inst.to_csc(),
+            ):
+                assert np.array_equal(
+                    ivy_backend.to_numpy(converted.to_dense_array()), expected
+                )
+
+
 # bsc - to_dense_array
 @handle_method(
     method_tree="SparseArray.to_dense_array",
@@ -410,3 +460,81 @@ def test_sparse_csr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# csr - to_coo, to_csc
+@given(sparse_data=_sparse_csr_indices_values_shape())
+def test_sparse_format_conversions(
+    sparse_data,
+    backend_fw,
+):
+    crow_indices, col_indices, value_dtype, values, shape = sparse_data
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        sparse_inst = ivy_backend.sparse_array.SparseArray(
+            crow_indices=crow_indices,
+            col_indices=col_indices,
+            values=ivy_backend.array(values, dtype=value_dtype),
+            dense_shape=shape,
+            format="csr",
+        )
+        dense = ivy_backend.to_numpy(sparse_inst.to_dense_array())
+        coo = sparse_inst.to_coo()
+        csc = coo.to_csc()
+        csr = csc.to_csr()
+        assert (coo.format, csc.format, csr.format) == ("coo", "csc", "csr")
+        for converted in (coo, csc, csr):
+            helpers.assert_all_close(
+                ivy_backend.to_numpy(converted.to_dense_array()),
+                dense,
+                backend=backend_fw,
+            )
+
+
+# coo - sparse_matmul, sparse_sum, sparse_mean, sparse_multiply
+@given(
+    sparse_data=_sparse_coo_and_dense_operand(),
+    axis=st.sampled_from([None, 0, 1, -1]),
+)
+def test_sparse_ops(
+    sparse_data,
+    axis,
+    backend_fw,
+):
+    coo_ind, val_dtype, val, shp, x2 = sparse_data
+    coo_ind = np.minimum(coo_ind, np.array(shp)[:, None] - 1)
+    val = np.asarray(val, dtype="float32")
+    dense = np.zeros(shp, dtype="float32")
+    np.add.at(dense, tuple(coo_ind), val)
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        sparse_inst = ivy_backend.sparse_array.SparseArray(
+            coo_indices=coo_ind,
+            values=ivy_backend.array(val),
+            dense_shape=shp,
+            format="coo",
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(
+                ivy_backend.sparse_matmul(sparse_inst, ivy_backend.array(x2))
+            ),
+            dense @ x2,
+            backend=backend_fw,
+            atol=1e-4,
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(ivy_backend.sparse_sum(sparse_inst, axis=axis)),
+            np.sum(dense, axis=axis),
+            backend=backend_fw,
+            atol=1e-4,
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(ivy_backend.sparse_mean(sparse_inst, axis=axis)),
+            np.mean(dense, axis=axis),
+            backend=backend_fw,
+            atol=1e-4,
+        )
+        ret = ivy_backend.sparse_multiply(sparse_inst, ivy_backend.array(x2[:, 0]))
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(ret.values),
+            val * x2[:, 0][coo_ind[1]],
+            backend=backend_fw,
+        )
@@ -2,8 +2,10 @@
 
 # global
 from hypothesis import strategies as st, assume
+import importlib
 import ivy
 import numpy as np
+import pytest
 
 
 # local
@@ -1195,6 +1197,61 @@ def test_conv_general_dilated(
     )
 
 
+@pytest.mark.parametrize("chunked", [False, True])
+@pytest.mark.parametrize("feature_group_count", [1, 2, 4])
+@pytest.mark.parametrize("dims", [1, 2, 3])
+def test_conv_general_dilated_reference(
+    dims, feature_group_count, chunked, on_device, backend_fw, monkeypatch
+):
+    if chunked:
+        # one sample per chunk of the numpy im2col convolution
+        monkeypatch.setattr(
+            importlib.import_module("ivy.functional.backends.numpy.layers"),
+            "_CONV_CHUNK_BYTES",
+            1,
+        )
+    rng = np.random.default_rng(0)
+    strides = [1, 2, 1][:dims]
+    x = rng.standard_normal((3, *[7, 6, 5][:dims], 4))
+    filters = rng.standard_normal((*[3, 2, 2][:dims], 4 // feature_group_count, 8))
+    out_shape = [
+        (n - k) // s + 1 for n, k, s in zip(x.shape[1:], filters.shape, strides)
+    ]
+    expected = np.zeros((3, *out_shape, 8))
+    in_group, out_group = 4 // feature_group_count, 8 // feature_group_count
+    for pos in np.ndindex(*out_shape):
+        window = tuple(
+            slice(p * s, p * s + k) for p, s, k in zip(pos, strides, filters.shape)
+        )
+        for g in range(feature_group_count):
+            expected[(slice(None), *pos, slice(g * out_group, (g + 1) * out_group))] = (
+                np.tensordot(
+                    x[(slice(None), *window, slice(g * in_group, (g + 1) * in_group))],
+                    filters[..., g * out_group : (g + 1) * out_group],
+                    axes=dims + 1,
+                )
+            )
+    with ivy.utils.backend.ContextManager(backend_fw):
+        ret = ivy.conv_general_dilated(
+            ivy.array(x, dtype="float64", device=on_device),
+            ivy.array(filters, dtype="float64", device=on_device),
+            strides,
+            "VALID",
+            dims=dims,
+            feature_group_count=feature_group_count,
+        )
+        assert np.allclose(ivy.to_numpy(ret), expected)
+        if dims == 2 and feature_group_count == 4:
+            # one filter per channel
+            ret = ivy.depthwise_conv2d(
+                ivy.array(x, dtype="float64", device=on_device),
+                ivy.array(filters[:, :, 0, ::2], dtype="float64", device=on_device),
+                strides,
+                "VALID",
+            )
+            assert np.allclose(ivy.to_numpy(ret), expected[..., ::2])
+
+
 @handle_test(
     fn_tree="functional.ivy.conv_general_transpose",
     dims=st.shared(st.integers(1, 3), key="dims"),
@@ -1373,6 +1430,61 @@ def test_lstm_update(*, dtype_lstm, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+@pytest.mark.parametrize("with_bias", [False, True])
+@pytest.mark.parametrize("batch_shape", [(), (2, 3)])
+def test_lstm_update_long_sequence(batch_shape, with_bias, on_device, backend_fw):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((*batch_shape, 200, 3))
+    h, c = (rng.standard_normal((*batch_shape, 4)) for _ in range(2))
+    kernel, recurrent_kernel = (rng.standard_normal((n, 16)) for n in (3, 4))
+    bias, recurrent_bias = (
+        (rng.standard_normal(16) for _ in range(2)) if with_bias else (None, None)
+    )
+    ivy_args = [x, h, c, kernel, recurrent_kernel, bias, recurrent_bias]
+
+    def sigmoid(z):
+        return 1 / (1 + np.exp(-z))
+
+    hs = []
+    for t in range(x.shape[-2]):
+        gates = x[..., t, :] @ kernel + h @ recurrent_kernel
+        if with_bias:
+            gates = gates + bias + recurrent_bias
+        i, f, g, o = np.split(gates, 4, axis=-1)
+        c = sigmoid(f) * c + sigmoid(i) * np.tanh(g)
+        h = sigmoid(o) * np.tanh(c)
+        hs.append(h)
+    with ivy.utils.backend.ContextManager(backend_fw):
+        x, h_0, c_0, kernel, recurrent_kernel, bias, recurrent_bias = (
+            None if a is None else ivy.array(a, dtype="float64", device=on_device)
+            for a in ivy_args
+        )
+        ret_h, ret_c = ivy.lstm_update(
+            x,
+            h_0,
+            c_0,
+            kernel,
+            recurrent_kernel,
+            bias=bias,
+            recurrent_bias=recurrent_bias,
+        )
+        assert np.allclose(ivy.to_numpy(ret_h), np.stack(hs, axis=-2))
+        assert np.allclose(ivy.to_numpy(ret_c), c)
+
+        # without any timesteps, the initial cell state is the last one
+        ret_h, ret_c = ivy.lstm_update(
+            x[..., :0, :],
+            h_0,
+            c_0,
+            kernel,
+            recurrent_kernel,
+            bias=bias,
+            recurrent_bias=recurrent_bias,
+        )
+        assert ivy.is_array(ret_h) and tuple(ret_h.shape) == (*batch_shape, 0, 4)
+        assert np.allclose(ivy.to_numpy(ret_c), ivy.to_numpy(c_0))
+
+
 # multi_head_attention
 @handle_test(
     fn_tree="functional.ivy.multi_head_attention",
@@ -1484,6 +1596,40 @@ def test_nms(
     )
 
 
+# batched_nms
+@pytest.mark.parametrize("max_output_size", [None, 5])
+def test_batched_nms(max_output_size, on_device, backend_fw):
+    rng = np.random.default_rng(0)
+    corners = rng.random((600, 2)) * 100
+    boxes = np.concatenate([corners, corners + rng.random((600, 2)) * 20 + 1], axis=1)
+    scores = rng.random(600)
+    idxs = rng.integers(0, 4, 600)
+    with ivy.utils.backend.ContextManager(backend_fw):
+        boxes, scores, idxs = (
+            ivy.array(x, device=on_device) for x in (boxes, scores, idxs)
+        )
+        ret = ivy.to_numpy(
+            ivy.batched_nms(
+                boxes,
+                scores,
+                idxs,
+                iou_threshold=0.3,
+                max_output_size=max_output_size,
+                score_threshold=0.1,
+            )
+        )
+        expected = []
+        for i in range(4):
+            group = np.nonzero(ivy.to_numpy(idxs) == i)[0]
+            group_keep = ivy.nms(
+                boxes[group], scores[group], iou_threshold=0.3, score_threshold=0.1
+            )
+            expected += group[ivy.to_numpy(group_keep)].tolist()
+        scores = ivy.to_numpy(scores)
+    expected = sorted(expected, key=lambda i: -scores[i])[:max_output_size]
+    assert ret.tolist() == expected
+
+
 @handle_test(
     fn_tree="functional.ivy.roi_align",
     inputs=_roi_align_helper(),
@@ -1562,3 +1708,42 @@ def test_scaled_dot_product_attention(
         is_causal=is_causal,
         training=training,
     )
+
+
+@pytest.mark.parametrize("masking", ["none", "mask", "causal"])
+def test_scaled_dot_product_attention_chunked(
+    masking, on_device, backend_fw, monkeypatch
+):
+    monkeypatch.setattr(ivy.functional.ivy.layers, "_SDPA_KEY_CHUNK_SIZE", 4)
+    rng = np.random.default_rng(0)
+    query, key, value = (rng.standard_normal((2, 9, 5)) for _ in range(3))
+    mask = rng.random((2, 9, 9)) > 0.3 if masking == "mask" else None
+    sim = np.einsum("bqf,bkf->bqk", query, key) / np.sqrt(5)
+    if masking == "causal":
+        mask = np.tril(np.ones((9, 9), dtype=bool))
+    if mask is not None:
+        sim = np.where(mask, sim, np.finfo(sim.dtype).min)
+    attn = np.exp(sim - sim.max(axis=-1, keepdims=True))
+    expected = np.einsum("bqk,bkf->bqf", attn / attn.sum(-1, keepdims=True), value)
+    with ivy.utils.backend.ContextManager(backend_fw):
+        ret = ivy.scaled_dot_product_attention(
+            ivy.array(query, dtype="float64", device=on_device),
+            ivy.array(key, dtype="float64", device=on_device),
+            ivy.array(value, dtype="float64", device=on_device),
+            mask=(ivy.array(mask, device=on_device) if masking == "mask" else None),
+            is_causal=masking == "causal",
+        )
+        assert np.allclose(ivy.to_numpy(ret), expected)
+
+
+def test_scaled_dot_product_attention_mask_and_causal(on_device, backend_fw):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        x = ivy.ones((2, 3, 4), device=on_device)
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            ivy.scaled_dot_product_attention(
+                x,
+                x,
+                x,
+                mask=ivy.ones((2, 3, 3), dtype="bool", device=on_device),
+                is_causal=True,
+            )
@@ -7,6 +7,7 @@ import numpy as np
 
 # local
 import ivy
+from ivy.utils.backend import handler
 from ivy.utils.backend.handler import _backend_dict
 
 # TODO fix due to refactor
@@ -48,6 +49,31 @@ available_frameworks_with_none = _available_frameworks()[:]
 backends = list(_backend_dict.keys())
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_backend_switch_hook(backend):
+    switches = []
+
+    def _hook(backend_str, latency, cached):
+        switches.append((backend_str, cached))
+        assert latency >= 0
+
+    ivy.unset_backend()
+    ivy.clear_backend_namespaces()
+    ivy.add_backend_switch_hook(_hook)
+    ivy.set_backend(backend)
+    ivy.previous_backend()
+    ivy.set_backend(backend)
+    ivy.remove_backend_switch_hook(_hook)
+    # the namespace built by the first switch is reused by the second
+    assert switches == [(backend, False), ("", False), (backend, True)]
+    x = ivy.array([1.0, 2.0, 3.0])
+    assert np.allclose(ivy.to_numpy(ivy.sum(x)), 6.0)
+    ivy.previous_backend()
+    ivy.set_backend(backend)
+    assert len(switches) == 3
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize("excluded", available_frameworks_with_none)
 def test_choose_random_backend(excluded):
     backend = ivy.choose_random_backend(excluded=excluded)
@@ -154,6 +180,55 @@ def test_dynamic_backend_context_manager():
     assert d.dynamic_backend is False
 
 
+@pytest.mark.parametrize(
+    ("source_backend", "target_backend"),
+    [
+        (a, b)
+        for a in _available_frameworks()
+        for b in _available_frameworks()
+        if a != b and b in handler._dlpack_backends
+    ],
+)
+@pytest.mark.parametrize("dlpack_fails", [False, True])
+def test_dynamic_backend_dlpack(
+    source_backend, target_backend, dlpack_fails, monkeypatch
+):
+    # clear the backend stack
+    ivy.unset_backend()
+
+    ivy.set_backend(source_backend)
+    a = ivy.array([1.0, 2.0, 3.0])
+    has_dlpack = hasattr(a.data, "__dlpack__")
+
+    # record the arrays which are passed to the target backend over dlpack
+    dlpack_arrays = []
+    from_dlpack = handler._from_dlpack
+
+    def _from_dlpack(obj, device):
+        dlpack_arrays.append(obj)
+        return from_dlpack(obj, device)
+
+    monkeypatch.setattr(handler, "_from_dlpack", _from_dlpack)
+    if dlpack_fails:
+
+        def _failing_from_dlpack(x, /, *, out=None):
+            raise BufferError
+
+        monkeypatch.setattr(
+            importlib.import_module(_backend_dict[target_backend]),
+            "from_dlpack",
+            _failing_from_dlpack,
+        )
+
+    ivy.set_backend(target_backend, dynamic=True)
+
+    # arrays which implement __dlpack__ skip the copy through numpy, and fall
+    # back to it if the target backend can't import them
+    assert any(obj is a for obj in dlpack_arrays) == has_dlpack
+    assert isinstance(a.data, ivy.current_backend().NativeArray)
+    assert np.allclose(ivy.to_numpy(a), [1.0, 2.0, 3.0])
+
+
 def test_dynamic_backend_setter():
     a = ivy.array([1, 2, 3])
     type_a = type(a.data)
@@ -212,6 +287,10 @@ def test_previous_backend(backend):
     available_array_types_class,
 )
 def test_set_backend(backend, array_type):
+    # the namespaces cached for backends set before are cleared, so that the
+    # functions are wrapped again
+    ivy.clear_backend_namespaces()
+
     # recording data before backend change
     stack_before = []
     func_address_before = id(ivy.sum)
@@ -223,6 +302,11 @@ def test_set_backend(backend, array_type):
     ivy.utils.assertions.check_equal(
         func_address_before, id(ivy.sum), inverse=True, as_array=False
     )
+    # setting the backend again reuses its cached namespace, with the same functions
+    func_address_set = id(ivy.sum)
+    ivy.set_backend(backend)
+    ivy.utils.assertions.check_equal(func_address_set, id(ivy.sum), as_array=False)
+    ivy.previous_backend()
     # using ivy assertions to ensure the desired backend is set
     ivy.utils.assertions.check_less(len(stack_before), len(stack_after), as_array=False)
     ivy.utils.assertions.check_equal(ivy.current_backend_str(), backend, as_array=False)
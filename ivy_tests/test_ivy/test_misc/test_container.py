@@ -5,6 +5,7 @@ import pytest
 import random
 import numpy as np
 import multiprocessing
+import multiprocessing.resource_tracker
 import pickle
 
 # local
@@ -855,6 +856,51 @@ def test_container_diff(on_device):
     assert container_diff_same_only.cont_to_dict() == {}
 
 
+def test_container_diff_vectorized(on_device):
+    container_0 = Container(
+        {
+            "a": ivy.array([1, 2], device=on_device),
+            "b": {
+                "c": ivy.array([[2.0, 3.0]], device=on_device),
+                "d": ivy.array([3], device=on_device),
+                "e": "string",
+            },
+        }
+    )
+    container_1 = Container(
+        {
+            "a": ivy.array([1, 2], device=on_device),
+            "b": {
+                "c": ivy.array([[2.0, 4.0]], device=on_device),
+                "d": ivy.array([6], device=on_device),
+                "e": "string",
+            },
+        }
+    )
+    for mode in ["all", "diff_only", "same_only"]:
+        container_diff = ivy.Container.cont_diff(
+            container_0, container_1, container_0, mode=mode, vectorized=True
+        )
+        expected = ivy.Container.cont_diff(
+            container_0, container_1, container_0, mode=mode
+        )
+        assert ivy.Container.cont_identical_structure([container_diff, expected])
+        assert ivy.Container.cont_identical(
+            [container_diff, expected], same_arrays=False
+        )
+    container_diff = ivy.Container.cont_diff(container_0, container_1, vectorized=True)
+    assert np.array_equal(ivy.to_numpy(container_diff.a), np.array([1, 2]))
+    assert np.allclose(ivy.to_numpy(container_diff.b.c.diff_1), np.array([[2.0, 4.0]]))
+    assert np.equal(ivy.to_numpy(container_diff.b.d.diff_0), np.array([3]))
+    assert container_diff.b.e == "string"
+
+    # containers whose leaves don't line up are diffed leaf by leaf
+    reordered = Container({"b": container_1["b"], "a": container_1["a"]})
+    container_diff = ivy.Container.cont_diff(container_0, reordered, vectorized=True)
+    assert np.array_equal(ivy.to_numpy(container_diff.a), np.array([1, 2]))
+    assert np.equal(ivy.to_numpy(container_diff.b.d.diff_1), np.array([6]))
+
+
 def test_container_duplicate_array_keychains(on_device):
     arr1 = ivy.array([1], device=on_device)
     arr2 = ivy.array([2], device=on_device)
@@ -929,6 +975,47 @@ def test_container_find_sub_structure(on_device):
     assert found_kc == ""
 
 
+def test_container_flatten(on_device):
+    dict_in = {
+        "a": ivy.array([1], device=on_device),
+        "b": {
+            "c": ivy.array([2], device=on_device),
+            "d": ivy.array([3], device=on_device),
+        },
+    }
+    container = Container(dict_in)
+    leaves, idx, _ = container.cont_flatten()
+    assert list(idx) == ["a", "b/c", "b/d"]
+    assert leaves[idx["b/c"]] is container.b.c
+    # the flattened view is cached until the container is modified
+    assert container.cont_flatten()[0] is leaves
+    assert container.cont_at_key_chain("b.d") is container.b.d
+    container.b.c = ivy.array([4], device=on_device)
+    leaves, idx, _ = container.cont_flatten()
+    assert leaves[idx["b/c"]] is container.b.c
+    assert np.allclose(ivy.to_numpy(container.cont_at_key_chain("b/c")), [4])
+    del container.b["d"]
+    assert container.cont_all_key_chains() == ["a", "b/c"]
+    mapped = container.cont_map(lambda x, kc: x + 1)
+    assert np.allclose(ivy.to_numpy(mapped.b.c), [5])
+    assert mapped.cont_config == container.cont_config
+    leaves, _, skeleton = container.cont_flatten()
+    rebuilt = Container.cont_unflatten(skeleton, [x * 2 for x in leaves])
+    assert rebuilt.cont_all_key_chains() == ["a", "b/c"]
+    assert np.allclose(ivy.to_numpy(rebuilt.b.c), [8])
+    assert rebuilt.cont_config == container.cont_config
+    # modifying a container only invalidates the views which include it
+    other = Container({"e": ivy.array([5], device=on_device)})
+    other_leaves = other.cont_flatten()[0]
+    sub_leaves = container.b.cont_flatten()[0]
+    container.a = ivy.array([6], device=on_device)
+    assert other.cont_flatten()[0] is other_leaves
+    assert container.b.cont_flatten()[0] is sub_leaves
+    container.b.c = ivy.array([7], device=on_device)
+    assert container.b.cont_flatten()[0] is not sub_leaves
+    assert np.allclose(ivy.to_numpy(container.cont_at_key_chain("b/c")), [7])
+
+
 def test_container_flatten_key_chains(on_device):
     container = Container(
         {
@@ -1506,6 +1593,50 @@ def test_container_inplace(on_device):
             assert og_ids == op_ids  # value ids
 
 
+def test_container_iter_leaves(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": ivy.array([3], device=on_device),
+            },
+        }
+    )
+    leaves = container.cont_iter_leaves()
+    assert not isinstance(leaves, (list, dict))
+    assert [kc for kc, _ in leaves] == ["a", "b/c", "b/d"]
+    assert [kc for kc, _ in container.cont_iter_leaves(["b"])] == ["b/c", "b/d"]
+    assert [kc for kc, _ in container.cont_iter_leaves(["b/c"], False)] == [
+        "a",
+        "b/d",
+    ]
+
+    # streaming map
+    mapped = container.cont_map(lambda x, _: x + 1, stream=True)
+    kc, value = next(mapped)
+    assert kc == "a"
+    assert np.allclose(ivy.to_numpy(value), np.array([2]))
+    assert [kc for kc, _ in mapped] == ["b/c", "b/d"]
+    mapped = container.cont_map(
+        lambda x, _: x + 1, key_chains=["b/c"], prune_unapplied=True, stream=True
+    )
+    assert [kc for kc, _ in mapped] == ["b/c"]
+
+    # lazily loaded leaves are read as they are reached, and are not kept loaded
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        return
+    save_filepath = "container_on_disk_streamed.hdf5"
+    container.cont_to_disk_as_hdf5(save_filepath)
+    lazy_container = Container.cont_from_disk_as_hdf5(save_filepath, lazy=True)
+    for kc, value in lazy_container.cont_map(lambda x, _: x * 2, stream=True):
+        assert np.allclose(ivy.to_numpy(value), ivy.to_numpy(container[kc]) * 2)
+    assert not ivy.is_array(dict.__getitem__(lazy_container, "a"))
+    del lazy_container
+    os.remove(save_filepath)
+
+
 @pytest.mark.parametrize("include_empty", [True, False])
 def test_container_key_chains_containing(include_empty, on_device):
     a_val = Container() if include_empty else ivy.array([1], device=on_device)
@@ -1588,6 +1719,51 @@ def test_container_list_stack(on_device):
     assert np.allclose(ivy.to_numpy(container_list_stacked.b.d[1]), np.array([6]))
 
 
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_container_loader(shared_memory, on_device):
+    if "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess
+        pytest.skip()
+
+    def load_batch(idx):
+        return {
+            "a": np.full((2, 3), idx, dtype=np.float32),
+            "b": {"c": np.arange(2) + idx, "d": idx},
+        }
+
+    with ivy.ContainerLoader(
+        load_batch, 5, num_workers=2, prefetch=1, shared_memory=shared_memory
+    ) as loader:
+        assert len(loader) == 5
+        for idx, batch in enumerate(loader):
+            assert isinstance(batch, Container)
+            assert isinstance(batch.a, ivy.Array)
+            assert np.array_equal(ivy.to_numpy(batch.a), np.full((2, 3), idx))
+            assert np.array_equal(ivy.to_numpy(batch.b.c), np.arange(2) + idx)
+            assert batch.b.d == idx
+        assert idx == 4
+
+    # containers over the batches, which evict those consumed
+    def load_arrays(idx):
+        return {"a": np.full((2, 3), idx, dtype=np.float32), "b": np.arange(2) + idx}
+
+    with ivy.ContainerLoader(load_arrays, 4, shared_memory=shared_memory) as loader:
+        container = loader.container(2, queue_cache_size=1)
+        assert np.array_equal(ivy.to_numpy(container[1].a), [0.0, 0.0, 0.0])
+        assert np.array_equal(ivy.to_numpy(container[2:4].b), [1, 2])
+        assert np.array_equal(ivy.to_numpy(container[7].b), 4)
+        with pytest.raises(IvyException):
+            container[0]
+
+    # exceptions raised by the workers are raised by the loader
+    def raise_error(idx):
+        raise ValueError("error loading batch")
+
+    with ivy.ContainerLoader(raise_error, 2, shared_memory=shared_memory) as loader:
+        with pytest.raises(IvyException, match="error loading batch"):
+            next(iter(loader))
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map(inplace, on_device):
     # without key_chains specification
@@ -2474,6 +2650,68 @@ def test_container_set_at_keys(on_device):
     assert np.allclose(ivy.to_numpy(container["b"]["d"]), np.array([3]))
 
 
+def test_container_share_memory(on_device, monkeypatch):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0, 3.0], device=on_device),
+            "b": {
+                "c": ivy.array([[4, 5], [6, 7]], device=on_device),
+                "d": ivy.array(8, device=on_device),
+            },
+            "e": "string",
+        }
+    )
+    # the segment is left to the resource tracker until the receiver unlinks it
+    tracked = set()
+    with monkeypatch.context() as m:
+        m.setattr(
+            multiprocessing.resource_tracker,
+            "register",
+            lambda name, rtype: tracked.add(name),
+        )
+        m.setattr(
+            multiprocessing.resource_tracker,
+            "unregister",
+            lambda name, rtype: tracked.discard(name),
+        )
+        pickled = pickle.dumps(container.cont_share_memory())
+        assert len(tracked) == 1
+        loaded = pickle.loads(pickled)
+        assert not tracked
+    # the receiver owns the segment, so the pickle can only be unpickled once
+    if os.name == "posix":
+        with pytest.raises(IvyException, match="can only be unpickled once"):
+            pickle.loads(pickled)
+    assert isinstance(loaded, Container)
+    assert np.allclose(ivy.to_numpy(loaded.a), [1.0, 2.0, 3.0])
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), [[4, 5], [6, 7]])
+    assert ivy.to_numpy(loaded.b.d).shape == ()
+    assert loaded.e == "string"
+    # the received container is pickled as usual
+    pickled = pickle.dumps(loaded)
+    assert b"_cont_from_shared_memory" not in pickled
+    loaded = pickle.loads(pickled)
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), [[4, 5], [6, 7]])
+
+    # through a process queue
+    if "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess
+        return
+    this_queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(
+        target=lambda: this_queue.put(container.cont_share_memory())
+    )
+    worker.start()
+    loaded = this_queue.get(timeout=30)
+    worker.join()
+    assert np.allclose(ivy.to_numpy(loaded.a), [1.0, 2.0, 3.0])
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), [[4, 5], [6, 7]])
+
+    # without shared memory, the container is pickled as usual
+    loaded = pickle.loads(pickle.dumps(container.cont_share_memory(False)))
+    assert np.allclose(ivy.to_numpy(loaded.a), [1.0, 2.0, 3.0])
+
+
 def test_container_shapes(on_device):
     dict_in = {
         "a": ivy.array([[[1.0], [2.0], [3.0]]], device=on_device),
@@ -2898,6 +3136,61 @@ def test_container_structural_diff(on_device):
     assert container_diff_same_only.cont_to_dict() == container_diff.cont_to_dict()
 
 
+def test_container_structure_hash(on_device):
+    container_0 = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3], device=on_device), "d": {}},
+        }
+    )
+    container_1 = Container(
+        {
+            "a": ivy.array([4.0, 5.0], device=on_device),
+            "b": {"c": ivy.array([6], device=on_device), "d": {}},
+        }
+    )
+    assert container_0.cont_structure_hash() == container_1.cont_structure_hash()
+    assert ivy.Container.cont_identical_structure([container_0, container_1])
+
+    # empty sub-containers, shapes and types are all part of the structure
+    container_1.b.d = ivy.array([7], device=on_device)
+    assert container_0.cont_structure_hash() != container_1.cont_structure_hash()
+    assert not ivy.Container.cont_identical_structure([container_0, container_1])
+    container_1.b.d = Container({})
+    assert ivy.Container.cont_identical_structure([container_0, container_1])
+    container_1.a = ivy.array([4.0, 5.0, 6.0], device=on_device)
+    assert not ivy.Container.cont_identical_structure([container_0, container_1])
+    assert ivy.Container.cont_identical_structure(
+        [container_0, container_1], check_shapes=False
+    )
+    container_1.a = ivy.array([4, 5], device=on_device)
+    assert ivy.Container.cont_identical_structure([container_0, container_1])
+    container_1.a = [4.0, 5.0]
+    assert not ivy.Container.cont_identical_structure(
+        [container_0, container_1], check_shapes=False
+    )
+    assert ivy.Container.cont_identical_structure(
+        [container_0, container_1], check_types=False, check_shapes=False
+    )
+    # an empty sub-container is never identical to a leaf
+    container_1.b.d = ivy.array([7], device=on_device)
+    assert not ivy.Container.cont_identical_structure(
+        [container_0, container_1], check_types=False, check_shapes=False
+    )
+    assert not ivy.Container.cont_identical(
+        [container_0, container_1], check_types=False, check_shapes=False
+    )
+    container_1.b.d = Container({})
+
+    # replacing the data of an array leaf changes its shape without modifying the
+    # container itself
+    container_1.a = ivy.array([4.0, 5.0], device=on_device)
+    assert ivy.Container.cont_identical_structure([container_0, container_1])
+    container_1.a.data = ivy.native_array([4.0, 5.0, 6.0], device=on_device)
+    assert not ivy.Container.cont_identical_structure([container_0, container_1])
+    assert not ivy.Container.cont_identical_array_shapes([container_0, container_1])
+
+
 def test_container_to_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2970,6 +3263,56 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_hdf5_compressed_and_lazy(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_compressed.hdf5"
+    container = Container(
+        {
+            "a": ivy.reshape(ivy.arange(12, device=on_device), (4, 3)),
+            "b": {"c": ivy.array([1.0, 2.0, 3.0, 4.0], device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(
+        save_filepath, chunks=True, compression="gzip", compression_opts=4
+    )
+
+    # eager loading
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, slice(1, 3))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a)[1:3]
+    )
+    assert loaded_container.b.c.dtype == container.b.c.dtype
+
+    # lazy loading
+    lazy_container = Container.cont_from_disk_as_hdf5(save_filepath, lazy=True)
+    assert not ivy.is_array(dict.__getitem__(lazy_container, "a"))
+    assert np.array_equal(ivy.to_numpy(lazy_container.a), ivy.to_numpy(container.a))
+    assert ivy.is_array(dict.__getitem__(lazy_container, "a"))
+    assert np.array_equal(
+        ivy.to_numpy(lazy_container["b/c"]), ivy.to_numpy(container.b.c)
+    )
+    del lazy_container
+
+    # lazy leaves are loaded when iterated over
+    with Container.cont_from_disk_as_hdf5(save_filepath, lazy=True) as lazy_container:
+        assert all(ivy.is_array(v) for _, v in lazy_container.b.items())
+        assert ivy.is_array(list(lazy_container.values())[0])
+    with Container.cont_from_disk_as_hdf5(save_filepath, lazy=True) as lazy_container:
+        assert all(ivy.is_array(v) for _, v in lazy_container.cont_to_iterator())
+    with Container.cont_from_disk_as_hdf5(save_filepath, lazy=True) as lazy_container:
+        assert ivy.is_array(lazy_container.cont_to_dict()["b"]["c"])
+
+    # closing the container closes the file of the leaves which are not loaded
+    with Container.cont_from_disk_as_hdf5(save_filepath, lazy=True) as lazy_container:
+        h5_file = dict.__getitem__(lazy_container, "a")._dataset.file
+        assert h5_file.id.valid
+    assert not h5_file.id.valid
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2991,6 +3334,55 @@ def test_container_to_and_from_disk_as_json(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_mmap(on_device):
+    save_filepath = "container_on_disk.mmap"
+    dict_in = {
+        "a": ivy.array(np.arange(12, dtype=np.float32).reshape(3, 4), device=on_device),
+        "b": {
+            "c": ivy.array([True, False], device=on_device),
+            "d": ivy.array(2, device=on_device),
+            "e": 1.5,
+        },
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_to_disk_as_mmap(save_filepath, metadata=b"meta")
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container, metadata = Container.cont_from_disk_as_mmap(
+        save_filepath, return_metadata=True
+    )
+    assert metadata == b"meta"
+    assert loaded_container.cont_all_key_chains() == container.cont_all_key_chains()
+    for kc in ["a", "b/c", "b/d"]:
+        loaded = ivy.to_numpy(loaded_container[kc])
+        original = ivy.to_numpy(container[kc])
+        assert loaded.dtype == original.dtype
+        assert np.array_equal(loaded, original)
+    assert loaded_container.b.e == 1.5
+
+    # the file on disk isn't modified through the loaded arrays
+    loaded_container.a[0, 0] = 5.0
+    reloaded_container = Container.cont_load(save_filepath, format="mmap")
+    assert np.array_equal(ivy.to_numpy(reloaded_container.a), ivy.to_numpy(container.a))
+
+    # empty sub-containers and keys containing "/" are kept
+    container = Container({"a": {}, "b": {}})
+    dict.__setitem__(container.b, "c/d", ivy.array([1], device=on_device))
+    container.cont_to_disk_as_mmap(save_filepath)
+    loaded_container = Container.cont_from_disk_as_mmap(save_filepath)
+    assert list(loaded_container.keys()) == ["a", "b"]
+    assert isinstance(loaded_container.a, Container) and not loaded_container.a
+    assert list(loaded_container.b.keys()) == ["c/d"]
+    assert np.array_equal(
+        ivy.to_numpy(dict.__getitem__(loaded_container.b, "c/d")), [1]
+    )
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_pickled(on_device):
     save_filepath = "container_on_disk.pickled"
     dict_in = {
@@ -3080,6 +3472,67 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize(
+    ("index_only", "max_block_bytes"), [(False, 2**28), (False, 40), (True, 2**28)]
+)
+def test_container_to_disk_shuffle_blockwise_and_from_disk_as_hdf5(
+    index_only, max_block_bytes, on_device
+):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    num_rows = 50
+    dict_in = {
+        "a": ivy.array(np.arange(num_rows), device=on_device),
+        "b": {
+            "c": ivy.array(
+                np.arange(num_rows * 2, dtype=np.float32).reshape(num_rows, 2),
+                device=on_device,
+            ),
+        },
+    }
+    container = Container(dict_in)
+    container.cont_to_disk_as_hdf5(save_filepath, max_batch_size=num_rows)
+
+    # shuffling
+    Container.shuffle_h5_file(
+        save_filepath, 1, index_only=index_only, max_block_bytes=max_block_bytes
+    )
+
+    # loading
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+    container_sliced = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(10, 20), lazy=True
+    )
+    container_tuple_sliced = Container.cont_from_disk_as_hdf5(
+        save_filepath, (slice(10, 20), ...), lazy=True
+    )
+    container_last = Container.cont_from_disk_as_hdf5(
+        save_filepath, (..., -1), lazy=True
+    )
+
+    # testing
+    data = list(range(num_rows))
+    random.seed(1)
+    random.shuffle(data)
+    data = np.array(data)
+
+    assert list(container_shuffled.cont_all_key_chains()) == ["a", "b/c"]
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), data)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c)[:, 1], data * 2 + 1)
+    assert np.array_equal(ivy.to_numpy(container_sliced.a), data[10:20])
+    assert np.array_equal(ivy.to_numpy(container_tuple_sliced.a), data[10:20])
+    assert np.array_equal(
+        ivy.to_numpy(container_tuple_sliced.b.c)[:, 1], data[10:20] * 2 + 1
+    )
+    assert np.array_equal(ivy.to_numpy(container_last.a), data[-1])
+    assert np.array_equal(ivy.to_numpy(container_last.b.c), data * 2 + 1)
+    assert Container.h5_file_size(save_filepath) == (num_rows * 16, num_rows)
+
+    os.remove(save_filepath)
+
+
 def test_container_to_flat_list(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
@@ -3256,6 +3709,25 @@ def test_container_unify(on_device):
         assert np.allclose(ivy.to_numpy(container_unified.b.d[1]), np.array([6]))
 
 
+@pytest.mark.parametrize("mode", ["sum", "mean"])
+def test_container_unify_reduce(mode, on_device):
+    conts = {
+        str(i): Container(
+            {
+                "a": ivy.array([float(i)], device=on_device),
+                "b": {"c": ivy.array([[i, 2 * i]], device=on_device)},
+            }
+        )
+        for i in range(5)
+    }
+    container_unified = ivy.Container.cont_unify(conts, on_device, mode)
+    scale = 1 if mode == "sum" else 5
+    assert np.allclose(ivy.to_numpy(container_unified.a), np.array([10.0]) / scale)
+    assert np.allclose(
+        ivy.to_numpy(container_unified.b.c), np.array([[10, 20]]) / scale
+    )
+
+
 def test_container_unstack_conts(on_device):
     dict_in = {
         "a": ivy.array([[1], [2], [3]], device=on_device),
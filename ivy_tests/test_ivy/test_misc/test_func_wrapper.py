@@ -4,6 +4,7 @@ import ivy
 import pytest
 from unittest.mock import patch
 from ivy.func_wrapper import handle_array_like_without_promotion
+from types import FunctionType
 from typing import Union, Tuple, List, Sequence
 
 
@@ -55,6 +56,64 @@ def _jl(x, *args, fn_original, **kwargs):
 # ------------ #
 
 
+def test_fused_wrapper_mode(backend_fw):
+    ivy.set_fused_wrapper_mode(True)
+    ivy.set_backend(backend_fw)
+    assert getattr(ivy.astype, "fused_wrapper", False)
+    assert hasattr(ivy.astype, "handle_nestable")
+    x = ivy.array([1, 2, 3])
+    # fast path
+    ret = ivy.astype(x, "float32")
+    assert isinstance(ret, ivy.Array)
+    assert ret.dtype == "float32"
+    # slow paths
+    assert isinstance(ivy.astype([1, 2, 3], "float32"), ivy.Array)
+    assert isinstance(ivy.astype(ivy.Container(a=x), "float32"), ivy.Container)
+    out = ivy.zeros(3)
+    ivy.add(x, x, out=out)
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0, 6.0])
+    ivy.previous_backend()
+    ivy.unset_fused_wrapper_mode()
+    ivy.set_backend(backend_fw)
+    assert not getattr(ivy.astype, "fused_wrapper", False)
+    ivy.previous_backend()
+
+
+def test_fused_wrapper_mode_matches_unfused(backend_fw):
+    def _calls():
+        x = ivy.array([1.0, 2.0, 3.0])
+        rets = [
+            ivy.is_native_array(x),
+            ivy.is_ivy_array(x),
+            ivy.asarray(x),
+            ivy.array(x),
+            ivy.add(x, x),
+            ivy.astype(x, "int32"),
+            ivy.sum(x),
+            ivy.as_native_dev(ivy.dev(x)),
+        ]
+        return [
+            (type(ret), np.asarray(ivy.to_numpy(ret) if ivy.is_array(ret) else ret))
+            for ret in rets
+        ]
+
+    ivy.set_backend(backend_fw)
+    unfused = _calls()
+    ivy.previous_backend()
+    ivy.set_fused_wrapper_mode(True)
+    ivy.set_backend(backend_fw)
+    fused = _calls()
+    # only functions which take native arrays are fused
+    for fn in vars(ivy).values():
+        if isinstance(fn, FunctionType) and "fused_wrapper" in vars(fn):
+            assert "inputs_to_native_arrays" in vars(fn)
+    ivy.previous_backend()
+    ivy.unset_fused_wrapper_mode()
+    for (fused_type, fused_ret), (unfused_type, unfused_ret) in zip(fused, unfused):
+        assert fused_type is unfused_type
+        assert np.array_equal(fused_ret, unfused_ret)
+
+
 @pytest.mark.parametrize(
     ("fn", "x", "expected_type"),
     [
@@ -67,7 +126,11 @@ def _jl(x, *args, fn_original, **kwargs):
 )
 def test_handle_array_like_without_promotion(fn, x, expected_type, backend_fw):
     ivy.set_backend(backend_fw)
-    assert isinstance(handle_array_like_without_promotion(fn)(x), expected_type)
+    wrapped_fn = handle_array_like_without_promotion(fn)
+    assert isinstance(wrapped_fn(x), expected_type)
+    assert isinstance(wrapped_fn(x=x), expected_type)
+    if expected_type is ivy.Array:
+        assert wrapped_fn.array_like_params == ((0, "x"),)
     ivy.previous_backend()
 
 
@@ -124,6 +187,49 @@ def test_handle_complex_input(x, mode, jax_like, expected, backend_fw):
     ivy.previous_backend()
 
 
+@pytest.mark.parametrize("interval", [1, 3])
+def test_handle_nans(interval, backend_fw):
+    ivy.set_backend(backend_fw)
+    test_fn = ivy.handle_nans(_fn1)
+    x = ivy.array([1.0, float("nan")])
+    ivy.set_nan_policy("raise_exception")
+    ivy.set_nan_check_interval(interval)
+    raised = []
+    for _ in range(2 * interval):
+        try:
+            test_fn(x)
+            raised.append(False)
+        except ivy.utils.exceptions.IvyException:
+            raised.append(True)
+    assert raised == [i % interval == 0 for i in range(2 * interval)]
+    ivy.unset_nan_check_interval()
+    assert ivy.nan_check_interval == 1
+    # arrays which can't hold nans and non-array leaves are never checked
+    test_fn([ivy.array([1, 2]), ivy.array([True]), "float32", 2])
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        test_fn(ivy.Container(a=1.0, b=float("nan")))
+    ivy.unset_nan_policy()
+    ivy.previous_backend()
+
+
+def test_handle_nestable(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0, 2.0])
+    cont = ivy.Container(a=x)
+    assert isinstance(ivy.abs(cont), ivy.Container)
+    # containers nested in lists and tuples are found too
+    ret = ivy.concat([cont, cont])
+    assert isinstance(ret, ivy.Container)
+    assert ret.a.shape == (4,)
+    assert isinstance(ivy.stack((x, cont)), ivy.Container)
+    assert isinstance(ivy.concat([x, x]), ivy.Array)
+    with ivy.NestableMode(False):
+        assert not ivy.nestable_mode
+        assert ivy.to_numpy(ivy.abs(x)).tolist() == [1.0, 2.0]
+    assert ivy.nestable_mode
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     ("x", "weight", "expected"),
     [
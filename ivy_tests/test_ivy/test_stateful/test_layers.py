@@ -2,6 +2,7 @@
 
 # global
 import numpy as np
+import pytest
 from hypothesis import assume
 from hypothesis import strategies as st
 
@@ -1552,6 +1553,50 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+def test_multi_head_attention_layer_decode(on_device, backend_fw):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        layer = ivy.MultiHeadAttention(8, num_heads=2, device=on_device)
+        rng = np.random.default_rng(0)
+        x = ivy.array(rng.standard_normal((2, 7, 8)), dtype="float32", device=on_device)
+
+        def reference(mask):
+            mask = ivy.array(mask, device=on_device)
+            return ivy.concat(
+                [layer(x[i : i + 1], attention_mask=mask) for i in range(2)], axis=0
+            )
+
+        def decode(cache, prompt_len, slots=None):
+            outs = [layer.decode(x[:, :prompt_len], cache, slots=slots)]
+            for t in range(prompt_len, 7):
+                outs.append(layer.decode(x[:, t : t + 1], cache, slots=slots))
+            return ivy.to_numpy(ivy.concat(outs, axis=1))
+
+        causal = np.triu(np.ones((7, 7), dtype=bool), k=1)
+        expected = ivy.to_numpy(reference(causal))
+        cache = layer.init_cache(2, 16)
+        assert np.allclose(decode(cache, 3), expected, atol=1e-5)
+
+        # slots are reused by new sequences after a reset
+        cache = layer.init_cache(4, 16)
+        layer.decode(ivy.ones((4, 5, 8), device=on_device), cache)
+        cache.reset([3, 1])
+        assert np.allclose(decode(cache, 1, slots=[3, 1]), expected, atol=1e-5)
+        assert ivy.to_numpy(cache.lengths).tolist() == [5, 7, 5, 7]
+
+        # once the ring buffer wraps, tokens attend to the last max_length ones
+        window = causal | np.tril(np.ones((7, 7), dtype=bool), k=-4)
+        expected = ivy.to_numpy(reference(window))
+        cache = layer.init_cache(2, 4)
+        assert np.allclose(decode(cache, 1), expected, atol=1e-5)
+
+        # chunks of several tokens are rejected rather than wrapping around
+        cache = layer.init_cache(2, 4)
+        layer.decode(x[:, :2], cache)
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            layer.decode(x[:, 2:6], cache)
+        assert ivy.to_numpy(cache.lengths).tolist() == [2, 2]
+
+
 # # Sequential #
 @handle_method(
     method_tree="Sequential.__call__",
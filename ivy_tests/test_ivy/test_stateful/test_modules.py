@@ -388,6 +388,40 @@ def test_module_save_and_load_as_pickled(
         os.remove(save_filepath)
 
 
+@given(
+    batch_shape=st.tuples(
+        st.integers(min_value=1, max_value=2), st.integers(min_value=1, max_value=2)
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_save_and_load_as_mmap(
+    batch_shape, input_channels, output_channels, on_device, backend_fw
+):
+    save_filepath = "module.mmap"
+
+    with ivy.utils.backend.ContextManager(backend_fw):
+        x = ivy.astype(
+            ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+            "float32",
+        )
+        module = TrainableModule(input_channels, output_channels, device=on_device)
+
+        module.save(save_filepath, format="mmap")
+        assert os.path.exists(save_filepath)
+        loaded_module = ivy.Module.load(save_filepath, format="mmap")
+
+        # type test
+        assert type(loaded_module) is TrainableModule
+        # value test
+        assert ivy.Container.all(loaded_module.v == module.v).cont_all_true()
+        assert ivy.all_equal(loaded_module(x), module(x))
+        # the variables of the submodules are shared with the loaded module
+        assert loaded_module._linear0.v.w is loaded_module.v.linear0.w
+
+        os.remove(save_filepath)
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device, backend_fw):
     with ivy.utils.backend.ContextManager(backend_fw):
@@ -2,8 +2,11 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -318,3 +321,77 @@ def test_sgd_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# multi-tensor mode
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("AdamW", {"weight_decay": 0.1}),
+        ("LAMB", {"decay_lambda": 0.1}),
+    ],
+)
+def test_multi_tensor_optimizer(optimizer, kwargs, on_device, backend_fw):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        rng = np.random.default_rng(0)
+
+        def random_array(shape, dtype):
+            return ivy.array(rng.random(shape), dtype=dtype, device=on_device)
+
+        def random_container():
+            return ivy.Container({
+                "a": random_array((3, 2), "float32"),
+                "b": {
+                    "c": random_array(4, "float32"),
+                    "d": random_array((), "float64"),
+                },
+            })
+
+        v = random_container()
+        grads = [random_container() for _ in range(3)]
+        optimizers = [
+            getattr(ivy, optimizer)(lr=0.01, multi_tensor=multi_tensor, **kwargs)
+            for multi_tensor in [False, True]
+        ]
+        rets = []
+        for opt in optimizers:
+            ret = v
+            for g in grads:
+                ret = opt.step(ret, g)
+            rets.append(ret)
+        assert ivy.Container.cont_identical_structure(rets)
+        for x, y in zip(rets[0].cont_to_flat_list(), rets[1].cont_to_flat_list()):
+            assert x.dtype == y.dtype
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-4)
+        states = [opt.state.cont_to_flat_list() for opt in optimizers]
+        for x, y in zip(*states):
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-4)
+
+
+def test_multi_tensor_optimizer_keeps_variables_packed(on_device, backend_fw):
+    with ivy.utils.backend.ContextManager(backend_fw):
+        v = ivy.Container({
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([[3.0], [4.0]], device=on_device)},
+        })
+        grads = v * 0.5
+        opt = ivy.SGD(lr=0.1, multi_tensor=True)
+        ret = opt.step(v, grads)
+        packer = opt._packer
+        packed = opt._packed_v
+        # the returned variables are packed as the buffers of the last step
+        new_packer, new_packed = opt._get_packer(ret)
+        assert new_packer is packer
+        assert new_packed is packed
+        # replacing a variable repacks the variables with the same packer
+        ret.a = ivy.array([5.0, 6.0], device=on_device)
+        new_packer, new_packed = opt._get_packer(ret)
+        assert new_packer is packer
+        assert new_packed is not packed
+        assert np.allclose(ivy.to_numpy(new_packed.group_0[:2]), [5.0, 6.0])
+        # changing the structure of the variables rebuilds the packer
+        ret.b.d = ivy.array([7.0], device=on_device)
+        assert opt._get_packer(ret)[0] is not packer